@@ -8,7 +8,9 @@ This module tracks portfolio cash, position holdings, and total equity over time
 assuming trades are executed at the daily closing price.
 """
 
+import numpy as np
 import pandas as pd
+from app.kernels import get_kernel
 
 class Backtester:
     """
@@ -24,9 +26,24 @@ class Backtester:
     data : pd.DataFrame
         Historical market data containing at least a 'Close' column.
     strategy : object
-        Strategy instance that implements should_buy(row) and should_sell(row) methods.
+        Strategy instance that implements should_buy(row) and should_sell(row) methods, and
+        optionally generate_signals() returning whole-series (buy, sell) boolean arrays and a
+        'lookback' attribute with the number of leading rows on which it cannot signal.
     initial_cash : float
         Starting cash amount for the portfolio (default is 100,000).
+    engine : str
+        Simulation engine to use ('loop' or 'vectorized', default is 'loop').
+    dtype : str
+        Floating-point type of the recorded equity and cash ('float64' or 'float32',
+        default is 'float64'). 'float32' halves memory for large sweeps at reduced precision.
+    start : int
+        Row position at which trading starts (default is 0). Earlier rows only provide
+        indicator history and are left out of the equity curve.
+    profiler : Profiler, optional
+        When given, the strategy's hooks are wrapped to count and time every call.
+    kernel : str
+        Cash/position recurrence used by the vectorized engine ('auto', 'numba' or 'python',
+        default is 'auto', which uses the Numba-compiled kernel when Numba is installed).
 
     Attributes
     ----------
@@ -36,26 +53,66 @@ class Backtester:
         The trading strategy instance applied during the backtest.
     initial_cash : float
         The starting portfolio cash amount.
+    engine : str
+        The simulation engine used by run_backtest().
+    dtype : np.dtype
+        Floating-point type of the recorded equity and cash.
+    start : int
+        Row position of the first simulated day.
+    lookback : int
+        Number of leading rows on which the strategy cannot signal (0 when it declares none).
+    kernel : callable
+        Simulation kernel used by the vectorized engine.
     cash : float
         Current available cash during the backtest.
     position : int
         Number of shares currently held.
-    equity_curve : list
-        List of (date, total equity) tracking portfolio value over time.
+    equity_curve : np.ndarray
+        Total equity per simulated day, preallocated to the number of simulated days.
+    cash_curve : np.ndarray
+        Available cash per simulated day, preallocated to the number of simulated days.
+    position_curve : np.ndarray
+        Shares held per simulated day, preallocated to the number of simulated days.
+    trades_executed : int
+        Number of buy and sell orders filled during the backtest.
     """
 
-    def __init__(self, data: pd.DataFrame, strategy: object, initial_cash: float = 100000.0):
+    ENGINES = ("loop", "vectorized")
+    DTYPES = ("float64", "float32")
+
+    def __init__(self, data: pd.DataFrame, strategy: object, initial_cash: float = 100000.0, engine: str = "loop", dtype: str = "float64", start: int = 0, profiler=None, kernel: str = "auto"):
         """
         Initializes the Backtester instance with market data, a trading strategy, and starting capital.
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine: {engine}. Expected one of {self.ENGINES}.")
+        if str(dtype) not in self.DTYPES:
+            raise ValueError(f"Unsupported dtype: {dtype}. Expected one of {self.DTYPES}.")
+        if not 0 <= start <= len(data):
+            raise ValueError(f"start must be between 0 and {len(data)}, got {start}.")
+
         self.data = data
         self.strategy = strategy
         self.initial_cash = initial_cash
+        self.engine = engine
+        self.dtype = np.dtype(dtype)
+        self.start = start
+        self.lookback = getattr(strategy, "lookback", 0)
+        self.kernel = get_kernel(kernel)
         self.cash = initial_cash
         self.position = 0
-        self.equity_curve = []
+
+        # Preallocate per-day history so the simulation writes in place instead of appending
+        n_rows = len(data) - start
+        self.equity_curve = np.empty(n_rows, dtype=self.dtype)
+        self.cash_curve = np.empty(n_rows, dtype=self.dtype)
+        self.position_curve = np.empty(n_rows, dtype=np.int32 if self.dtype == np.float32 else np.int64)
         self.trades_executed = 0
 
+        # Count and time strategy hook calls only when profiling
+        if profiler is not None:
+            profiler.instrument(strategy)
+
         # Validate data sufficiency for the selected strategy
         self._validate_data_for_strategy()
 
@@ -63,7 +120,18 @@ class Backtester:
         """
         Validates that there is enough historical data to support the selected strategy.
         Raises an error if not enough data is available.
+
+        Strategies declaring a lookback are checked against it; the checks below it cover
+        strategies that do not.
         """
+        if hasattr(self.strategy, "lookback"):
+            if len(self.data) < self.strategy.lookback:
+                raise ValueError(
+                    f"Not enough data ({len(self.data)} rows) for {type(self.strategy).__name__}. "
+                    f"Requires at least {self.strategy.lookback} days of data."
+                )
+            return
+
         # SMA Crossover Strategy check
         if hasattr(self.strategy, "long_window"):
             if len(self.data) < self.strategy.long_window:
@@ -105,7 +173,20 @@ class Backtester:
 
     def run_backtest(self) -> pd.DataFrame:
         """
-        Runs the trading simulation over the historical data.
+        Runs the trading simulation over the historical data using the selected engine.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame containing 'Date' and 'Portfolio Value', indexed by date.
+        """
+        if self.engine == "vectorized":
+            return self._run_vectorized()
+        return self._run_loop()
+
+    def _run_loop(self) -> pd.DataFrame:
+        """
+        Runs the reference row-by-row simulation.
 
         For each day:
         - Evaluates the strategy's buy/sell logic.
@@ -118,8 +199,11 @@ class Backtester:
             DataFrame containing 'Date' and 'Portfolio Value', indexed by date.
         """
 
+        # Warm-up rows cannot signal, so only rows from the first usable one are evaluated
+        skipped = self._record_warmup()
+
         # Loop through each day in the dataset
-        for row_idx, (date, row) in enumerate(self.data.iterrows()):
+        for row_idx, (_, row) in enumerate(self.data.iloc[self.start + skipped:].iterrows(), start=skipped):
 
             price = row['Close']
 
@@ -135,11 +219,117 @@ class Backtester:
                 self.cash += price
                 self.trades_executed += 1
 
-            # Calculate current total equity: cash + (number of shares * current close price)
-            total_equity = self.cash + self.position * price
+            # Record cash, position and total equity: cash + (number of shares * current close price)
+            self.cash_curve[row_idx] = self.cash
+            self.position_curve[row_idx] = self.position
+            self.equity_curve[row_idx] = self.cash + self.position * price
+
+        return self._equity_frame()
+
+    def _record_warmup(self) -> int:
+        """
+        Records the simulated rows that fall inside the strategy's lookback without evaluating them.
+
+        No signal can fire on those rows, so cash and position stay at their starting values.
+
+        Returns
+        -------
+        int
+            Number of simulated rows recorded, i.e. the position of the first row to evaluate.
+        """
+        skipped = min(max(self.lookback - self.start, 0), len(self.equity_curve))
+        if skipped:
+            prices = self.data['Close'].to_numpy(dtype=np.float64)[self.start:self.start + skipped]
+            self.cash_curve[:skipped] = self.cash
+            self.position_curve[:skipped] = self.position
+            self.equity_curve[:skipped] = self.cash + self.position * prices
+        return skipped
+
+    def _equity_frame(self) -> pd.DataFrame:
+        """
+        Wraps the recorded equity array into the output DataFrame without copying it.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame containing 'Date' and 'Portfolio Value', indexed by date.
+        """
+        return pd.DataFrame({'Portfolio Value': self.equity_curve}, index=pd.Index(self.data.index[self.start:], name='Date'), copy=False)
+
+    def _collect_signals(self, first: int = 0) -> tuple:
+        """
+        Evaluates the strategy's buy/sell logic for every row from a given row up front.
+
+        Uses the strategy's generate_signals() when available, otherwise falls back to
+        calling the row-level should_buy/should_sell hooks.
+
+        Parameters
+        ----------
+        first : int
+            Row position of the first row to evaluate (default is 0).
+
+        Returns
+        -------
+        tuple
+            Tuple of (buy, sell) boolean NumPy arrays aligned with the data rows from first.
+        """
+        # Prefer the array-level signal API
+        if hasattr(self.strategy, "generate_signals"):
+            buy, sell = self.strategy.generate_signals()
+            return np.asarray(buy, dtype=bool)[first:], np.asarray(sell, dtype=bool)[first:]
+
+        # Fall back to the row-level hooks for strategies that only define those
+        n_rows = len(self.data) - first
+        buy = np.zeros(n_rows, dtype=bool)
+        sell = np.zeros(n_rows, dtype=bool)
+
+        for row_idx, (_, row) in enumerate(self.data.iloc[first:].iterrows()):
+            buy[row_idx] = bool(self.strategy.should_buy(row))
+            sell[row_idx] = bool(self.strategy.should_sell(row))
+
+        return buy, sell
+
+    def _run_vectorized(self) -> pd.DataFrame:
+        """
+        Runs the simulation on NumPy arrays instead of per-row pandas objects.
+
+        Positions and cash follow the same rules as the loop engine: one share per signal,
+        buys only when cash covers the price, sells only when a position is held, and a
+        buy takes priority over a sell on the same day.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame containing 'Date' and 'Portfolio Value', indexed by date.
+        """
+        # Warm-up rows cannot signal, so the kernel starts at the first usable row
+        skipped = self._record_warmup()
+        first = self.start + skipped
+
+        # Prices stay in double precision so trades match the loop engine in either dtype
+        prices = self.data['Close'].to_numpy(dtype=np.float64)[first:]
+        buy, sell = self._collect_signals(first)
+
+        # float64 results go straight into the preallocated arrays; float32 ones are computed
+        # in double precision and rounded once when stored
+        if self.dtype == np.float64:
+            cash, equity = self.cash_curve[skipped:], self.equity_curve[skipped:]
+        else:
+            cash, equity = np.empty(len(prices), dtype=np.float64), np.empty(len(prices), dtype=np.float64)
+
+        # Cash and position depend on earlier fills, so this recurrence runs sequentially in
+        # the simulation kernel (compiled when Numba is available), in double precision
+        self.cash, self.position, trades = self.kernel(
+            prices, buy, sell, self.cash, self.position, cash, self.position_curve[skipped:]
+        )
+        self.trades_executed += trades
+
+        # Total equity for every day in one array operation
+        np.multiply(self.position_curve[skipped:], prices, out=equity)
+        np.add(equity, cash, out=equity)
 
-            # Record the date and total equity
-            self.equity_curve.append((date, total_equity))
+        if self.dtype != np.float64:
+            self.cash_curve[skipped:] = cash
+            self.equity_curve[skipped:] = equity
 
-        # Convert equity history into a DataFrame for output
-        return pd.DataFrame(self.equity_curve, columns=['Date', 'Portfolio Value']).set_index('Date')
\ No newline at end of file
+        return self._equity_frame()
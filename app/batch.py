@@ -0,0 +1,170 @@
+"""
+batch.py
+
+Module responsible for running one strategy over a universe of symbols (CSV files or
+tickers) on a pool of worker processes.
+
+Each symbol's metrics are yielded, and optionally written to an output stream, as soon as
+that symbol finishes. Symbols whose data cannot be loaded or backtested are reported with
+their error and skipped without aborting the rest of the batch.
+
+Example
+-------
+python -m app.batch "data/*.csv" --strategy sma_crossover --param short_window=20 --param long_window=50
+"""
+
+import argparse
+import csv
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from app.controller import Controller
+
+# Columns written for every symbol, in output order
+BATCH_FIELDS = ["Symbol", "Total Return", "Volatility", "Sharpe Ratio", "Max Drawdown", "Trades", "Error"]
+
+
+def resolve_symbols(symbols) -> list:
+    """
+    Expands a glob pattern into a sorted list of files, or returns a list of symbols unchanged.
+
+    Parameters
+    ----------
+    symbols : str or list
+        Glob pattern (ex. 'data/*.csv') or list of tickers / file paths.
+
+    Returns
+    -------
+    list
+        List of symbol identifiers.
+    """
+    if isinstance(symbols, str):
+        return sorted(glob.glob(symbols))
+    return list(symbols)
+
+
+def run_batch(strategy_name: str, symbols, source: str = "csv", strategy_params: dict = None, initial_cash: float = 100000.0, workers: int = None, output=None):
+    """
+    Runs a backtest per symbol and yields each symbol's result as soon as it completes.
+
+    Parameters
+    ----------
+    strategy_name : str
+        The name of the strategy to use ('sma_crossover', 'rsi_threshold', etc.).
+    symbols : str or list
+        Glob pattern or list of tickers / CSV file paths.
+    source : str
+        Data source to use ('yahoo', 'csv' or 'binary', default is 'csv').
+    strategy_params : dict
+        Dictionary containing parameters for the selected strategy.
+    initial_cash : float
+        Initial portfolio cash for every backtest (default is 100,000).
+    workers : int
+        Number of worker processes (default is the CPU count, 1 runs in-process).
+    output : file-like, optional
+        Text stream that receives one CSV row per symbol as soon as it finishes.
+
+    Yields
+    ------
+    dict
+        Symbol name, performance metrics, trade count and 'Error' (None on success).
+    """
+    tasks = [(source, identifier, strategy_name, strategy_params or {}, initial_cash) for identifier in resolve_symbols(symbols)]
+    workers = workers or os.cpu_count() or 1
+
+    writer = None
+    if output is not None:
+        writer = csv.DictWriter(output, fieldnames=BATCH_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+
+    for result in _iter_results(tasks, workers):
+        if writer is not None:
+            writer.writerow(result)
+            output.flush()
+        yield result
+
+
+def _iter_results(tasks: list, workers: int):
+    """
+    Runs the symbol tasks in-process or on a process pool, yielding results in completion order.
+    """
+    if workers == 1:
+        for task in tasks:
+            yield _run_symbol(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_run_symbol, task) for task in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _run_symbol(task: tuple) -> dict:
+    """
+    Runs the backtest for one symbol, capturing any error instead of raising it.
+    """
+    source, identifier, strategy_name, strategy_params, initial_cash = task
+
+    # Report files by their file name, tickers by themselves
+    symbol = identifier if source == "yahoo" else os.path.splitext(os.path.basename(identifier))[0]
+
+    try:
+        controller = Controller(source=source)
+        _, metrics, trades = controller.run_backtest(
+            ticker=identifier if source == "yahoo" else None,
+            source_path=None if source == "yahoo" else identifier,
+            strategy_name=strategy_name,
+            strategy_params=strategy_params,
+            initial_cash=initial_cash,
+            engine="vectorized",
+        )
+    except Exception as e:
+        return {"Symbol": symbol, "Error": f"{type(e).__name__}: {e}"}
+
+    return {"Symbol": symbol, **metrics, "Trades": trades, "Error": None}
+
+
+def _parse_param(text: str) -> tuple:
+    """
+    Parses a 'name=value' command-line parameter, converting numeric values.
+    """
+    name, _, value = text.partition("=")
+    for cast in (int, float):
+        try:
+            return name, cast(value)
+        except ValueError:
+            pass
+    return name, value
+
+
+def main(argv: list = None):
+    """
+    Command-line entry point that streams batch results as CSV to standard output.
+    """
+    parser = argparse.ArgumentParser(description="Run one strategy over many symbols in parallel.")
+    parser.add_argument("symbols", nargs="+", help="Glob pattern(s) of CSV files, or tickers with --source yahoo.")
+    parser.add_argument("--strategy", required=True, help="Strategy name (ex. sma_crossover).")
+    parser.add_argument("--source", default="csv", choices=["csv", "binary", "yahoo"], help="Data source (default: csv).")
+    parser.add_argument("--param", action="append", default=[], help="Strategy parameter as name=value (repeatable).")
+    parser.add_argument("--initial-cash", type=float, default=100000.0, help="Initial cash per symbol.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    args = parser.parse_args(argv)
+
+    if args.source != "yahoo":
+        symbols = [path for pattern in args.symbols for path in resolve_symbols(pattern)]
+    else:
+        symbols = args.symbols
+
+    failures = 0
+    for result in run_batch(args.strategy, symbols, args.source, dict(map(_parse_param, args.param)), args.initial_cash, args.workers, output=sys.stdout):
+        if result["Error"] is not None:
+            failures += 1
+            print(f"Skipped {result['Symbol']}: {result['Error']}", file=sys.stderr)
+
+    print(f"Completed {len(symbols) - failures} of {len(symbols)} symbols.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
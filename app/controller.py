@@ -5,16 +5,24 @@ Module responsible for orchestrating the data retrieval, strategy initialization
 backtest execution, and result handling for the backtesting engine.
 """
 
+import contextlib
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 from app.data_handler import DataHandler
+from app.yahoo_cache import YahooCache
 from app.backtester import Backtester
 from app.results import Results
-from app.strategies import (
-    SMACrossoverStrategy,
-    RSIThresholdStrategy,
-    GoldenCrossStrategy,
-    MomentumStrategy
-)
+from app.results_store import METRIC_COLUMNS, ResultsStore
+from app.portfolio import PortfolioBacktester
+from app.profiling import Profiler, profile_phase
+from app.optimizer import halving_schedule, rank_scores, sample_candidates
+from app.shared_data import SharedPrices, SharedPricesHandle, attach_prices
+from app.walk_forward import split_windows, stitch_equity
+from app.strategies import get_strategy_class
 
 class Controller:
     """
@@ -23,7 +31,13 @@ class Controller:
     Parameters
     ----------
     source : str
-        Data source to use ('yahoo' or 'csv').
+        Data source to use ('yahoo', 'csv' or 'binary').
+    yahoo_cache : YahooCache, optional
+        On-disk cache for Yahoo downloads.
+    chunksize : int, optional
+        Rows per chunk when reading CSV files.
+    resample : str, optional
+        Bar size to resample CSV data to while reading (ex. '5min', '1h', '1D').
 
     Attributes
     ----------
@@ -31,19 +45,25 @@ class Controller:
         Instance responsible for fetching market data.
     """
 
-    def __init__(self, source: str = "yahoo"):
+    def __init__(self, source: str = "yahoo", yahoo_cache: YahooCache = None, chunksize: int = None, resample: str = None):
         """
         Initializes the Controller instance and sets up the DataHandler.
 
         Parameters
         ----------
         source : str, optional
-            Data source to use ('yahoo' or 'csv'), default is 'yahoo'.
+            Data source to use ('yahoo', 'csv' or 'binary'), default is 'yahoo'.
+        yahoo_cache : YahooCache, optional
+            On-disk cache for Yahoo downloads (default is to download every time).
+        chunksize : int, optional
+            Rows per chunk when reading CSV files (default is to read whole files).
+        resample : str, optional
+            Bar size to resample CSV data to while reading (default is no resampling).
         """
         self.source = source  # Save the source type
-        self.data_handler = DataHandler(source=source)
+        self.data_handler = DataHandler(source=source, yahoo_cache=yahoo_cache, chunksize=chunksize, resample=resample)
 
-    def run_backtest(self, ticker: str = None, source_path: str = None, strategy_name: str = None, strategy_params: dict = None, initial_cash: float = 100000.0) -> tuple:
+    def run_backtest(self, ticker: str = None, source_path: str = None, strategy_name: str = None, strategy_params: dict = None, initial_cash: float = 100000.0, engine: str = "loop", dtype: str = "float64", profile: bool = False, start_date=None, end_date=None) -> tuple:
         """
         Runs the full backtesting workflow based on user input.
 
@@ -59,40 +79,417 @@ class Controller:
             Dictionary containing parameters for the selected strategy.
         initial_cash : float
             Initial portfolio cash for the backtest (default is 100,000).
+        engine : str
+            Backtester simulation engine ('loop' or 'vectorized', default is 'loop').
+        dtype : str
+            Floating-point type of the recorded equity ('float64' or 'float32', default is 'float64').
+        profile : bool
+            If True, record per-phase timings, allocations and strategy hook calls (default is False).
+        start_date : str or pd.Timestamp, optional
+            First day of the backtest (default is the start of the available history). Only
+            the strategy's lookback of earlier bars is loaded, as indicator history.
+        end_date : str or pd.Timestamp, optional
+            Last day of the backtest, inclusive (default is the end of the available history).
 
         Returns
         -------
         tuple
-            Tuple containing the equity curve DataFrame and performance metrics dictionary.
+            Tuple containing the equity curve DataFrame, performance metrics dictionary and
+            trade count, followed by the Profiler when profile is True.
         """
+        strategy_params = strategy_params or {}
 
-        # Load data based on source
-        if self.source == "yahoo":
-            self.data_handler.load_data(ticker)
-        elif self.source == "csv":
-            self.data_handler.load_data(source_path)
+        # Bars needed before start_date so the strategy can signal from its first day
+        warmup = self._get_strategy_class(strategy_name).required_lookback(**strategy_params) if start_date is not None else 0
+
+        if not profile:
+            # Load and fetch historical data based on source
+            data = self._load_data(ticker, source_path, start_date, end_date, warmup)
+            start = self._first_row(data, start_date)
+            return self.backtest_data(data, strategy_name, strategy_params, initial_cash, engine, dtype, start=start)
 
-        # Fetch historical data
-        data = self.data_handler.fetch_data()
+        with Profiler() as profiler:
+            with profiler.phase("load_data"):
+                data = self._load_data(ticker, source_path, start_date, end_date, warmup)
+            start = self._first_row(data, start_date)
+            result = self.backtest_data(data, strategy_name, strategy_params, initial_cash, engine, dtype, start=start, profiler=profiler)
 
-        # Initialize the selected strategy
-        strategy = self._initialize_strategy(strategy_name, data, strategy_params)
+        return (*result, profiler)
+
+    def backtest_data(self, data: pd.DataFrame, strategy_name: str, strategy_params: dict = None, initial_cash: float = 100000.0, engine: str = "loop", dtype: str = "float64", start: int = 0, profiler: Profiler = None) -> tuple:
+        """
+        Runs a backtest on already loaded market data.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Historical market data containing a 'Close' column.
+        strategy_name : str
+            The name of the strategy to use ('sma_crossover', 'rsi_threshold', etc.).
+        strategy_params : dict
+            Dictionary containing parameters for the selected strategy.
+        initial_cash : float
+            Initial portfolio cash for the backtest (default is 100,000).
+        engine : str
+            Backtester simulation engine ('loop' or 'vectorized', default is 'loop').
+        dtype : str
+            Floating-point type of the recorded equity ('float64' or 'float32', default is 'float64').
+        start : int
+            Row position at which trading starts; earlier rows are indicator history only (default is 0).
+        profiler : Profiler, optional
+            Profiler recording the strategy, backtest and metrics phases (default is no profiling).
+
+        Returns
+        -------
+        tuple
+            Tuple containing the equity curve DataFrame, performance metrics dictionary and trade count.
+        """
+        strategy_params = strategy_params or {}
+
+        # Initialize the selected strategy (indicators are computed here)
+        with profile_phase(profiler, "strategy_init"):
+            strategy = self._initialize_strategy(strategy_name, data, strategy_params)
 
         # Update data reference to strategy's modified data
         data = strategy.data
 
-        # Initialize the backtester
-        backtester = Backtester(data, strategy, initial_cash)
-
-        # Run the backtest and get the equity curve
-        equity_curve = backtester.run_backtest()
+        # Initialize the backtester and run the backtest to get the equity curve
+        with profile_phase(profiler, "backtest"):
+            backtester = Backtester(data, strategy, initial_cash, engine=engine, dtype=dtype, start=start, profiler=profiler)
+            equity_curve = backtester.run_backtest()
 
         # Calculate the performance metrics
-        results_analyzer = Results(equity_curve)
-        performance_metrics = results_analyzer.calculate_performance_metrics()
+        with profile_phase(profiler, "metrics"):
+            results_analyzer = Results(equity_curve)
+            performance_metrics = results_analyzer.calculate_performance_metrics()
 
         return equity_curve, performance_metrics, backtester.trades_executed
 
+    def run_sweep(self, strategy_name: str, param_grid: dict, ticker: str = None, source_path: str = None, initial_cash: float = 100000.0, workers: int = None, dtype: str = "float64", store: ResultsStore = None) -> pd.DataFrame:
+        """
+        Runs one backtest per parameter combination, spread across a process pool.
+
+        The data is loaded once and placed in shared memory; worker processes attach to it
+        when the pool starts, and individual tasks only carry their parameter dictionary.
+
+        Parameters
+        ----------
+        strategy_name : str
+            The name of the strategy to sweep.
+        param_grid : dict
+            Mapping of parameter name to the list of values to try.
+        ticker : str
+            The stock ticker symbol to fetch data for (Yahoo).
+        source_path : str
+            The CSV file path to load data from (CSV).
+        initial_cash : float
+            Initial portfolio cash for every backtest (default is 100,000).
+        workers : int
+            Number of worker processes (default is the CPU count, 1 runs in-process).
+        dtype : str
+            Floating-point type of each run's equity ('float64' or 'float32', default is 'float64').
+        store : ResultsStore, optional
+            Results database that receives every combination in one transaction.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per combination, in grid order, with parameters, performance metrics and 'Trades'.
+        """
+        # Load data once for the whole sweep
+        data = self._load_data(ticker, source_path)
+
+        combinations = expand_param_grid(param_grid)
+        tasks = [(strategy_name, params, initial_cash, dtype) for params in combinations]
+        workers = workers or os.cpu_count() or 1
+
+        if workers == 1 or len(tasks) <= 1:
+            _init_sweep_worker(self.source, data)
+            try:
+                rows = [_run_sweep_task(task) for task in tasks]
+            finally:
+                _init_sweep_worker(None, None)
+        else:
+            # Contiguous chunks keep per-task overhead low; map() preserves grid order
+            chunksize = max(1, len(tasks) // (workers * 4))
+            with SharedPrices(data) as shared, ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker, initargs=(self.source, shared.handle)) as executor:
+                rows = list(executor.map(_run_sweep_task, tasks, chunksize=chunksize))
+
+        if store is not None:
+            source_name = ticker if self.source == "yahoo" else os.path.splitext(os.path.basename(source_path))[0]
+            store.add_runs([
+                {
+                    "strategy": strategy_name,
+                    "params": params,
+                    "metrics": row,
+                    "trades": row["Trades"],
+                    "source": self.source,
+                    "source_name": source_name,
+                }
+                for params, row in zip(combinations, rows)
+            ])
+
+        return pd.DataFrame(rows)
+
+    def run_walk_forward(self, strategy_name: str, param_grid: dict, train_size: int, test_size: int, ticker: str = None, source_path: str = None, anchored: bool = False, step: int = None, metric: str = "Sharpe Ratio", minimize: bool = False, initial_cash: float = 100000.0, workers: int = None, dtype: str = "float64") -> tuple:
+        """
+        Runs a walk-forward optimization: parameters are chosen on each training window by
+        a grid search and then traded, unseen, on the test window that follows it.
+
+        Folds are independent and run concurrently on a process pool. The data is loaded
+        once and placed in shared memory, which workers attach to when the pool starts;
+        tasks only carry the fold's window slices. Each test run uses its training window as indicator history, so
+        indicators are warmed up when the test window starts.
+
+        Parameters
+        ----------
+        strategy_name : str
+            The name of the strategy to optimize.
+        param_grid : dict
+            Mapping of parameter name to the list of values to try on each training window.
+        train_size : int
+            Number of bars in each training window (the first one when anchored).
+        test_size : int
+            Number of bars in each out-of-sample test window.
+        ticker : str
+            The stock ticker symbol to fetch data for (Yahoo).
+        source_path : str
+            The CSV file path to load data from (CSV).
+        anchored : bool
+            If True, training windows all start at the first bar and grow; otherwise they
+            roll forward with a fixed length (default is False).
+        step : int, optional
+            Bars between consecutive test windows, at least test_size (default is test_size).
+        metric : str
+            Performance metric optimized on the training windows (default is 'Sharpe Ratio').
+        minimize : bool
+            If True, lower scores are better, ex. for 'Max Drawdown' (default is False).
+        initial_cash : float
+            Initial portfolio cash for every backtest (default is 100,000).
+        workers : int
+            Number of worker processes (default is the CPU count, 1 runs in-process).
+        dtype : str
+            Floating-point type of each run's equity ('float64' or 'float32', default is 'float64').
+
+        Returns
+        -------
+        tuple
+            Tuple containing the stitched out-of-sample equity curve DataFrame, a DataFrame
+            with one row per fold (windows, chosen parameters, training score, test metrics
+            and trades) and the performance metrics of the stitched curve.
+        """
+        # Load data once for every fold
+        data = self._load_data(ticker, source_path)
+
+        windows = split_windows(len(data), train_size, test_size, anchored=anchored, step=step)
+        if not windows:
+            raise ValueError(f"Not enough data ({len(data)} rows) for a training window of {train_size} rows.")
+
+        combinations = expand_param_grid(param_grid)
+        tasks = [(strategy_name, combinations, train, test, metric, minimize, initial_cash, dtype) for train, test in windows]
+        workers = workers or os.cpu_count() or 1
+
+        if workers == 1 or len(tasks) <= 1:
+            _init_sweep_worker(self.source, data)
+            try:
+                folds = [_run_walk_forward_fold(task) for task in tasks]
+            finally:
+                _init_sweep_worker(None, None)
+        else:
+            with SharedPrices(data) as shared, ProcessPoolExecutor(max_workers=min(workers, len(tasks)), initializer=_init_sweep_worker, initargs=(self.source, shared.handle)) as executor:
+                folds = list(executor.map(_run_walk_forward_fold, tasks))
+
+        equity_curve = stitch_equity([fold.pop("curve") for fold in folds], initial_cash)
+        performance_metrics = Results(equity_curve).calculate_performance_metrics()
+
+        index = data.index
+        fold_rows = [
+            {
+                "Fold": number,
+                "Train Start": index[train.start],
+                "Train End": index[train.stop - 1],
+                "Test Start": index[test.start],
+                "Test End": index[test.stop - 1],
+                **fold,
+            }
+            for number, ((train, test), fold) in enumerate(zip(windows, folds))
+        ]
+
+        return equity_curve, pd.DataFrame(fold_rows), performance_metrics
+
+    def run_successive_halving(self, strategy_name: str, param_grid: dict, ticker: str = None, source_path: str = None, metric="Sharpe Ratio", minimize: bool = False, n_candidates: int = None, eta: int = 3, min_bars: int = None, seed: int = None, initial_cash: float = 100000.0, workers: int = None, dtype: str = "float64") -> tuple:
+        """
+        Searches a parameter grid by successive halving instead of backtesting every combination on the full history.
+
+        Candidates are scored on the most recent bars first; the best 1/eta advance to a
+        rung with eta times more bars, until the last rung uses the full history. Each
+        evaluation loads the strategy's lookback of earlier bars as indicator history, so
+        short slices start with warmed-up indicators. Rungs run on a process pool whose
+        workers attach to the data in shared memory.
+
+        Parameters
+        ----------
+        strategy_name : str
+            The name of the strategy to optimize.
+        param_grid : dict
+            Mapping of parameter name to the list of values to try.
+        ticker : str
+            The stock ticker symbol to fetch data for (Yahoo).
+        source_path : str
+            The CSV file path to load data from (CSV).
+        metric : str or callable
+            Performance metric to optimize (default is 'Sharpe Ratio'), or a function
+            scoring an equity curve DataFrame (defined at module level when workers > 1,
+            so it can be sent to the worker processes).
+        minimize : bool
+            If True, lower scores are better, ex. for 'Max Drawdown' (default is False).
+        n_candidates : int, optional
+            Number of combinations drawn from the grid for the first rung (default is all).
+        eta : int
+            Reduction factor between rungs (default is 3).
+        min_bars : int, optional
+            Smallest slice scored on any rung (default is no minimum; the first rung
+            scores the full history divided by eta once per later rung).
+        seed : int, optional
+            Random seed for drawing candidates; runs with the same seed are identical.
+        initial_cash : float
+            Initial portfolio cash for every backtest (default is 100,000).
+        workers : int
+            Number of worker processes (default is the CPU count, 1 runs in-process).
+        dtype : str
+            Floating-point type of each run's equity ('float64' or 'float32', default is 'float64').
+
+        Returns
+        -------
+        tuple
+            Tuple containing the best parameters, their performance metrics on the full
+            history, and a DataFrame with one row per evaluation (rung, bars, parameters,
+            score, trades and whether the candidate advanced).
+        """
+        if not callable(metric) and metric not in METRIC_COLUMNS:
+            raise ValueError(f"Unknown metric: {metric}. Expected one of {list(METRIC_COLUMNS)} or a function.")
+
+        # Load data once for every rung
+        data = self._load_data(ticker, source_path)
+        n_rows = len(data)
+
+        candidates = sample_candidates(expand_param_grid(param_grid), n_candidates, seed)
+        if not candidates:
+            raise ValueError("The parameter grid is empty.")
+        schedule = halving_schedule(len(candidates), n_rows, eta, min_bars or 1)
+
+        # Bars of indicator history each candidate needs before its slice
+        strategy_class = self._get_strategy_class(strategy_name)
+        lookbacks = [strategy_class.required_lookback(**params) for params in candidates]
+
+        workers = workers or os.cpu_count() or 1
+        history = []
+        survivors = list(range(len(candidates)))
+        best_metrics = None
+
+        with contextlib.ExitStack() as stack:
+            if workers == 1:
+                _init_sweep_worker(self.source, data)
+                stack.callback(_init_sweep_worker, None, None)
+                run_tasks = lambda tasks: [_run_halving_task(task) for task in tasks]
+            else:
+                shared = stack.enter_context(SharedPrices(data))
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker, initargs=(self.source, shared.handle)))
+                run_tasks = lambda tasks: list(executor.map(_run_halving_task, tasks))
+
+            for rung, (bars, _) in enumerate(schedule):
+                # Trailing slice of the given length, preceded by each candidate's warm-up history
+                tasks = []
+                for i in survivors:
+                    window_start = max(n_rows - bars - lookbacks[i], 0)
+                    tasks.append((strategy_name, candidates[i], window_start, n_rows - bars - window_start, metric, initial_cash, dtype))
+                results = run_tasks(tasks)
+
+                # The last rung keeps only the best candidate
+                keep = 1 if rung == len(schedule) - 1 else schedule[rung + 1][1]
+                order = rank_scores([score for score, _, _ in results], minimize)
+                advanced = set(order[:keep].tolist())
+
+                for position, (i, (score, _, trades)) in enumerate(zip(survivors, results)):
+                    history.append({"Rung": rung, "Bars": bars, **candidates[i], "Score": score, "Trades": trades, "Advanced": position in advanced})
+
+                best_metrics = results[order[0]][1]
+                survivors = [survivors[position] for position in order[:keep]]
+
+        if best_metrics is None:
+            raise ValueError("No parameter combination could be evaluated on the full history.")
+
+        return candidates[survivors[0]], best_metrics, pd.DataFrame(history)
+
+    def run_portfolio_backtest(self, tickers: list = None, source_paths: list = None, strategy_name: str = None, strategy_params: dict = None, initial_cash: float = 100000.0) -> tuple:
+        """
+        Runs one strategy over many assets that share a single cash account.
+
+        Parameters
+        ----------
+        tickers : list
+            Stock ticker symbols to fetch data for (Yahoo).
+        source_paths : list
+            CSV file paths to load data from (CSV).
+        strategy_name : str
+            The name of the strategy to use ('sma_crossover', 'rsi_threshold', etc.).
+        strategy_params : dict
+            Dictionary containing parameters for the selected strategy.
+        initial_cash : float
+            Initial portfolio cash shared by all assets (default is 100,000).
+
+        Returns
+        -------
+        tuple
+            Tuple containing the aggregate equity curve DataFrame, the per-asset holding values
+            DataFrame, the performance metrics dictionary and the trade count.
+        """
+        identifiers = tickers if self.source == "yahoo" else source_paths
+        prices = self.data_handler.load_panel(identifiers)
+
+        backtester = PortfolioBacktester(prices, self._get_strategy_class(strategy_name), strategy_params, initial_cash)
+        equity_curve, asset_values = backtester.run_backtest()
+
+        performance_metrics = Results(equity_curve).calculate_performance_metrics()
+
+        return equity_curve, asset_values, performance_metrics, backtester.trades_executed
+
+    def _load_data(self, ticker: str = None, source_path: str = None, start_date=None, end_date=None, warmup: int = 0) -> pd.DataFrame:
+        """
+        Internal method to load and return market data from the configured source.
+
+        Parameters
+        ----------
+        ticker : str
+            The stock ticker symbol to fetch data for (Yahoo).
+        source_path : str
+            The CSV file path to load data from (CSV).
+        start_date : str or pd.Timestamp, optional
+            First date of interest (default is the start of the available history).
+        end_date : str or pd.Timestamp, optional
+            Last date of interest, inclusive (default is the end of the available history).
+        warmup : int
+            Number of bars to load before start_date (default is 0).
+
+        Returns
+        -------
+        pd.DataFrame
+            Historical market data.
+        """
+        if self.source == "yahoo":
+            self.data_handler.load_data(ticker, start_date, end_date, warmup)
+        elif self.source in ("csv", "binary"):
+            self.data_handler.load_data(source_path, start_date, end_date, warmup)
+
+        return self.data_handler.fetch_data()
+
+    @staticmethod
+    def _first_row(data: pd.DataFrame, start_date=None) -> int:
+        """
+        Internal method returning the row position of start_date in loaded data (0 when unset).
+        """
+        return 0 if start_date is None else int(data.index.searchsorted(pd.Timestamp(start_date), side="left"))
+
     def _initialize_strategy(self, strategy_name: str, data: pd.DataFrame, params: dict):
         """
         Internal method to initialize the appropriate strategy object based on user selection.
@@ -112,13 +509,119 @@ class Controller:
             An instance of the selected strategy.
         """
 
-        if strategy_name == "sma_crossover":
-            return SMACrossoverStrategy(data, **params)
-        elif strategy_name == "rsi_threshold":
-            return RSIThresholdStrategy(data, **params)
-        elif strategy_name == "golden_cross":
-            return GoldenCrossStrategy(data)
-        elif strategy_name == "momentum":
-            return MomentumStrategy(data, **params)
-        else:
-            raise ValueError(f"Unknown strategy name: {strategy_name}")
\ No newline at end of file
+        return self._get_strategy_class(strategy_name)(data, **params)
+
+    def _get_strategy_class(self, strategy_name: str) -> type:
+        """
+        Internal method to look up the strategy class for a strategy name in the strategy registry.
+
+        Parameters
+        ----------
+        strategy_name : str
+            Name of the selected strategy.
+
+        Returns
+        -------
+        type
+            The matching strategy class.
+        """
+        # Only the requested strategy's module is imported
+        return get_strategy_class(strategy_name)
+
+
+def expand_param_grid(param_grid: dict) -> list:
+    """
+    Expands a parameter grid into a list of parameter dictionaries in a stable order.
+
+    Parameters
+    ----------
+    param_grid : dict
+        Mapping of parameter name to the list of values to try.
+
+    Returns
+    -------
+    list
+        List of parameter dictionaries, one per combination.
+    """
+    keys = list(param_grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(param_grid[key] for key in keys))]
+
+
+# Per-process state for sweep workers, set once by the pool initializer
+_SWEEP_STATE = {"controller": None, "data": None}
+
+
+def _init_sweep_worker(source: str, data):
+    """
+    Stores the market data and a Controller in the current worker process.
+
+    data is either a DataFrame (in-process runs) or a SharedPricesHandle, which is
+    attached to without copying.
+    """
+    _SWEEP_STATE["controller"] = Controller(source=source) if source is not None else None
+    _SWEEP_STATE["data"] = attach_prices(data) if isinstance(data, SharedPricesHandle) else data
+
+
+def _run_sweep_task(task: tuple) -> dict:
+    """
+    Runs a single sweep combination against the worker's market data.
+    """
+    strategy_name, params, initial_cash, dtype = task
+    controller = _SWEEP_STATE["controller"]
+
+    _, metrics, trades = controller.backtest_data(_SWEEP_STATE["data"], strategy_name, params, initial_cash, engine="vectorized", dtype=dtype)
+
+    return {**params, **metrics, "Trades": trades}
+
+
+def _run_halving_task(task: tuple) -> tuple:
+    """
+    Scores one successive-halving candidate on a trailing slice of the worker's market data.
+    """
+    strategy_name, params, window_start, start, metric, initial_cash, dtype = task
+    controller = _SWEEP_STATE["controller"]
+
+    try:
+        curve, metrics, trades = controller.backtest_data(
+            _SWEEP_STATE["data"].iloc[window_start:], strategy_name, params, initial_cash, engine="vectorized", dtype=dtype, start=start
+        )
+    except ValueError:
+        # Not enough data for these parameters
+        return math.nan, None, 0
+
+    score = metric(curve) if callable(metric) else metrics[metric]
+    return float(score), metrics, trades
+
+
+def _run_walk_forward_fold(task: tuple) -> dict:
+    """
+    Optimizes parameters on one fold's training window and trades them on its test window.
+    """
+    strategy_name, combinations, train, test, metric, minimize, initial_cash, dtype = task
+    controller = _SWEEP_STATE["controller"]
+    data = _SWEEP_STATE["data"]
+
+    # Grid search on the training window (an .iloc view of the shared data)
+    train_data = data.iloc[train]
+    evaluated, scores = [], []
+    for params in combinations:
+        try:
+            _, metrics, _ = controller.backtest_data(train_data, strategy_name, params, initial_cash, engine="vectorized", dtype=dtype)
+        except ValueError:
+            # Not enough training data for these parameters
+            continue
+        evaluated.append(params)
+        scores.append(metrics[metric])
+
+    if not evaluated:
+        raise ValueError(f"No parameter combination could be evaluated on the training window {train.start}:{train.stop}.")
+
+    # Undefined scores rank last; ties keep the earlier combination
+    best = rank_scores(scores, minimize)[0]
+    best_params, best_score = evaluated[best], scores[best]
+
+    # Trade the chosen parameters on the test window, with the training window as warm-up history
+    window = data.iloc[train.start:test.stop]
+    curve, metrics, trades = controller.backtest_data(window, strategy_name, best_params, initial_cash, engine="vectorized", dtype=dtype, start=test.start - train.start)
+
+    return {**best_params, f"Train {metric}": best_score, **metrics, "Trades": trades, "curve": curve}
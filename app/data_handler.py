@@ -2,11 +2,19 @@
 data_handler.py
 
 Module responsible for fetching and preparing financial data
-either from Yahoo Finance API or from a local CSV file.
+from Yahoo Finance API, a local CSV file, or a binary price store built from a CSV.
+
+Loads can be limited to a date range plus a number of warm-up bars before it. Binary
+stores and the Yahoo cache then map only those rows, Yahoo downloads request only that
+range, and CSV reads stop after the range and keep only its rows in memory (rows before
+it are still parsed, since a CSV cannot be searched by date).
 """
 
+import os
+
 import pandas as pd
-import yfinance as yf
+from app import price_store
+from app.yahoo_cache import YahooCache, warmup_start
 
 class DataHandler:
     """
@@ -15,85 +23,322 @@ class DataHandler:
     Parameters
     ----------
     source : str
-        The data source to use ('yahoo' or 'csv').
+        The data source to use ('yahoo', 'csv' or 'binary').
+    yahoo_cache : YahooCache, optional
+        On-disk cache used for Yahoo downloads (default is to download every time).
+    chunksize : int, optional
+        Read CSV files in pieces of this many rows so peak memory is bounded by the chunk
+        size rather than the file size (default is to read the whole file at once).
+    resample : str, optional
+        Bar size to resample CSV data to while reading (ex. '5min', '1h', '1D'), keeping
+        the last close of each bar.
 
     Attributes
     ----------
     source : str
-        Data source identifier ('yahoo' or 'csv').
+        Data source identifier ('yahoo', 'csv' or 'binary').
+    yahoo_cache : YahooCache
+        On-disk cache used for Yahoo downloads, or None.
+    chunksize : int
+        Rows per CSV chunk, or None to read whole files.
+    resample : str
+        Target bar size for CSV data, or None to keep the file's bars.
     data : pd.DataFrame
         Loaded historical market data.
     """
 
-    def __init__(self, source: str = "yahoo"):
+    def __init__(self, source: str = "yahoo", yahoo_cache: YahooCache = None, chunksize: int = None, resample: str = None):
         """
         Initialize the DataHandler instance.
 
         Parameters
         ----------
         source : str, optional
-            Data source to use ('yahoo' or 'csv'), default is 'yahoo'.
+            Data source to use ('yahoo', 'csv' or 'binary'), default is 'yahoo'.
+        yahoo_cache : YahooCache, optional
+            On-disk cache used for Yahoo downloads.
+        chunksize : int, optional
+            Rows per CSV chunk when reading large files.
+        resample : str, optional
+            Target bar size for CSV data (ex. '5min', '1h', '1D').
         """
         self.source = source
+        self.yahoo_cache = yahoo_cache
+        self.chunksize = chunksize
+        self.resample = resample
         self.data = None
 
-    def load_data(self, source_identifier: str):
+    def load_data(self, source_identifier: str, start_date=None, end_date=None, warmup: int = 0):
         """
         Loads data from the appropriate source based on source type.
 
         Parameters
         ----------
         source_identifier : str
-            Ticker symbol (for Yahoo) or CSV file path (for CSV).
+            Ticker symbol (for Yahoo), CSV file path (for CSV), or CSV file / store
+            directory path (for binary).
+        start_date : str or pd.Timestamp, optional
+            First date of interest (default is the start of the available history).
+        end_date : str or pd.Timestamp, optional
+            Last date of interest, inclusive (default is the end of the available history).
+        warmup : int
+            Number of bars to keep before start_date as indicator history (default is 0).
 
         Returns
         -------
         None
         """
         if self.source == "yahoo":
-            self.data = self.fetch_yahoo_data(source_identifier)
+            data = self.fetch_yahoo_data(source_identifier, start_date, end_date, warmup)
         elif self.source == "csv":
-            self.data = self.fetch_csv_data(source_identifier)
+            data = self.fetch_csv_data(source_identifier, start_date, end_date, warmup)
+        elif self.source == "binary":
+            data = self.fetch_binary_data(source_identifier, start_date, end_date, warmup)
         else:
             raise ValueError(f"Unsupported source type: {self.source}")
 
-    def fetch_yahoo_data(self, ticker: str) -> pd.DataFrame:
+        self.data = select_window(data, start_date, end_date, warmup)
+
+    def fetch_yahoo_data(self, ticker: str, start_date=None, end_date=None, warmup: int = 0) -> pd.DataFrame:
         """
         Fetch historical data for a given stock ticker from Yahoo Finance.
 
+        Served from the on-disk cache (with an incremental top-up, and a backfill of any
+        earlier history the date range needs) when one is configured.
+        Otherwise, given a date range, only that range and a calendar margin covering the
+        warm-up bars are downloaded instead of the default 3 years.
+
         Parameters
         ----------
         ticker : str
             Stock ticker symbol.
+        start_date : str or pd.Timestamp, optional
+            First date of interest.
+        end_date : str or pd.Timestamp, optional
+            Last date of interest, inclusive.
+        warmup : int
+            Number of trading days needed before start_date (default is 0).
 
         Returns
         -------
         pd.DataFrame
             Historical daily price data.
         """
-        df = yf.download(ticker, period="3y", interval="1d") # Gets the 3 year dataframe from Yahoo Finance
+        if self.yahoo_cache is not None:
+            return self.yahoo_cache.get(ticker, start_date, end_date, warmup)
+
+        # Imported here so CSV and binary runs never load yfinance
+        import yfinance as yf
+
+        if start_date is None and end_date is None:
+            df = yf.download(ticker, period="3y", interval="1d") # Gets the 3 year dataframe from Yahoo Finance
+        else:
+            # Yahoo's end date is exclusive
+            df = yf.download(
+                ticker,
+                start=None if start_date is None else warmup_start(start_date, warmup).strftime("%Y-%m-%d"),
+                end=None if end_date is None else (pd.Timestamp(end_date) + pd.Timedelta(days=1)).strftime("%Y-%m-%d"),
+                interval="1d",
+            )
         df = df[["Close"]].dropna()
         df.index.name = "Date"
         return df
 
-    def fetch_csv_data(self, file_path: str) -> pd.DataFrame:
+    def fetch_csv_data(self, file_path: str, start_date=None, end_date=None, warmup: int = 0) -> pd.DataFrame:
         """
         Load historical data from a local CSV file.
 
+        Given a date range (or a chunksize), the file is read in chunks: chunks entirely
+        before the warm-up margin are dropped as they are read and reading stops after
+        end_date, so memory holds only the needed rows.
+
         Parameters
         ----------
         file_path : str
             Path to the CSV file.
+        start_date : str or pd.Timestamp, optional
+            First date of interest.
+        end_date : str or pd.Timestamp, optional
+            Last date of interest, inclusive.
+        warmup : int
+            Number of bars needed before start_date (default is 0).
 
         Returns
         -------
         pd.DataFrame
             Historical daily price data.
         """
+        if self.chunksize is not None or self.resample is not None or start_date is not None or end_date is not None:
+            chunks = list(self._window_chunks(self.iter_csv_chunks(file_path), start_date, end_date, warmup))
+            if not chunks:
+                # Nothing in the window: an empty frame lets the Backtester report the shortage
+                return pd.DataFrame({"Close": pd.Series(dtype=float)}, index=pd.DatetimeIndex([], name="Date"))
+            return pd.concat(chunks)
+
         df = pd.read_csv(file_path, parse_dates=["Date"], index_col="Date")
         df = df[["Close"]].dropna()
         return df
 
+    def iter_csv_chunks(self, file_path: str, chunksize: int = None, resample: str = None):
+        """
+        Streams a date-ordered CSV file in bounded-size pieces, optionally resampling bars on the fly.
+
+        When resampling, each chunk is bucketed to the target bar size and the last close of
+        every bucket is kept. The final bucket of a chunk may continue in the next chunk, so
+        it is held back and only emitted once a later bar (or the end of the file) closes it.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the CSV file.
+        chunksize : int, optional
+            Rows per chunk (default is the handler's chunksize, or 1,000,000).
+        resample : str, optional
+            Target bar size (default is the handler's resample setting).
+
+        Yields
+        ------
+        pd.DataFrame
+            Consecutive pieces of price data with a 'Close' column indexed by 'Date'.
+        """
+        chunksize = chunksize or self.chunksize or 1_000_000
+        resample = resample or self.resample
+        pending = None
+
+        for chunk in pd.read_csv(file_path, usecols=["Date", "Close"], parse_dates=["Date"], index_col="Date", chunksize=chunksize):
+            chunk = chunk.dropna()
+
+            if resample is None:
+                if not chunk.empty:
+                    yield chunk
+                continue
+
+            if pending is not None:
+                chunk = pd.concat([pending, chunk])
+            if chunk.empty:
+                continue
+
+            # Last close per bucket; the newest bucket may still receive bars from the next chunk
+            buckets = chunk.index.floor(resample)
+            bars = chunk.groupby(buckets, sort=False).last()
+            bars.index.name = "Date"
+            pending = chunk.iloc[-1:]
+            if len(bars) > 1:
+                yield bars.iloc[:-1]
+
+        if resample is not None and pending is not None:
+            pending.index = pending.index.floor(resample)
+            yield pending
+
+    @staticmethod
+    def _window_chunks(chunks, start_date=None, end_date=None, warmup: int = 0):
+        """
+        Filters date-ordered chunks down to the rows select_window() keeps, plus a few extra.
+
+        Rows before start_date are held back, at most warmup of them, until the first chunk
+        reaching start_date; chunks after end_date end the iteration.
+        """
+        start = None if start_date is None else pd.Timestamp(start_date)
+        end = None if end_date is None else pd.Timestamp(end_date)
+        history = None
+
+        for chunk in chunks:
+            if start is not None and history is not None:
+                chunk = pd.concat([history, chunk])
+                history = None
+            if start is not None and chunk.index[-1] < start:
+                # Entirely before the range: only the last warmup rows may still be needed
+                history = chunk.iloc[max(len(chunk) - warmup, 0):] if warmup else chunk.iloc[:0]
+                continue
+            start = None
+
+            if end is not None and chunk.index[0] > end:
+                return
+            yield chunk
+
+        if history is not None:
+            yield history
+
+    def iter_csv_bars(self, file_path: str, chunksize: int = None, resample: str = None):
+        """
+        Yields (date, close) bars from a CSV file chunk by chunk, for the streaming backtester.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the CSV file.
+        chunksize : int, optional
+            Rows per chunk (default is the handler's chunksize, or 1,000,000).
+        resample : str, optional
+            Target bar size (default is the handler's resample setting).
+
+        Yields
+        ------
+        tuple
+            (date, close price) pairs in file order.
+        """
+        for chunk in self.iter_csv_chunks(file_path, chunksize, resample):
+            yield from zip(chunk.index, chunk["Close"].to_numpy(dtype=float))
+
+    def fetch_binary_data(self, path: str, start_date=None, end_date=None, warmup: int = 0) -> pd.DataFrame:
+        """
+        Load historical data from a memory-mapped binary price store.
+
+        Given a CSV path, the store next to it is built on first use and rebuilt whenever
+        the CSV's modification time changes. Given a store directory, it is loaded directly.
+
+        Parameters
+        ----------
+        path : str
+            Path to a CSV file or to a '.npystore' directory.
+        start_date : str or pd.Timestamp, optional
+            First date of interest (default is the first bar).
+        end_date : str or pd.Timestamp, optional
+            Last date of interest, inclusive (default is the last bar).
+        warmup : int
+            Number of bars to include before start_date (default is 0).
+
+        Returns
+        -------
+        pd.DataFrame
+            Historical daily price data backed by read-only memory-mapped arrays.
+        """
+        if os.path.isdir(path):
+            return price_store.load_store(path, start_date, end_date, warmup)
+
+        return price_store.load_store(price_store.ensure_store(path), start_date, end_date, warmup)
+
+    def load_panel(self, source_identifiers: list) -> pd.DataFrame:
+        """
+        Loads the 'Close' series of several tickers or CSV files into one price panel.
+
+        Parameters
+        ----------
+        source_identifiers : list
+            Ticker symbols (for Yahoo) or CSV file paths (for CSV).
+
+        Returns
+        -------
+        pd.DataFrame
+            Closing prices indexed by date with one column per ticker or CSV file name,
+            NaN where an asset has no bar for a date.
+        """
+        columns = {}
+        for identifier in source_identifiers:
+            self.load_data(identifier)
+
+            # Name file-based columns after the file, tickers after themselves
+            name = identifier if self.source == "yahoo" else os.path.splitext(os.path.basename(identifier))[0]
+            close = self.data["Close"]
+            if isinstance(close, pd.DataFrame):
+                close = close.iloc[:, 0]
+            columns[name] = close
+
+        panel = pd.concat(columns, axis=1).sort_index()
+        panel.index.name = "Date"
+        self.data = panel
+        return panel
+
     def fetch_data(self) -> pd.DataFrame:
         """
         Returns the currently loaded market data.
@@ -105,4 +350,31 @@ class DataHandler:
         """
         if self.data is None:
             raise ValueError("No data loaded. Please call load_data() first.")
-        return self.data
\ No newline at end of file
+        return self.data
+
+
+def select_window(data: pd.DataFrame, start_date=None, end_date=None, warmup: int = 0) -> pd.DataFrame:
+    """
+    Returns the rows from start_date through end_date, preceded by up to warmup earlier rows.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Date-indexed market data in date order.
+    start_date : str or pd.Timestamp, optional
+        First date of interest (default is the first row).
+    end_date : str or pd.Timestamp, optional
+        Last date of interest, inclusive (default is the last row).
+    warmup : int
+        Number of rows to keep before start_date as indicator history (default is 0).
+
+    Returns
+    -------
+    pd.DataFrame
+        Positional slice of data (a view where pandas allows it).
+    """
+    if start_date is None and end_date is None:
+        return data
+
+    first, stop = price_store.window_bounds(data.index, start_date, end_date, warmup)
+    return data.iloc[first:stop]
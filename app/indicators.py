@@ -0,0 +1,252 @@
+"""
+indicators.py
+
+Module providing a shared, memory-capped cache of technical indicator series.
+
+Strategies request SMA, ROC and RSI series from an IndicatorCache instead of recomputing
+them from scratch, so repeated and overlapping runs (parameter sweeps, strategies sharing
+the same moving averages) reuse series that have already been computed.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+class IndicatorCache:
+    """
+    A least-recently-used cache of indicator series keyed by (data fingerprint, indicator, parameters).
+
+    Parameters
+    ----------
+    max_bytes : int
+        Memory cap for cached indicator values (default is 256 MB).
+
+    Attributes
+    ----------
+    max_bytes : int
+        Memory cap for cached indicator values.
+    current_bytes : int
+        Memory currently used by cached indicator values.
+    hits : int
+        Number of lookups served from the cache.
+    misses : int
+        Number of lookups that had to compute the indicator.
+    evictions : int
+        Number of entries dropped to stay under the memory cap.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initializes an empty IndicatorCache with the given memory cap.
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def fingerprint(close: pd.Series) -> str:
+        """
+        Computes a content hash of a price series and its index.
+
+        Parameters
+        ----------
+        close : pd.Series
+            Price series the indicators are computed from.
+
+        Returns
+        -------
+        str
+            Hex digest identifying the series contents.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+
+        # Hash the raw value and index buffers without building intermediate copies where possible
+        values = np.ascontiguousarray(close.to_numpy(dtype=float))
+        digest.update(values.data)
+
+        index = close.index
+        tz = getattr(index, "tz", None)
+        if tz is not None:
+            # tz-aware dates are objects in to_numpy(); hash the UTC nanoseconds and the zone
+            digest.update(np.ascontiguousarray(index.asi8).view(np.uint8).data)
+            digest.update(str(tz).encode())
+        elif index.dtype.kind in "Mmiuf":
+            digest.update(np.ascontiguousarray(index.to_numpy()).view(np.uint8).data)
+        else:
+            digest.update(pd.util.hash_pandas_object(index, index=False).to_numpy().data)
+
+        return digest.hexdigest()
+
+    def get(self, close: pd.Series, indicator: str, params: tuple, compute, fingerprint: str = None) -> pd.Series:
+        """
+        Returns a cached indicator series, computing and storing it on a miss.
+
+        Parameters
+        ----------
+        close : pd.Series
+            Price series the indicator is computed from.
+        indicator : str
+            Indicator name used in the cache key (ex. 'sma').
+        params : tuple
+            Indicator parameters used in the cache key.
+        compute : callable
+            Function taking the price series and returning the indicator series.
+        fingerprint : str, optional
+            Precomputed fingerprint of close, to avoid rehashing for several indicators.
+
+        Returns
+        -------
+        pd.Series
+            A fresh copy of the indicator series aligned with close.
+        """
+        if fingerprint is None:
+            fingerprint = self.fingerprint(close)
+        key = (fingerprint, indicator, params)
+
+        values = self._entries.get(key)
+        if values is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        else:
+            self.misses += 1
+            values = np.asarray(compute(close), dtype=float)
+            self._store(key, values)
+
+        # Hand out a copy so callers can modify their frame without corrupting the cache
+        return pd.Series(values.copy(), index=close.index)
+
+    def _store(self, key: tuple, values: np.ndarray):
+        """
+        Inserts an entry and evicts least recently used entries beyond the memory cap.
+        """
+        if values.nbytes > self.max_bytes:
+            return
+
+        values.flags.writeable = False
+        self._entries[key] = values
+        self.current_bytes += values.nbytes
+
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted.nbytes
+            self.evictions += 1
+
+    def sma(self, close: pd.Series, window: int, fingerprint: str = None) -> pd.Series:
+        """
+        Returns the simple moving average of close over the given window.
+        """
+        return self.get(close, "sma", (window,), lambda series: series.rolling(window=window).mean(), fingerprint)
+
+    def roc(self, close: pd.Series, period: int, fingerprint: str = None) -> pd.Series:
+        """
+        Returns the rate of change of close over the given period.
+        """
+        return self.get(close, "roc", (period,), lambda series: series.pct_change(periods=period), fingerprint)
+
+    def rsi(self, close: pd.Series, period: int = 14, fingerprint: str = None) -> pd.Series:
+        """
+        Returns the Relative Strength Index of close over the given period.
+        """
+        return self.get(close, "rsi", (period,), lambda series: compute_rsi(series, period), fingerprint)
+
+    def clear(self):
+        """
+        Removes all cached entries and resets the counters.
+        """
+        self._entries.clear()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Returns cache usage counters.
+
+        Returns
+        -------
+        dict
+            Dictionary with entries, bytes, hits, misses and evictions.
+        """
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def compute_rsi(close: pd.Series, period: int = 14) -> pd.Series:
+    """
+    Calculates the Relative Strength Index (RSI) from simple rolling averages of gains and losses.
+
+    Parameters
+    ----------
+    close : pd.Series
+        Price series.
+    period : int
+        RSI lookback period (default is 14).
+
+    Returns
+    -------
+    pd.Series
+        RSI values, NaN during the warm-up period.
+    """
+    delta = close.diff()
+
+    # Separate gains and losses
+    gain = delta.clip(lower=0)
+    loss = -delta.clip(upper=0)
+
+    # Calculate average gains and losses
+    avg_gain = gain.rolling(window=period).mean()
+    avg_loss = loss.rolling(window=period).mean()
+
+    # Compute the RSI
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+def crossover_events(fast: np.ndarray, slow: np.ndarray) -> np.ndarray:
+    """
+    Detects where a fast series crosses a slow one, row by row along the first axis.
+
+    Works on 1-D series and on 2-D (dates x assets) panels alike. Rows where either the
+    current or previous value is NaN never signal.
+
+    Parameters
+    ----------
+    fast : np.ndarray
+        Faster moving series (ex. short SMA).
+    slow : np.ndarray
+        Slower moving series (ex. long SMA).
+
+    Returns
+    -------
+    np.ndarray
+        int8 array with 1 where fast crosses above slow, -1 where it crosses below, 0 otherwise.
+    """
+    fast = np.asarray(fast, dtype=float)
+    slow = np.asarray(slow, dtype=float)
+
+    # Previous row's values (NaN for the very first row)
+    prev_fast = np.full_like(fast, np.nan)
+    prev_slow = np.full_like(slow, np.nan)
+    prev_fast[1:] = fast[:-1]
+    prev_slow[1:] = slow[:-1]
+
+    # Comparisons against NaN are False, so warm-up rows never signal
+    crosses_above = (prev_fast <= prev_slow) & (fast > slow)
+    crosses_below = (prev_fast >= prev_slow) & (fast < slow)
+
+    return crosses_above.astype(np.int8) - crosses_below.astype(np.int8)
+
+
+# Process-wide cache shared by all strategies unless they are given their own
+indicator_cache = IndicatorCache()
@@ -0,0 +1,229 @@
+"""
+jobs.py
+
+Module responsible for running backtest job files without interactive prompts.
+
+A job file (JSON or TOML) lists jobs, each naming a data source, a ticker or file path, a
+strategy, its parameters and the initial cash. Jobs that read the same data are grouped so
+the data is loaded once per group, and groups run on a pool of worker processes. A job may
+name a fallback CSV file that is used when its own data cannot be loaded or backtested;
+without one the job is reported as failed.
+
+Example job file (TOML)
+-----------------------
+[defaults]
+initial_cash = 100000
+
+[[jobs]]
+source = "yahoo"
+ticker = "AAPL"
+strategy = "sma_crossover"
+params = { short_window = 20, long_window = 50 }
+fallback_csv = "data/sample_prices.csv"
+
+[[jobs]]
+source = "csv"
+path = "data/volatile_prices.csv"
+strategy = "momentum"
+params = { roc_period = 10, roc_threshold = 0.01 }
+"""
+
+import json
+import math
+import os
+import tomllib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from app.controller import Controller
+from app.data_handler import DataHandler
+from app.yahoo_cache import YahooCache
+
+# Keys a job may set, with their defaults (None means required or unset)
+JOB_DEFAULTS = {
+    "source": "csv",
+    "ticker": None,
+    "path": None,
+    "strategy": None,
+    "params": {},
+    "initial_cash": 100000.0,
+    "engine": "vectorized",
+    "fallback_csv": None,
+}
+
+
+def load_jobs(path: str) -> list:
+    """
+    Reads and validates a JSON or TOML job file.
+
+    The file holds a 'jobs' list (a bare list is also accepted for JSON) and an optional
+    'defaults' table applied to every job.
+
+    Parameters
+    ----------
+    path : str
+        Job file ending in .json or .toml.
+
+    Returns
+    -------
+    list
+        Job dictionaries with every key of JOB_DEFAULTS filled in.
+    """
+    if path.endswith(".toml"):
+        with open(path, "rb") as handle:
+            document = tomllib.load(handle)
+    else:
+        with open(path) as handle:
+            document = json.load(handle)
+
+    if isinstance(document, list):
+        document = {"jobs": document}
+
+    defaults = {**JOB_DEFAULTS, **document.get("defaults", {})}
+    jobs = [{**defaults, **job} for job in document.get("jobs", [])]
+
+    for number, job in enumerate(jobs):
+        unknown = set(job) - set(JOB_DEFAULTS)
+        if unknown:
+            raise ValueError(f"Job {number}: unknown keys {sorted(unknown)}.")
+        if not job["strategy"]:
+            raise ValueError(f"Job {number}: 'strategy' is required.")
+        if job["source"] not in ("yahoo", "csv", "binary"):
+            raise ValueError(f"Job {number}: unknown source {job['source']!r}.")
+        if not job["ticker" if job["source"] == "yahoo" else "path"]:
+            raise ValueError(f"Job {number}: a {job['source']} job needs {'a ticker' if job['source'] == 'yahoo' else 'a path'}.")
+
+    return jobs
+
+
+def job_data_key(job: dict) -> tuple:
+    """
+    Returns the (source, identifier) pair that decides which jobs can share loaded data.
+    """
+    return job["source"], job["ticker"] if job["source"] == "yahoo" else job["path"]
+
+
+def source_name(job: dict) -> str:
+    """
+    Returns the name a job's results are saved under: the ticker, or the file name without extension.
+    """
+    source, identifier = job_data_key(job)
+    return identifier.upper() if source == "yahoo" else os.path.splitext(os.path.basename(identifier))[0]
+
+
+def plan_tasks(jobs: list, workers: int) -> list:
+    """
+    Groups jobs by data source and splits large groups so every worker has work.
+
+    Parameters
+    ----------
+    jobs : list
+        Validated job dictionaries.
+    workers : int
+        Number of worker processes.
+
+    Returns
+    -------
+    list
+        Tasks of (source, identifier, [(job index, job), ...]); each task loads its data once.
+    """
+    groups = {}
+    for index, job in enumerate(jobs):
+        groups.setdefault(job_data_key(job), []).append((index, job))
+
+    # Fewer groups than workers: split each group so the pool stays busy
+    chunks_per_group = max(1, workers // max(1, len(groups)))
+
+    tasks = []
+    for (source, identifier), members in groups.items():
+        size = math.ceil(len(members) / chunks_per_group)
+        for start in range(0, len(members), size):
+            tasks.append((source, identifier, members[start:start + size]))
+    return tasks
+
+
+def run_jobs(jobs: list, workers: int = None, yahoo_cache_dir: str = None):
+    """
+    Runs jobs on a process pool and yields each job's result as its group finishes.
+
+    Parameters
+    ----------
+    jobs : list
+        Validated job dictionaries, as returned by load_jobs().
+    workers : int
+        Number of worker processes (default is the CPU count, 1 runs in-process).
+    yahoo_cache_dir : str, optional
+        Directory of the on-disk Yahoo cache (default is to download every time).
+
+    Yields
+    ------
+    dict
+        'index', 'job', 'source_name', 'used_fallback', 'equity_curve', 'metrics',
+        'trades' and 'error' (None on success).
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = [(*task, yahoo_cache_dir) for task in plan_tasks(jobs, workers)]
+
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield from _run_task(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+        futures = [executor.submit(_run_task, task) for task in tasks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def _load(source: str, identifier: str, yahoo_cache_dir: str = None):
+    """
+    Loads one data set through a DataHandler.
+    """
+    yahoo_cache = YahooCache(yahoo_cache_dir) if source == "yahoo" and yahoo_cache_dir else None
+    handler = DataHandler(source=source, yahoo_cache=yahoo_cache)
+    handler.load_data(identifier)
+    return handler.fetch_data()
+
+
+def _run_task(task: tuple) -> list:
+    """
+    Loads a group's data once and runs each of its jobs, falling back to CSV where configured.
+    """
+    source, identifier, members, yahoo_cache_dir = task
+    controller = Controller(source=source)
+
+    try:
+        data, load_error = _load(source, identifier, yahoo_cache_dir), None
+    except Exception as e:
+        data, load_error = None, e
+
+    fallback_data = {}
+    results = []
+    for index, job in members:
+        result = {"index": index, "job": job, "source_name": source_name(job), "used_fallback": False, "error": None}
+
+        try:
+            if load_error is not None:
+                raise load_error
+            equity_curve, metrics, trades = controller.backtest_data(data, job["strategy"], job["params"], job["initial_cash"], engine=job["engine"])
+        except Exception as e:
+            fallback = job["fallback_csv"]
+            if fallback is None:
+                results.append({**result, "error": f"{type(e).__name__}: {e}"})
+                continue
+
+            # Explicit per-job fallback: rerun on the local CSV, loading it once per group
+            try:
+                if fallback not in fallback_data:
+                    fallback_data[fallback] = _load("csv", fallback)
+                equity_curve, metrics, trades = Controller(source="csv").backtest_data(
+                    fallback_data[fallback], job["strategy"], job["params"], job["initial_cash"], engine=job["engine"]
+                )
+            except Exception as e2:
+                results.append({**result, "error": f"{type(e).__name__}: {e}; fallback failed with {type(e2).__name__}: {e2}"})
+                continue
+
+            result.update(used_fallback=True, source_name=os.path.splitext(os.path.basename(fallback))[0])
+
+        results.append({**result, "equity_curve": equity_curve, "metrics": metrics, "trades": trades})
+
+    return results
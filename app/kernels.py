@@ -0,0 +1,111 @@
+"""
+kernels.py
+
+Module providing the sequential cash/position recurrence used by the vectorized
+Backtester engine.
+
+A buy depends on the cash left after every earlier trade, so this part of a backtest
+cannot be expressed as whole-array NumPy operations. The same recurrence is compiled
+with Numba when it is installed and otherwise runs as plain Python over lists. Both
+kernels perform the same double-precision operations in the same order, so they produce
+bit-identical cash, position and equity.
+"""
+
+try:
+    import numba
+except ImportError:  # Numba is optional
+    numba = None
+
+
+def _recurrence(prices, buy, sell, cash, position, cash_out, position_out) -> tuple:
+    """
+    Runs the trading rules bar by bar, writing cash and position after each bar.
+
+    One share per signal, buys only when cash covers the price, sells only when a
+    position is held, and a buy takes priority over a sell on the same bar.
+
+    Parameters
+    ----------
+    prices, buy, sell : sequence
+        Closing prices and buy/sell signals, one per bar.
+    cash : float
+        Cash before the first bar.
+    position : int
+        Shares held before the first bar.
+    cash_out, position_out : np.ndarray
+        Preallocated arrays receiving cash and position after each bar.
+
+    Returns
+    -------
+    tuple
+        Tuple of (final cash, final position, trades executed).
+    """
+    trades = 0
+    for i in range(len(prices)):
+        price = prices[i]
+
+        if buy[i] and cash >= price:
+            position += 1
+            cash -= price
+            trades += 1
+        elif sell[i] and position > 0:
+            position -= 1
+            cash += price
+            trades += 1
+
+        cash_out[i] = cash
+        position_out[i] = position
+
+    return cash, position, trades
+
+
+def simulate_python(prices, buy, sell, cash, position, cash_out, position_out) -> tuple:
+    """
+    Pure-Python kernel; iterates over plain lists, which is much faster than indexing arrays.
+    Parameters and return value are those of _recurrence().
+    """
+    # Cash and prices are double-precision Python floats, as in the loop engine
+    return _recurrence(prices.tolist(), buy.tolist(), sell.tolist(), float(cash), int(position), cash_out, position_out)
+
+
+if numba is not None:
+    _compiled_recurrence = numba.njit(cache=True, nogil=True)(_recurrence)
+
+    def simulate_numba(prices, buy, sell, cash, position, cash_out, position_out) -> tuple:
+        """
+        Numba-compiled kernel running directly over the arrays at native speed.
+        Parameters and return value are those of _recurrence().
+        """
+        return _compiled_recurrence(prices, buy, sell, float(cash), int(position), cash_out, position_out)
+else:
+    simulate_numba = None
+
+
+# Available kernels by name
+KERNELS = {"python": simulate_python}
+if simulate_numba is not None:
+    KERNELS["numba"] = simulate_numba
+
+
+def get_kernel(name: str = "auto"):
+    """
+    Returns a simulation kernel by name.
+
+    Parameters
+    ----------
+    name : str
+        'numba', 'python', or 'auto' for Numba when installed and Python otherwise
+        (default is 'auto').
+
+    Returns
+    -------
+    callable
+        Kernel with the signature of _recurrence().
+    """
+    if name == "auto":
+        return KERNELS.get("numba", simulate_python)
+    if name not in KERNELS:
+        if name == "numba":
+            raise ValueError("The 'numba' kernel requires Numba to be installed (pip install numba).")
+        raise ValueError(f"Unknown kernel: {name}. Expected 'auto' or one of {list(KERNELS)}.")
+    return KERNELS[name]
@@ -0,0 +1,108 @@
+"""
+optimizer.py
+
+Module providing the candidate sampling, budget schedule and survivor selection used by
+successive-halving parameter search (see Controller.run_successive_halving).
+
+Instead of backtesting every grid combination on the full history, many candidates are
+first scored on a short, recent slice of it. Only the best 1/eta of them advance to the
+next rung, which uses an eta times longer slice, until the last rung scores the remaining
+few on the full history. Every rung scores about the same number of bars in total, so
+the search costs roughly (number of rungs) x (first rung) instead of the full grid run
+over the whole history.
+"""
+
+import math
+
+import numpy as np
+
+
+def sample_candidates(combinations: list, n_candidates: int = None, seed: int = None) -> list:
+    """
+    Draws candidates from a list of parameter combinations without replacement.
+
+    Parameters
+    ----------
+    combinations : list
+        Parameter dictionaries, ex. from expand_param_grid().
+    n_candidates : int, optional
+        Number of candidates to draw (default is every combination).
+    seed : int, optional
+        Random seed; the same seed always draws the same candidates.
+
+    Returns
+    -------
+    list
+        Drawn parameter dictionaries, in grid order.
+    """
+    if n_candidates is None or n_candidates >= len(combinations):
+        return list(combinations)
+
+    rng = np.random.default_rng(seed)
+    chosen = np.sort(rng.choice(len(combinations), size=n_candidates, replace=False))
+    return [combinations[i] for i in chosen]
+
+
+def halving_schedule(n_candidates: int, n_rows: int, eta: int = 3, min_bars: int = 1) -> list:
+    """
+    Returns the bars and candidate count of every rung of a successive-halving search.
+
+    Parameters
+    ----------
+    n_candidates : int
+        Number of candidates scored on the first rung.
+    n_rows : int
+        Number of bars in the full history, used by the last rung.
+    eta : int
+        Reduction factor: each rung keeps ceil(1/eta) of the candidates and scores them
+        on eta times more bars (default is 3).
+    min_bars : int
+        Smallest slice any rung uses (default is 1).
+
+    Returns
+    -------
+    list
+        List of (bars, candidates) pairs, from the first rung to the last.
+    """
+    if eta < 2:
+        raise ValueError("eta must be at least 2.")
+    if n_candidates < 1 or n_rows < 1:
+        raise ValueError("n_candidates and n_rows must be positive.")
+
+    # One rung per reduction until a single candidate would remain
+    rungs = 1
+    while eta ** rungs <= n_candidates:
+        rungs += 1
+
+    schedule = []
+    candidates = n_candidates
+    for rung in range(rungs):
+        bars = min(n_rows, max(min_bars, n_rows // eta ** (rungs - 1 - rung)))
+        schedule.append((bars, candidates))
+        candidates = math.ceil(candidates / eta)
+
+    return schedule
+
+
+def rank_scores(scores: list, minimize: bool = False) -> np.ndarray:
+    """
+    Orders candidates from best to worst score.
+
+    Parameters
+    ----------
+    scores : list
+        One score per candidate; NaN marks a candidate that could not be scored.
+    minimize : bool
+        If True, lower scores are better (default is False).
+
+    Returns
+    -------
+    np.ndarray
+        Candidate positions, best first. Unscored candidates rank last and ties keep the
+        earlier candidate, so the order is reproducible.
+    """
+    keys = np.asarray(scores, dtype=np.float64)
+    if not minimize:
+        keys = -keys
+    keys = np.where(np.isnan(keys), np.inf, keys)
+    return np.argsort(keys, kind="stable")
@@ -0,0 +1,129 @@
+"""
+portfolio.py
+
+Module responsible for simulating one trading strategy across many assets that share a
+single cash account.
+
+Prices are held as a dates x tickers panel and strategy signals are computed for every
+column at once, so a whole universe runs in one pass instead of one backtest per ticker.
+"""
+
+import numpy as np
+import pandas as pd
+
+class PortfolioBacktester:
+    """
+    A class to simulate a strategy over a 2-D price panel with one shared cash account.
+
+    Purpose
+    -------
+    Applies the single-asset trading rules to every ticker on each day: one share per
+    signal, buys only while the shared cash covers the price, sells only when the asset
+    is held, and a filled buy takes priority over a sell for the same asset. Buys on the
+    same day are filled in column order; a ticker the remaining cash cannot cover is
+    skipped and later columns are still filled.
+
+    Parameters
+    ----------
+    prices : pd.DataFrame
+        Closing prices indexed by date with one column per ticker (NaN where not trading).
+    strategy : type
+        Strategy class implementing generate_panel_signals(prices, **params).
+    strategy_params : dict
+        Parameters passed to the strategy's panel signal method.
+    initial_cash : float
+        Starting cash amount for the portfolio (default is 100,000).
+
+    Attributes
+    ----------
+    prices : pd.DataFrame
+        The price panel used for the backtest.
+    strategy : type
+        The strategy class applied during the backtest.
+    strategy_params : dict
+        Strategy parameters.
+    initial_cash : float
+        The starting portfolio cash amount.
+    cash : float
+        Cash remaining at the end of the backtest.
+    positions : np.ndarray
+        Shares held per day and ticker, shaped like prices.
+    trades_executed : int
+        Number of buy and sell orders filled across all tickers.
+    """
+
+    def __init__(self, prices: pd.DataFrame, strategy: type, strategy_params: dict = None, initial_cash: float = 100000.0):
+        """
+        Initializes the PortfolioBacktester with a price panel, a strategy class, and starting capital.
+        """
+        self.prices = prices
+        self.strategy = strategy
+        self.strategy_params = strategy_params or {}
+        self.initial_cash = initial_cash
+        self.cash = initial_cash
+        self.positions = None
+        self.trades_executed = 0
+
+    def run_backtest(self) -> tuple:
+        """
+        Runs the trading simulation over every ticker of the panel.
+
+        Returns
+        -------
+        tuple
+            Tuple of (equity_curve, asset_values): the aggregate 'Portfolio Value' DataFrame
+            indexed by date, and a DataFrame of per-ticker holding values shaped like prices.
+        """
+        buy, sell = self.strategy.generate_panel_signals(self.prices, **self.strategy_params)
+
+        prices = self.prices.to_numpy(dtype=float)
+        n_days, n_assets = prices.shape
+
+        tradable = ~np.isnan(prices)
+        fill_prices = np.where(tradable, prices, 0.0)
+        buy = np.asarray(buy, dtype=bool) & tradable
+        sell = np.asarray(sell, dtype=bool) & tradable
+
+        positions = np.zeros((n_days, n_assets), dtype=np.int64)
+        cash = np.empty(n_days, dtype=float)
+
+        current_cash = self.cash
+        holding = np.zeros(n_assets, dtype=np.int64)
+        trades = 0
+
+        # Shared cash makes days depend on each other, but each day is handled for all tickers at once
+        for day in range(n_days):
+            day_prices = fill_prices[day]
+
+            # Fill buys in column order, skipping any ticker the remaining cash cannot cover
+            bought = np.zeros(n_assets, dtype=bool)
+            remaining = current_cash
+            for asset in np.flatnonzero(buy[day]):
+                if remaining >= day_prices[asset]:
+                    bought[asset] = True
+                    remaining -= day_prices[asset]
+
+            # Sells only for tickers without a filled buy that currently hold shares
+            sold = sell[day] & ~bought & (holding > 0)
+
+            holding += bought
+            holding -= sold
+            current_cash += day_prices[sold].sum() - day_prices[bought].sum()
+            trades += int(bought.sum() + sold.sum())
+
+            positions[day] = holding
+            cash[day] = current_cash
+
+        self.cash = current_cash
+        self.positions = positions
+        self.trades_executed = trades
+
+        # Value holdings at the last known price so gaps in a ticker's history do not zero it out
+        valuation = self.prices.ffill().fillna(0.0).to_numpy(dtype=float)
+        holding_values = positions * valuation
+
+        index = pd.Index(self.prices.index, name='Date')
+        asset_values = pd.DataFrame(holding_values, index=index, columns=self.prices.columns)
+        equity_curve = pd.DataFrame({'Portfolio Value': cash + holding_values.sum(axis=1)}, index=index)
+
+        return equity_curve, asset_values
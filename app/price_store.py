@@ -0,0 +1,324 @@
+"""
+price_store.py
+
+Module providing a binary, memory-mappable columnar store for historical price data.
+
+A store is a directory holding one NumPy .npy file per column ('Date' as datetime64[ns]
+and 'Close' as float64) plus a small metadata file. Loading maps the arrays straight from
+disk, so no CSV or date parsing happens after the one-time conversion. Stores converted
+from a CSV remember the CSV's modification time and are rebuilt when it changes.
+"""
+
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+STORE_SUFFIX = ".npystore"
+META_FILE = "meta.json"
+
+# Seconds after which a build lock left behind by a crashed process is broken
+LOCK_TIMEOUT = 120.0
+
+
+def store_path_for(csv_path: str) -> str:
+    """
+    Returns the default store directory for a CSV file (next to it, with a .npystore suffix).
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the source CSV file.
+
+    Returns
+    -------
+    str
+        Path of the store directory.
+    """
+    return os.path.splitext(csv_path)[0] + STORE_SUFFIX
+
+
+def write_store(data: pd.DataFrame, store_path: str, source_path: str = None, extra_meta: dict = None):
+    """
+    Writes a price DataFrame to a store directory.
+
+    Column files are written under unique temporary names and moved into place, and the
+    metadata is written last, so an interrupted write is detected as stale and rebuilt and
+    concurrent writers never write to the same file.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Price data indexed by date with a 'Close' column.
+    store_path : str
+        Directory to write the store to.
+    source_path : str, optional
+        CSV file the data came from, recorded for staleness checks.
+    extra_meta : dict, optional
+        Additional JSON-serializable metadata to store alongside the arrays.
+    """
+    os.makedirs(store_path, exist_ok=True)
+
+    # tz-aware dates would save as pickled objects, which cannot be mapped; store them as UTC
+    index = pd.DatetimeIndex(data.index)
+    tz = index.tz
+    if tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+
+    columns = {
+        "Date": index.as_unit("ns").to_numpy(),
+        "Close": data["Close"].to_numpy(dtype=np.float64),
+    }
+    for name, values in columns.items():
+        with _temp_file(store_path, os.path.join(store_path, f"{name}.npy"), "wb") as handle:
+            np.save(handle, np.ascontiguousarray(values))
+
+    meta = {"rows": len(data), "columns": list(columns)}
+    if tz is not None:
+        meta["tz"] = str(tz)
+    if source_path is not None:
+        meta["source"] = os.path.abspath(source_path)
+        meta["source_mtime_ns"] = os.stat(source_path).st_mtime_ns
+    meta.update(extra_meta or {})
+
+    with _temp_file(store_path, os.path.join(store_path, META_FILE), "w") as handle:
+        json.dump(meta, handle)
+
+
+@contextmanager
+def _temp_file(directory: str, final_path: str, mode: str):
+    """
+    Yields a file with a unique temporary name that is moved to final_path once written.
+
+    The temporary file is removed instead if writing fails.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(final_path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as handle:
+            yield handle
+        os.replace(temp_path, final_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+@contextmanager
+def _build_lock(store_path: str, timeout: float = LOCK_TIMEOUT):
+    """
+    Holds an exclusive lock file next to a store while it is built.
+
+    Waits while another process holds the lock; a lock older than timeout seconds is
+    assumed to be left by a crashed process and is broken.
+    """
+    lock_path = store_path.rstrip(os.sep) + ".lock"
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.stat(lock_path).st_mtime > timeout:
+                    os.remove(lock_path)
+                    continue
+            except FileNotFoundError:
+                continue
+            time.sleep(0.05)
+
+    try:
+        os.close(fd)
+        yield
+    finally:
+        try:
+            os.remove(lock_path)
+        except FileNotFoundError:
+            pass
+
+
+def read_meta(store_path: str) -> dict:
+    """
+    Returns a store's metadata, or None if the store does not exist.
+
+    Parameters
+    ----------
+    store_path : str
+        Store directory.
+
+    Returns
+    -------
+    dict
+        Metadata written with the store.
+    """
+    meta_path = os.path.join(store_path, META_FILE)
+    if not os.path.exists(meta_path):
+        return None
+
+    with open(meta_path) as handle:
+        return json.load(handle)
+
+
+def convert_csv(csv_path: str, store_path: str = None) -> str:
+    """
+    Converts a CSV file with 'Date' and 'Close' columns into a binary store.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the source CSV file.
+    store_path : str, optional
+        Directory to write the store to (default is next to the CSV).
+
+    Returns
+    -------
+    str
+        Path of the written store directory.
+    """
+    store_path = store_path or store_path_for(csv_path)
+
+    df = pd.read_csv(csv_path, parse_dates=["Date"], index_col="Date")
+    df = df[["Close"]].dropna()
+
+    write_store(df, store_path, source_path=csv_path)
+    return store_path
+
+
+def is_stale(store_path: str, csv_path: str) -> bool:
+    """
+    Checks whether a store is missing, incomplete, or older than its source CSV.
+
+    Parameters
+    ----------
+    store_path : str
+        Store directory.
+    csv_path : str
+        Source CSV file.
+
+    Returns
+    -------
+    bool
+        True if the store needs to be (re)built.
+    """
+    meta = read_meta(store_path)
+    if meta is None:
+        return True
+
+    return meta.get("source_mtime_ns") != os.stat(csv_path).st_mtime_ns
+
+
+def ensure_store(csv_path: str, store_path: str = None) -> str:
+    """
+    Returns an up-to-date store for a CSV file, converting it if missing or stale.
+
+    Safe to call from several processes at once: one of them builds the store while
+    the others wait for it and then reuse it.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the source CSV file.
+    store_path : str, optional
+        Store directory (default is next to the CSV).
+
+    Returns
+    -------
+    str
+        Path of the store directory.
+    """
+    store_path = store_path or store_path_for(csv_path)
+    if not is_stale(store_path, csv_path):
+        return store_path
+
+    # Another process may be building the same store: wait for it, then check again
+    with _build_lock(store_path):
+        if is_stale(store_path, csv_path):
+            convert_csv(csv_path, store_path)
+    return store_path
+
+
+def window_bounds(index: pd.Index, start_date=None, end_date=None, warmup: int = 0) -> tuple:
+    """
+    Returns the row positions of a date range preceded by up to warmup earlier rows.
+
+    Parameters
+    ----------
+    index : pd.Index
+        Date index in date order.
+    start_date : str or pd.Timestamp, optional
+        First date of interest (default is the first row).
+    end_date : str or pd.Timestamp, optional
+        Last date of interest, inclusive (default is the last row).
+    warmup : int
+        Number of rows to include before start_date (default is 0).
+
+    Returns
+    -------
+    tuple
+        Tuple of (first, stop) positions for a positional slice.
+    """
+    tz = getattr(index, "tz", None)
+    first = 0 if start_date is None else index.searchsorted(_timestamp(start_date, tz), side="left")
+    stop = len(index) if end_date is None else index.searchsorted(_timestamp(end_date, tz), side="right")
+    return max(first - warmup, 0), max(stop, 0)
+
+
+def _timestamp(date, tz=None) -> pd.Timestamp:
+    """
+    Returns a date as a Timestamp in a time zone, reading a naive date as local to it.
+    """
+    timestamp = pd.Timestamp(date)
+    if tz is None:
+        return timestamp
+    return timestamp.tz_localize(tz) if timestamp.tz is None else timestamp.tz_convert(tz)
+
+
+def load_store(store_path: str, start_date=None, end_date=None, warmup: int = 0) -> pd.DataFrame:
+    """
+    Loads a store as a DataFrame backed directly by memory-mapped, read-only arrays.
+
+    Given a date range, the mapped arrays are sliced before the DataFrame is built, so
+    only the pages of the requested rows (and warmup earlier rows) are ever read.
+
+    Parameters
+    ----------
+    store_path : str
+        Store directory.
+    start_date : str or pd.Timestamp, optional
+        First date of interest (default is the first stored bar).
+    end_date : str or pd.Timestamp, optional
+        Last date of interest, inclusive (default is the last stored bar).
+    warmup : int
+        Number of bars to include before start_date (default is 0).
+
+    Returns
+    -------
+    pd.DataFrame
+        Price data indexed by 'Date' with a 'Close' column.
+    """
+    meta = read_meta(store_path)
+    if meta is None:
+        raise FileNotFoundError(f"No price store found at {store_path}")
+    tz = meta.get("tz")
+
+    dates = np.load(os.path.join(store_path, "Date.npy"), mmap_mode="r")
+    close = np.load(os.path.join(store_path, "Close.npy"), mmap_mode="r")
+
+    # copy=False keeps pandas pointing at the mapped file instead of reading it into memory
+    index = pd.DatetimeIndex(dates, name="Date", copy=False)
+    if start_date is not None or end_date is not None:
+        if tz is not None:
+            # The mapped dates are naive UTC; search them with the bounds in UTC
+            start_date, end_date = (None if date is None else _timestamp(date, tz).tz_convert("UTC").tz_localize(None) for date in (start_date, end_date))
+
+        # Binary search over the mapped dates touches only a few pages
+        first, stop = window_bounds(index, start_date, end_date, warmup)
+        index = pd.DatetimeIndex(dates[first:stop], name="Date", copy=False)
+        close = close[first:stop]
+
+    if tz is not None:
+        index = index.tz_localize("UTC").tz_convert(tz)
+
+    return pd.DataFrame({"Close": close}, index=index, copy=False)
@@ -0,0 +1,187 @@
+"""
+profiling.py
+
+Module providing opt-in instrumentation for backtest runs.
+
+A Profiler records wall time, CPU time and peak traced allocations for each named phase of
+a run (data loading, strategy construction, simulation, metrics), and per-call counts and
+cumulative time for instrumented strategy hooks such as should_buy/should_sell. Profiles
+export to a plain dictionary or JSON. When no profiler is passed, callers use
+profile_phase(None, ...), which is a no-op context, and strategy methods are left unwrapped.
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+# Strategy methods wrapped by Profiler.instrument() when present
+HOOKS = ("should_buy", "should_sell", "generate_signals")
+
+
+class Profiler:
+    """
+    Collects per-phase timings and allocations and per-hook call statistics.
+
+    Use as a context manager around the profiled run; memory tracing is started on entry
+    (unless already active) and stopped on exit.
+
+    Parameters
+    ----------
+    trace_memory : bool
+        Record peak allocations with tracemalloc (default is True). Tracing slows
+        allocation-heavy code, so wall times are inflated while it is on.
+
+    Attributes
+    ----------
+    phases : dict
+        Mapping of phase name to 'wall_seconds', 'cpu_seconds' and 'peak_alloc_bytes'.
+    calls : dict
+        Mapping of hook name to 'count' and 'total_seconds'.
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        """
+        Initializes an empty profile.
+        """
+        self.trace_memory = trace_memory
+        self.phases = {}
+        self.calls = {}
+        self._started_tracing = False
+        self._started = None
+
+    def __enter__(self):
+        """
+        Starts memory tracing and the total run timers.
+        """
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._started = (time.perf_counter(), time.process_time())
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        """
+        Records the total run time and stops memory tracing if this profiler started it.
+        """
+        wall_started, cpu_started = self._started
+        self.phases["total"] = {
+            "wall_seconds": time.perf_counter() - wall_started,
+            "cpu_seconds": time.process_time() - cpu_started,
+            "peak_alloc_bytes": max((phase["peak_alloc_bytes"] for phase in self.phases.values()), default=0),
+        }
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return False
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Times a block of code and records its peak allocations above the starting level.
+
+        Parameters
+        ----------
+        name : str
+            Phase name; repeated phases accumulate time and keep the highest peak.
+        """
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_started
+            cpu = time.process_time() - cpu_started
+            peak = tracemalloc.get_traced_memory()[1] - baseline if tracing else 0
+
+            record = self.phases.setdefault(name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "peak_alloc_bytes": 0})
+            record["wall_seconds"] += wall
+            record["cpu_seconds"] += cpu
+            record["peak_alloc_bytes"] = max(record["peak_alloc_bytes"], peak)
+
+    def instrument(self, obj: object, names: tuple = HOOKS):
+        """
+        Wraps an object's methods so every call is counted and timed.
+
+        The wrappers are set on the instance only, so the class and other instances are
+        unaffected.
+
+        Parameters
+        ----------
+        obj : object
+            Object whose methods to wrap (typically a strategy instance).
+        names : tuple
+            Method names to wrap; names the object does not define are skipped.
+        """
+        for name in names:
+            method = getattr(obj, name, None)
+            if callable(method):
+                setattr(obj, name, self._timed(name, method))
+
+    def _timed(self, name: str, method):
+        """
+        Returns a wrapper that adds each call's count and duration to self.calls[name].
+        """
+        record = self.calls.setdefault(name, {"count": 0, "total_seconds": 0.0})
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                record["count"] += 1
+                record["total_seconds"] += time.perf_counter() - started
+
+        return wrapper
+
+    def to_dict(self) -> dict:
+        """
+        Returns the profile as a JSON-serializable dictionary.
+        """
+        return {
+            "phases": {name: dict(values) for name, values in self.phases.items()},
+            "calls": {name: dict(values) for name, values in self.calls.items()},
+        }
+
+    def to_json(self, path: str = None, indent: int = 2) -> str:
+        """
+        Serializes the profile to JSON, optionally writing it to a file.
+
+        Parameters
+        ----------
+        path : str, optional
+            File to write the JSON to.
+        indent : int
+            JSON indentation (default is 2).
+
+        Returns
+        -------
+        str
+            The profile as a JSON string.
+        """
+        text = json.dumps(self.to_dict(), indent=indent)
+        if path is not None:
+            with open(path, "w") as handle:
+                handle.write(text)
+        return text
+
+
+def profile_phase(profiler: Profiler, name: str):
+    """
+    Returns profiler.phase(name), or a no-op context when profiling is disabled.
+
+    Parameters
+    ----------
+    profiler : Profiler
+        Active profiler, or None.
+    name : str
+        Phase name.
+    """
+    return nullcontext() if profiler is None else profiler.phase(name)
@@ -2,10 +2,15 @@
 results.py
 
 Module to calculate performance metrics from the portfolio equity curve.
+
+Metrics are computed on the curve's NumPy array in one pass (one running maximum shared by
+the drawdown statistics), and rolling and drawdown analytics are built from cumulative
+sums and running maxima instead of re-slicing the curve per window.
 """
 
 import pandas as pd
 import numpy as np
+from app.robustness import robustness_report
 
 class Results:
     """
@@ -22,6 +27,10 @@ class Results:
         """Initialize the Results object with a portfolio equity curve."""
         self.portfolio = portfolio
 
+    def _values(self) -> np.ndarray:
+        """Return the equity curve as a float64 NumPy array (without copying when possible)."""
+        return self.portfolio['Portfolio Value'].to_numpy(dtype=np.float64)
+
     def calculate_performance_metrics(self) -> dict:
         """
         Calculate and return key performance metrics.
@@ -29,16 +38,388 @@ class Results:
         Returns:
         dict: A dictionary containing Total Return, Volatility, Sharpe Ratio, and Max Drawdown.
         """
-        returns = self.portfolio['Portfolio Value'].pct_change().dropna()
+        values = self._values()
+        returns = _daily_returns(values)
+
+        # Sample statistics of the daily returns (as pandas' std with ddof=1)
+        n_returns = len(returns)
+        mean = returns.mean() if n_returns > 0 else np.nan
+        std = returns.std(ddof=1) if n_returns > 1 else np.nan
+
+        total_return = (values[-1] / values[0]) - 1
+        volatility = std * (252 ** 0.5)  # Annualized volatility (Think 252 trading days in a year)
+        sharpe_ratio = (mean / std) * (252 ** 0.5) if std != 0 else 0
 
-        total_return = (self.portfolio['Portfolio Value'].iloc[-1] / self.portfolio['Portfolio Value'].iloc[0]) - 1
-        volatility = returns.std() * (252 ** 0.5)  # Annualized volatility (Think 252 trading days in a year)
-        sharpe_ratio = (returns.mean() / returns.std()) * (252 ** 0.5) if returns.std() != 0 else 0
-        max_drawdown = ((self.portfolio['Portfolio Value'].cummax() - self.portfolio['Portfolio Value']) / self.portfolio['Portfolio Value'].cummax()).max()
+        # One running maximum serves the whole drawdown calculation
+        peak = np.maximum.accumulate(values)
+        max_drawdown = ((peak - values) / peak).max()
 
         return {
             "Total Return": total_return,
             "Volatility": volatility,
             "Sharpe Ratio": sharpe_ratio,
             "Max Drawdown": max_drawdown,
-        }
\ No newline at end of file
+        }
+
+    def rolling_metrics(self, window: int = 63) -> pd.DataFrame:
+        """
+        Calculate return, annualized volatility and Sharpe ratio over a trailing window.
+
+        Window sums come from cumulative sums of the daily returns (and their squares), so
+        every window is evaluated at once without slicing the curve.
+
+        Parameters:
+        window (int): Number of daily returns per window (default is 63, about a quarter).
+
+        Returns:
+        pd.DataFrame: 'Rolling Return', 'Rolling Volatility' and 'Rolling Sharpe' aligned with
+        the equity curve; the first window rows are NaN.
+        """
+        if window < 2:
+            raise ValueError("window must be at least 2 returns.")
+
+        values = self._values()
+        n_rows = len(values)
+
+        # Column-major block so each metric is contiguous and the DataFrame wraps it without copying
+        out = np.full((n_rows, 3), np.nan, order="F")
+        rolling_return, volatility, sharpe = out[:, 0], out[:, 1], out[:, 2]
+
+        if n_rows > window:
+            # Centre the returns before summing to limit cancellation in the variance
+            returns = values[1:] / values[:-1] - 1
+            overall_mean = returns.mean()
+            np.subtract(returns, overall_mean, out=returns)
+
+            sums = np.zeros(n_rows)
+            np.cumsum(returns, out=sums[1:])
+            np.multiply(returns, returns, out=returns)
+            squares = np.zeros(n_rows)
+            np.cumsum(returns, out=squares[1:])
+
+            window_sum = sums[window:] - sums[:-window]
+            window_squares = np.subtract(squares[window:], squares[:-window], out=squares[window:])
+
+            # Sample variance from the window sums, clipped at zero against rounding
+            std = volatility[window:]
+            np.multiply(window_sum, window_sum, out=std)
+            np.divide(std, window, out=std)
+            np.subtract(window_squares, std, out=std)
+            np.divide(std, window - 1, out=std)
+            np.maximum(std, 0.0, out=std)
+            np.sqrt(std, out=std)
+
+            # Sharpe from the window mean (restoring the overall mean), 0 for flat windows
+            np.divide(window_sum, window, out=window_sum)
+            np.add(window_sum, overall_mean, out=window_sum)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                np.divide(window_sum, std, out=sharpe[window:])
+            sharpe[window:][std == 0] = 0.0
+            sharpe[window:] *= 252 ** 0.5
+            std *= 252 ** 0.5
+
+            np.divide(values[window:], values[:-window], out=rolling_return[window:])
+            rolling_return[window:] -= 1
+
+        return pd.DataFrame(out, columns=["Rolling Return", "Rolling Volatility", "Rolling Sharpe"], index=self.portfolio.index, copy=False)
+
+    def drawdown_series(self) -> pd.DataFrame:
+        """
+        Calculate the drawdown and drawdown duration at every point of the equity curve.
+
+        Returns:
+        pd.DataFrame: 'Drawdown' (fraction below the running peak) and 'Drawdown Duration'
+        (periods since the running peak was set), aligned with the equity curve.
+        """
+        depth, duration = _drawdown_arrays(self._values())
+
+        return pd.DataFrame({"Drawdown": depth, "Drawdown Duration": duration}, index=self.portfolio.index)
+
+    def drawdown_periods(self) -> pd.DataFrame:
+        """
+        List every drawdown from its peak to its recovery, with depth, duration and time to recovery.
+
+        Returns:
+        pd.DataFrame: One row per drawdown, deepest first, with 'Peak', 'Trough' and 'Recovery'
+        (index labels; Recovery is missing if the curve has not recovered), 'Depth', 'Duration'
+        (periods from peak to recovery, or to the end of the curve), 'Time to Recovery'
+        (periods from trough to recovery, NaN if not recovered) and 'Recovered'.
+        """
+        columns = ["Peak", "Trough", "Recovery", "Depth", "Duration", "Time to Recovery", "Recovered"]
+
+        values = self._values()
+        n_rows = len(values)
+        depth, duration = _drawdown_arrays(values)
+        underwater = duration > 0
+
+        # Each run of underwater points is one drawdown; it starts right after its peak
+        edges = np.diff(np.concatenate(([False], underwater, [False])).astype(np.int8))
+        starts = np.flatnonzero(edges == 1)
+        stops = np.flatnonzero(edges == -1)
+        if len(starts) == 0:
+            return pd.DataFrame(columns=columns)
+
+        # Deepest point per run: the first position matching the run's maximum drawdown
+        run_ids = np.repeat(np.arange(len(starts)), stops - starts)
+        run_positions = np.flatnonzero(underwater)
+        deepest = np.maximum.reduceat(depth[run_positions], np.concatenate(([0], np.cumsum(stops - starts)[:-1])))
+        is_trough = depth[run_positions] == deepest[run_ids]
+        trough_runs = run_ids[is_trough]
+        first = np.flatnonzero(np.diff(trough_runs, prepend=-1))
+        troughs = run_positions[is_trough][first]
+
+        recovered = stops < n_rows
+        peaks = starts - 1
+        index = self.portfolio.index
+
+        return pd.DataFrame({
+            "Peak": index[peaks],
+            "Trough": index[troughs],
+            "Recovery": pd.Series(index[np.minimum(stops, n_rows - 1)]).where(recovered).to_numpy(),
+            "Depth": deepest,
+            "Duration": np.where(recovered, stops, n_rows - 1) - peaks,
+            "Time to Recovery": np.where(recovered, stops - troughs, np.nan),
+            "Recovered": recovered,
+        }, columns=columns).sort_values("Depth", ascending=False, kind="stable").reset_index(drop=True)
+
+    def calculate_robustness(self, n_paths: int = 10000, method: str = "bootstrap", confidence: float = 0.95, block_size: int = 20, seed: int = None) -> pd.DataFrame:
+        """
+        Estimate confidence intervals for Total Return, Sharpe Ratio and Max Drawdown by
+        resampling the daily returns (see robustness.py).
+
+        Parameters:
+        n_paths (int): Number of simulated paths.
+        method (str): 'bootstrap' (block bootstrap) or 'permutation' (shuffled return order).
+        confidence (float): Two-sided confidence level of the intervals.
+        block_size (int): Block length of the bootstrap, in days.
+        seed (int): Random seed for reproducible results.
+
+        Returns:
+        pd.DataFrame: One row per metric with Observed, Lower, Median and Upper columns.
+        """
+        return robustness_report(self.portfolio, n_paths, method, confidence, block_size, seed)
+
+def _drawdown_arrays(values: np.ndarray) -> tuple:
+    """
+    Return (drawdown, periods since the running peak) for every point of an equity array.
+    """
+    peak = np.maximum.accumulate(values)
+    positions = np.arange(len(values))
+
+    # Position of the most recent running peak, carried forward
+    last_peak = np.where(values >= peak, positions, 0)
+    np.maximum.accumulate(last_peak, out=last_peak)
+    np.subtract(positions, last_peak, out=positions)
+
+    depth = np.subtract(peak, values)
+    np.divide(depth, peak, out=depth)
+    return depth, positions
+
+def _daily_returns(values: np.ndarray) -> np.ndarray:
+    """
+    Return period-over-period returns, skipping undefined ones (as pct_change().dropna()).
+    """
+    returns = values[1:] / values[:-1] - 1
+    if not np.isfinite(returns).all():
+        returns = returns[~np.isnan(returns)]
+    return returns
+
+class ResultsAccumulator:
+    """
+    Streaming form of Results that updates performance metrics one equity value at a time.
+
+    Purpose
+    -------
+    Tracks total return, volatility, Sharpe ratio and max drawdown without keeping the
+    equity curve: daily return statistics use Welford's online mean/variance, and drawdown
+    uses the running peak. Accumulators built over consecutive chunks of a curve can be
+    merged into the accumulator of the whole curve, so chunked or parallel runs combine.
+
+    For exact merging, each accumulator also keeps a compact ladder of (record high,
+    lowest value seen before the next record high) entries. Only record highs at which that
+    low changes are kept, so the ladder stays a handful of entries for typical equity
+    curves and never grows with the number of updates otherwise.
+
+    Attributes
+    ----------
+    count : int
+        Number of equity values seen.
+    first : float
+        First equity value.
+    last : float
+        Most recent equity value.
+    peak : float
+        Highest equity value seen.
+    max_drawdown : float
+        Largest peak-to-trough decline seen, as a fraction of the peak.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty accumulator.
+        """
+        self.count = 0
+        self.first = np.nan
+        self.last = np.nan
+        self.peak = np.nan
+        self.trough = np.nan
+        self.max_drawdown = 0.0
+
+        # Welford running statistics of the daily returns
+        self._n_returns = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+        # Ladder of [record high, lowest value before the next record high]
+        self._ladder = []
+
+    def update(self, value: float):
+        """
+        Adds the next equity value.
+        """
+        value = float(value)
+
+        if self.count == 0:
+            self.first = self.last = self.peak = self.trough = value
+            self._ladder = [[value, value]]
+            self.count = 1
+            return
+
+        self._add_return(value / self.last - 1)
+        self.count += 1
+        self.last = value
+
+        if value > self.peak:
+            self.peak = value
+            self._append_record(self._ladder, [value, self.trough])
+        else:
+            self.trough = min(self.trough, value)
+            self._ladder[-1][1] = self.trough
+            self.max_drawdown = max(self.max_drawdown, (self.peak - value) / self.peak)
+
+    @staticmethod
+    def _append_record(ladder: list, entry: list):
+        """
+        Appends a record-high entry, dropping the previous one if its low never moved.
+
+        The last entry always belongs to the current peak; earlier entries are only kept
+        where the lowest value changed between consecutive record highs.
+        """
+        if len(ladder) >= 2 and ladder[-1][1] == ladder[-2][1]:
+            ladder.pop()
+        ladder.append(entry)
+
+    def update_many(self, values):
+        """
+        Adds a sequence of equity values in order.
+        """
+        for value in values:
+            self.update(value)
+
+    def _add_return(self, daily_return: float):
+        """
+        Adds one daily return to the Welford statistics.
+        """
+        self._n_returns += 1
+        delta = daily_return - self._mean
+        self._mean += delta / self._n_returns
+        self._m2 += delta * (daily_return - self._mean)
+
+    def _low_before_exceeding(self, level: float) -> float:
+        """
+        Returns the lowest value seen before the curve first rose above level.
+        """
+        low = np.nan
+        for record_high, record_low in self._ladder:
+            if record_high > level:
+                break
+            low = record_low
+        return low
+
+    def merge(self, later: "ResultsAccumulator") -> "ResultsAccumulator":
+        """
+        Combines this accumulator with one built over the values that directly follow it.
+
+        Parameters
+        ----------
+        later : ResultsAccumulator
+            Accumulator for the next chunk of the same equity curve.
+
+        Returns
+        -------
+        ResultsAccumulator
+            A new accumulator equivalent to updating over both chunks in order.
+        """
+        if later.count == 0:
+            return self._copy()
+        if self.count == 0:
+            return later._copy()
+
+        merged = ResultsAccumulator()
+        merged.count = self.count + later.count
+        merged.first = self.first
+        merged.last = later.last
+        merged.peak = max(self.peak, later.peak)
+        merged.trough = min(self.trough, later.trough)
+
+        # Return statistics: this chunk, the return across the boundary, then the later chunk
+        merged._n_returns, merged._mean, merged._m2 = self._n_returns, self._mean, self._m2
+        merged._add_return(later.first / self.last - 1)
+        merged._combine_returns(later._n_returns, later._mean, later._m2)
+
+        # Values of the later chunk that stay below this chunk's peak draw down from it
+        low_below_peak = later._low_before_exceeding(self.peak)
+        carried_drawdown = (self.peak - low_below_peak) / self.peak if low_below_peak == low_below_peak else 0.0
+        merged.max_drawdown = max(self.max_drawdown, later.max_drawdown, carried_drawdown)
+
+        # Ladder: extend this chunk's last low, then keep the later chunk's higher records
+        merged._ladder = [list(entry) for entry in self._ladder]
+        if low_below_peak == low_below_peak:
+            merged._ladder[-1][1] = min(merged._ladder[-1][1], low_below_peak)
+        for record_high, record_low in later._ladder:
+            if record_high > self.peak:
+                self._append_record(merged._ladder, [record_high, min(self.trough, record_low)])
+
+        return merged
+
+    def _combine_returns(self, n_returns: int, mean: float, m2: float):
+        """
+        Combines another set of Welford statistics into this one (Chan et al.).
+        """
+        if n_returns == 0:
+            return
+        total = self._n_returns + n_returns
+        delta = mean - self._mean
+        self._mean += delta * n_returns / total
+        self._m2 += m2 + delta * delta * self._n_returns * n_returns / total
+        self._n_returns = total
+
+    def _copy(self) -> "ResultsAccumulator":
+        """
+        Returns an independent copy of this accumulator.
+        """
+        copy = ResultsAccumulator()
+        copy.__dict__.update(self.__dict__)
+        copy._ladder = [list(entry) for entry in self._ladder]
+        return copy
+
+    def calculate_performance_metrics(self) -> dict:
+        """
+        Calculate and return key performance metrics for the values seen so far.
+
+        Returns:
+        dict: A dictionary containing Total Return, Volatility, Sharpe Ratio, and Max Drawdown.
+        """
+        std = (self._m2 / (self._n_returns - 1)) ** 0.5 if self._n_returns > 1 else np.nan
+        mean = self._mean if self._n_returns > 0 else np.nan
+
+        total_return = (self.last / self.first) - 1
+        volatility = std * (252 ** 0.5)
+        sharpe_ratio = (mean / std) * (252 ** 0.5) if std != 0 else 0
+
+        return {
+            "Total Return": total_return,
+            "Volatility": volatility,
+            "Sharpe Ratio": sharpe_ratio,
+            "Max Drawdown": self.max_drawdown,
+        }
@@ -0,0 +1,412 @@
+"""
+results_store.py
+
+Module providing an embedded, indexed SQLite database of backtest results.
+
+Each run is stored once with its metadata (source, strategy, parameters, timestamp), its
+performance metrics and, optionally, its equity curve. Parameters are also stored one row
+per name/value so runs can be filtered by parameter through an index, and every metric
+has a (strategy, metric) index so ranking queries such as "top 20 by Sharpe for
+sma_crossover" only touch the matching rows. Inserts are batched into one transaction,
+and the database runs in WAL mode so parallel writers queue on a lock instead of failing
+while readers keep working.
+
+The per-run CSV layout written by main.py remains available through export_csv().
+"""
+
+import io
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Metric names as returned by Results, mapped to their database columns
+METRIC_COLUMNS = {
+    "Total Return": "total_return",
+    "Volatility": "volatility",
+    "Sharpe Ratio": "sharpe_ratio",
+    "Max Drawdown": "max_drawdown",
+}
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY,
+        created_at TEXT NOT NULL,
+        source TEXT,
+        source_name TEXT,
+        strategy TEXT NOT NULL,
+        params TEXT NOT NULL,
+        total_return REAL,
+        volatility REAL,
+        sharpe_ratio REAL,
+        max_drawdown REAL,
+        trades INTEGER
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS run_params (
+        run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+        name TEXT NOT NULL,
+        value
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS equity_curves (
+        run_id INTEGER PRIMARY KEY REFERENCES runs(id) ON DELETE CASCADE,
+        dates BLOB NOT NULL,
+        equity BLOB NOT NULL,
+        tz TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_runs_strategy_params ON runs (strategy, params)",
+    "CREATE INDEX IF NOT EXISTS idx_run_params ON run_params (name, value, run_id)",
+    *(f"CREATE INDEX IF NOT EXISTS idx_runs_strategy_{column} ON runs (strategy, {column})" for column in METRIC_COLUMNS.values()),
+]
+
+
+def performance_report(metrics: dict, equity_curve: pd.DataFrame) -> pd.DataFrame:
+    """
+    Builds the per-run CSV layout: a 'Performance Summary' row, a blank row, then the equity curve.
+
+    Parameters
+    ----------
+    metrics : dict
+        Performance metrics dictionary.
+    equity_curve : pd.DataFrame
+        Equity curve with a 'Portfolio Value' column.
+
+    Returns
+    -------
+    pd.DataFrame
+        Combined frame ready to be written with to_csv().
+    """
+    metrics_df = pd.DataFrame([metrics])
+    metrics_df.index = ['Performance Summary']
+
+    empty_row = pd.DataFrame([{}])  # Blank line between metrics and equity curve
+
+    return pd.concat([metrics_df, empty_row, equity_curve])
+
+
+def _to_blob(values: np.ndarray) -> bytes:
+    """
+    Serializes an array (keeping its dtype) to bytes.
+    """
+    buffer = io.BytesIO()
+    np.save(buffer, np.ascontiguousarray(values), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def _from_blob(blob: bytes) -> np.ndarray:
+    """
+    Restores an array serialized by _to_blob().
+    """
+    return np.load(io.BytesIO(blob), allow_pickle=False)
+
+
+def _dates_blob(index: pd.Index) -> tuple:
+    """
+    Serializes an equity curve's index, storing tz-aware dates as naive UTC.
+
+    Returns
+    -------
+    tuple
+        Tuple of (blob, tz), where tz is the index's time zone name or None.
+    """
+    # tz-aware dates convert to an object array, which cannot be saved without pickling
+    tz = getattr(index, "tz", None)
+    if tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return _to_blob(index.to_numpy()), None if tz is None else str(tz)
+
+
+def _dates_index(blob: bytes, tz: str = None) -> pd.Index:
+    """
+    Restores an index serialized by _dates_blob(), converting it back to its time zone.
+    """
+    index = pd.Index(_from_blob(blob), name='Date')
+    if tz is not None:
+        index = index.tz_localize("UTC").tz_convert(tz)
+    return index
+
+
+def _sql_value(value):
+    """
+    Converts NumPy scalars to the Python types sqlite3 accepts.
+    """
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class ResultsStore:
+    """
+    An SQLite database of backtest runs, their metrics and equity curves.
+
+    Parameters
+    ----------
+    path : str
+        Database file (created if missing). Use ':memory:' for a throwaway store.
+    timeout : float
+        Seconds to wait for another process's write lock before failing (default is 30).
+
+    Attributes
+    ----------
+    path : str
+        Database file.
+    connection : sqlite3.Connection
+        Open database connection.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """
+        Opens (and if needed creates) the results database.
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=timeout)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+
+        with self.connection:
+            for statement in _SCHEMA:
+                self.connection.execute(statement)
+
+            # Databases created before time zones were stored lack the tz column
+            columns = {row[1] for row in self.connection.execute("PRAGMA table_info(equity_curves)")}
+            if "tz" not in columns:
+                self.connection.execute("ALTER TABLE equity_curves ADD COLUMN tz TEXT")
+
+    def __enter__(self):
+        """
+        Returns the store for use in a with block.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        """
+        Closes the connection at the end of a with block.
+        """
+        self.close()
+        return False
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self.connection.close()
+
+    def add_run(self, strategy: str, params: dict, metrics: dict, trades: int = None, equity_curve: pd.DataFrame = None, source: str = None, source_name: str = None, created_at: str = None) -> int:
+        """
+        Stores a single run.
+
+        Parameters
+        ----------
+        strategy : str
+            Strategy name.
+        params : dict
+            Strategy parameters.
+        metrics : dict
+            Performance metrics keyed by metric name.
+        trades : int, optional
+            Number of trades executed.
+        equity_curve : pd.DataFrame, optional
+            Equity curve with a 'Portfolio Value' column.
+        source : str, optional
+            Data source ('yahoo', 'csv' or 'binary').
+        source_name : str, optional
+            Ticker or file name the data came from.
+        created_at : str, optional
+            ISO timestamp of the run (default is now).
+
+        Returns
+        -------
+        int
+            Id of the stored run.
+        """
+        return self.add_runs([{
+            "strategy": strategy,
+            "params": params,
+            "metrics": metrics,
+            "trades": trades,
+            "equity_curve": equity_curve,
+            "source": source,
+            "source_name": source_name,
+            "created_at": created_at,
+        }])[0]
+
+    def add_runs(self, runs: list) -> list:
+        """
+        Stores many runs in one transaction; either all of them are stored or none.
+
+        Parameters
+        ----------
+        runs : list
+            Dictionaries with the keyword arguments of add_run().
+
+        Returns
+        -------
+        list
+            Ids of the stored runs, in input order.
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        run_ids = []
+
+        with self.connection:
+            # Take the write lock up front so concurrent writers wait instead of deadlocking
+            self.connection.execute("BEGIN IMMEDIATE")
+
+            for run in runs:
+                params = run.get("params") or {}
+                metrics = run.get("metrics") or {}
+                trades = run.get("trades")
+
+                cursor = self.connection.execute(
+                    "INSERT INTO runs (created_at, source, source_name, strategy, params, "
+                    + ", ".join(METRIC_COLUMNS.values()) + ", trades) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        run.get("created_at") or now,
+                        run.get("source"),
+                        run.get("source_name"),
+                        run["strategy"],
+                        json.dumps(params, sort_keys=True, default=_sql_value),
+                        *(_sql_value(metrics.get(name)) for name in METRIC_COLUMNS),
+                        None if trades is None else int(trades),
+                    ),
+                )
+                run_id = cursor.lastrowid
+                run_ids.append(run_id)
+
+                self.connection.executemany(
+                    "INSERT INTO run_params (run_id, name, value) VALUES (?, ?, ?)",
+                    [(run_id, name, _sql_value(value)) for name, value in params.items()],
+                )
+
+                equity_curve = run.get("equity_curve")
+                if equity_curve is not None:
+                    self.connection.execute(
+                        "INSERT INTO equity_curves (run_id, dates, tz, equity) VALUES (?, ?, ?, ?)",
+                        (run_id, *_dates_blob(equity_curve.index), _to_blob(equity_curve['Portfolio Value'].to_numpy())),
+                    )
+
+        return run_ids
+
+    def top(self, strategy: str, metric: str = "Sharpe Ratio", n: int = 20, params: dict = None, ascending: bool = False) -> pd.DataFrame:
+        """
+        Returns the best runs of a strategy ranked by one metric.
+
+        Parameters
+        ----------
+        strategy : str
+            Strategy name.
+        metric : str
+            Metric to rank by (default is 'Sharpe Ratio').
+        n : int
+            Number of runs to return (default is 20).
+        params : dict, optional
+            Only consider runs with these exact parameter values.
+        ascending : bool
+            Rank lowest first, ex. for 'Max Drawdown' (default is False).
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per run with its id, metadata, parameters, metrics and 'Trades'.
+        """
+        if metric not in METRIC_COLUMNS:
+            raise ValueError(f"Unknown metric: {metric}. Expected one of {list(METRIC_COLUMNS)}.")
+        column = METRIC_COLUMNS[metric]
+
+        query = f"SELECT * FROM runs WHERE strategy = ? AND {column} IS NOT NULL"
+        args = [strategy]
+        for name, value in (params or {}).items():
+            query += " AND id IN (SELECT run_id FROM run_params WHERE name = ? AND value = ?)"
+            args += [name, _sql_value(value)]
+        query += f" ORDER BY {column} {'ASC' if ascending else 'DESC'}, id LIMIT ?"
+        args.append(n)
+
+        return self._runs_frame(self.connection.execute(query, args))
+
+    def get_run(self, run_id: int) -> dict:
+        """
+        Returns one run's metadata, parameters, metrics and trades.
+
+        Parameters
+        ----------
+        run_id : int
+            Id of the run.
+
+        Returns
+        -------
+        dict
+            Run record, with 'params' and 'metrics' as dictionaries.
+        """
+        cursor = self.connection.execute("SELECT * FROM runs WHERE id = ?", (run_id,))
+        row = cursor.fetchone()
+        if row is None:
+            raise KeyError(f"No run with id {run_id}")
+
+        record = dict(zip([description[0] for description in cursor.description], row))
+        record["params"] = json.loads(record["params"])
+        record["metrics"] = {name: record.pop(column) for name, column in METRIC_COLUMNS.items()}
+        return record
+
+    def equity_curve(self, run_id: int) -> pd.DataFrame:
+        """
+        Returns a run's stored equity curve.
+
+        Parameters
+        ----------
+        run_id : int
+            Id of the run.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame containing 'Date' and 'Portfolio Value', indexed by date.
+        """
+        row = self.connection.execute("SELECT dates, tz, equity FROM equity_curves WHERE run_id = ?", (run_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"No equity curve stored for run {run_id}")
+
+        return pd.DataFrame({'Portfolio Value': _from_blob(row[2])}, index=_dates_index(row[0], row[1]))
+
+    def export_csv(self, run_id: int, path: str) -> str:
+        """
+        Writes a run in the per-run CSV layout used by main.py.
+
+        Parameters
+        ----------
+        run_id : int
+            Id of the run.
+        path : str
+            Destination CSV file.
+
+        Returns
+        -------
+        str
+            Path of the written file.
+        """
+        metrics = self.get_run(run_id)["metrics"]
+        performance_report(metrics, self.equity_curve(run_id)).to_csv(path)
+        return path
+
+    def _runs_frame(self, cursor: sqlite3.Cursor) -> pd.DataFrame:
+        """
+        Turns rows of the runs table into a DataFrame with parameters expanded into columns.
+        """
+        columns = [description[0] for description in cursor.description]
+        records = []
+        for row in cursor.fetchall():
+            record = dict(zip(columns, row))
+            params = json.loads(record.pop("params"))
+            metrics = {name: record.pop(column) for name, column in METRIC_COLUMNS.items()}
+            trades = record.pop("trades")
+            records.append({**record, **params, **metrics, "Trades": trades})
+
+        return pd.DataFrame(records)
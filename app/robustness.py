@@ -0,0 +1,193 @@
+"""
+robustness.py
+
+Module providing Monte Carlo robustness analysis of a finished equity curve.
+
+The curve's daily returns are resampled into thousands of alternative paths, and the
+spread of each path's total return, Sharpe ratio and max drawdown gives confidence
+intervals for the observed metrics. Two resampling schemes are available:
+
+- 'bootstrap': circular moving-block bootstrap. Blocks of consecutive returns are drawn
+  with replacement, keeping short-range dependence such as volatility clustering.
+- 'permutation': every path shuffles the order of the same returns. Total return and
+  Sharpe ratio are unchanged by reordering, so this isolates how much the drawdown
+  depends on the sequence in which gains and losses happened.
+
+Paths are generated and evaluated as 2-D arrays (paths x days), in chunks sized so the
+working arrays stay within a memory budget.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Metrics estimated for every simulated path, in report order
+METRICS = ["Total Return", "Sharpe Ratio", "Max Drawdown"]
+METHODS = ("bootstrap", "permutation")
+
+# Default budget for one chunk's working arrays
+DEFAULT_MAX_BYTES = 64 * 2 ** 20
+
+# Number of path-sized arrays alive at once while a chunk is evaluated
+_ARRAYS_PER_CHUNK = 4
+
+
+def path_metrics(returns: np.ndarray) -> dict:
+    """
+    Computes total return, Sharpe ratio and max drawdown for every row of a returns matrix.
+
+    Definitions match Results.calculate_performance_metrics(): sample standard deviation,
+    252 periods per year, a Sharpe ratio of 0 for flat paths, and drawdowns measured from
+    a starting equity of 1.
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        2-D array of per-period returns, one path per row.
+
+    Returns
+    -------
+    dict
+        Mapping of metric name to a 1-D array with one value per path.
+    """
+    mean = returns.mean(axis=1)
+    std = returns.std(axis=1, ddof=1) if returns.shape[1] > 1 else np.full(len(returns), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(std != 0, mean / std * (252 ** 0.5), 0.0)
+
+    # Equity paths are built in place to keep one path-sized array per step
+    equity = np.add(returns, 1.0)
+    np.cumprod(equity, axis=1, out=equity)
+    total_return = equity[:, -1] - 1
+
+    peak = np.maximum.accumulate(equity, axis=1)
+    np.maximum(peak, 1.0, out=peak)
+    np.subtract(peak, equity, out=equity)
+    np.divide(equity, peak, out=equity)
+    max_drawdown = equity.max(axis=1)
+
+    return {"Total Return": total_return, "Sharpe Ratio": sharpe, "Max Drawdown": max_drawdown}
+
+
+def block_bootstrap_indices(starts: np.ndarray, n_returns: int, block_size: int) -> np.ndarray:
+    """
+    Expands block start positions into circular moving-block resampling indices.
+
+    Parameters
+    ----------
+    starts : np.ndarray
+        2-D array (paths x blocks) of block start positions.
+    n_returns : int
+        Number of returns in the original series (and in each path).
+    block_size : int
+        Number of consecutive returns per block.
+
+    Returns
+    -------
+    np.ndarray
+        2-D array (paths x n_returns) of indices into the original returns.
+    """
+    offsets = np.arange(block_size)
+    indices = (starts[:, :, None] + offsets) % n_returns
+    return indices.reshape(len(starts), -1)[:, :n_returns]
+
+
+def simulate_metrics(returns, n_paths: int = 10000, method: str = "bootstrap", block_size: int = 20, seed: int = None, max_bytes: int = DEFAULT_MAX_BYTES) -> pd.DataFrame:
+    """
+    Resamples a return series into many paths and computes each path's metrics.
+
+    Parameters
+    ----------
+    returns : array-like
+        Per-period returns of the original equity curve.
+    n_paths : int
+        Number of simulated paths (default is 10,000).
+    method : str
+        'bootstrap' or 'permutation' (default is 'bootstrap').
+    block_size : int
+        Block length of the bootstrap (default is 20 periods, about a trading month).
+    seed : int, optional
+        Random seed; bootstrap results depend only on the seed, permutation results on
+        the seed and max_bytes.
+    max_bytes : int
+        Memory budget for one chunk of paths (default is 64 MB).
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per path with 'Total Return', 'Sharpe Ratio' and 'Max Drawdown' columns.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method}. Expected one of {METHODS}.")
+
+    returns = np.asarray(returns, dtype=np.float64)
+    n_returns = len(returns)
+    if n_returns < 2:
+        raise ValueError("At least two returns are needed for a robustness analysis.")
+
+    rng = np.random.default_rng(seed)
+    block_size = max(1, min(block_size, n_returns))
+    n_blocks = -(-n_returns // block_size)
+
+    chunk_size = max(1, max_bytes // (n_returns * 8 * _ARRAYS_PER_CHUNK))
+    results = {metric: np.empty(n_paths) for metric in METRICS}
+
+    # Block starts are small (one per block, not per return), so draw them all up front
+    if method == "bootstrap":
+        all_starts = rng.integers(0, n_returns, size=(n_paths, n_blocks))
+
+    for start in range(0, n_paths, chunk_size):
+        stop = min(start + chunk_size, n_paths)
+
+        if method == "bootstrap":
+            paths = returns[block_bootstrap_indices(all_starts[start:stop], n_returns, block_size)]
+        else:
+            # Independent shuffle of every row in a single call
+            paths = rng.permuted(np.broadcast_to(returns, (stop - start, n_returns)), axis=1)
+
+        for metric, values in path_metrics(paths).items():
+            results[metric][start:stop] = values
+
+    return pd.DataFrame(results, columns=METRICS)
+
+
+def robustness_report(equity_curve: pd.DataFrame, n_paths: int = 10000, method: str = "bootstrap", confidence: float = 0.95, block_size: int = 20, seed: int = None, max_bytes: int = DEFAULT_MAX_BYTES) -> pd.DataFrame:
+    """
+    Estimates confidence intervals for an equity curve's total return, Sharpe ratio and max drawdown.
+
+    Parameters
+    ----------
+    equity_curve : pd.DataFrame
+        Equity curve with a 'Portfolio Value' column.
+    n_paths : int
+        Number of simulated paths (default is 10,000).
+    method : str
+        'bootstrap' or 'permutation' (default is 'bootstrap').
+    confidence : float
+        Two-sided confidence level of the intervals (default is 0.95).
+    block_size : int
+        Block length of the bootstrap (default is 20 periods).
+    seed : int, optional
+        Random seed for reproducible results.
+    max_bytes : int
+        Memory budget for one chunk of paths (default is 64 MB).
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per metric with 'Observed', 'Lower', 'Median' and 'Upper' columns.
+    """
+    values = equity_curve['Portfolio Value'].to_numpy(dtype=np.float64)
+    returns = values[1:] / values[:-1] - 1
+
+    observed = path_metrics(returns[None, :])
+    samples = simulate_metrics(returns, n_paths, method, block_size, seed, max_bytes)
+
+    tail = (1 - confidence) / 2
+    quantiles = samples.quantile([tail, 0.5, 1 - tail])
+
+    return pd.DataFrame({
+        "Observed": [observed[metric][0] for metric in METRICS],
+        "Lower": quantiles.iloc[0].to_numpy(),
+        "Median": quantiles.iloc[1].to_numpy(),
+        "Upper": quantiles.iloc[2].to_numpy(),
+    }, index=pd.Index(METRICS, name="Metric"))
@@ -0,0 +1,178 @@
+"""
+shared_data.py
+
+Module providing zero-copy sharing of loaded price data with process-pool workers.
+
+The owning process copies the 'Close' series and the index into one shared memory segment
+and hands workers a small picklable handle instead of the DataFrame, so starting a worker
+no longer pickles the whole price history. Workers attach to the segment and wrap it in a
+DataFrame of read-only views without copying.
+
+The owner unlinks the segment when the run ends (SharedPrices is a context manager), and
+again at interpreter exit if that was skipped. Workers never unlink, so a crashed worker
+cannot remove or leak the segment; if the owner itself is killed, multiprocessing's
+resource tracker unlinks the segment.
+"""
+
+import weakref
+from multiprocessing import shared_memory
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+# Segments attached in this process, kept open for the lifetime of their views
+_ATTACHED = {}
+
+
+class SharedPricesHandle(NamedTuple):
+    """
+    Picklable description of a shared price segment, passed to workers.
+
+    Attributes
+    ----------
+    name : str
+        Shared memory segment name.
+    rows : int
+        Number of bars.
+    index_dtype : str
+        NumPy dtype of the stored index values (ex. 'datetime64[ns]', 'int64').
+    tz : str
+        Time zone of a tz-aware DatetimeIndex (stored as UTC), or None.
+    index_name : str
+        Name of the index.
+    """
+
+    name: str
+    rows: int
+    index_dtype: str
+    tz: str
+    index_name: str
+
+
+def _release(segment: shared_memory.SharedMemory):
+    """
+    Closes and unlinks a segment owned by this process, ignoring one already removed.
+    """
+    segment.close()
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class SharedPrices:
+    """
+    Owner of a shared memory copy of a price DataFrame's 'Close' series and index.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Price data with a 'Close' column and a datetime or numeric index. Other columns
+        are not shared.
+
+    Attributes
+    ----------
+    handle : SharedPricesHandle
+        Description of the segment to pass to attach_prices() in workers.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Creates the shared segment and copies the index and closing prices into it.
+        """
+        close = data["Close"]
+        if isinstance(close, pd.DataFrame):
+            close = close.iloc[:, 0]
+        close = close.to_numpy(dtype=np.float64)
+
+        # tz-aware dates are stored as UTC and converted back on attach
+        index = data.index
+        tz = getattr(index, "tz", None)
+        if tz is not None:
+            index = index.tz_convert("UTC").tz_localize(None)
+        index_values = index.to_numpy()
+        if index_values.dtype.kind not in "Mmiuf" or index_values.dtype.itemsize != 8:
+            raise TypeError(f"Cannot share an index of dtype {index_values.dtype}; expected datetimes or 64-bit numbers.")
+
+        rows = len(close)
+        self._segment = shared_memory.SharedMemory(create=True, size=max(16 * rows, 1))
+
+        # Unlink at interpreter exit even if close() is never called
+        self._finalizer = weakref.finalize(self, _release, self._segment)
+
+        # Layout: index values, then closing prices, 8 bytes each
+        np.ndarray(rows, dtype=index_values.dtype, buffer=self._segment.buf)[:] = index_values
+        np.ndarray(rows, dtype=np.float64, buffer=self._segment.buf, offset=8 * rows)[:] = close
+
+        self.handle = SharedPricesHandle(self._segment.name, rows, str(index_values.dtype), None if tz is None else str(tz), data.index.name)
+
+    def __enter__(self):
+        """
+        Returns the shared prices for use in a with block.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        """
+        Releases the segment at the end of a with block, including on errors.
+        """
+        self.close()
+        return False
+
+    def close(self):
+        """
+        Closes and unlinks the segment; safe to call more than once.
+        """
+        self._finalizer()
+
+
+def attach_prices(handle: SharedPricesHandle) -> pd.DataFrame:
+    """
+    Attaches to a shared price segment and returns it as a DataFrame of read-only views.
+
+    Parameters
+    ----------
+    handle : SharedPricesHandle
+        Handle created by SharedPrices in the owning process.
+
+    Returns
+    -------
+    pd.DataFrame
+        Price data with a 'Close' column, backed by the shared segment without copying.
+    """
+    segment = _ATTACHED.get(handle.name)
+    if segment is None:
+        segment = _ATTACHED[handle.name] = shared_memory.SharedMemory(name=handle.name)
+
+    index_values = np.ndarray(handle.rows, dtype=handle.index_dtype, buffer=segment.buf)
+    close = np.ndarray(handle.rows, dtype=np.float64, buffer=segment.buf, offset=8 * handle.rows)
+    index_values.flags.writeable = False
+    close.flags.writeable = False
+
+    if index_values.dtype.kind == "M":
+        index = pd.DatetimeIndex(index_values, name=handle.index_name, copy=False)
+        if handle.tz is not None:
+            index = index.tz_localize("UTC").tz_convert(handle.tz)
+    else:
+        index = pd.Index(index_values, name=handle.index_name, copy=False)
+
+    # copy=False keeps pandas pointing at the shared segment
+    return pd.DataFrame({"Close": close}, index=index, copy=False)
+
+
+def detach_prices(handle: SharedPricesHandle = None):
+    """
+    Closes this process's attachment to one segment, or to all of them.
+
+    Parameters
+    ----------
+    handle : SharedPricesHandle, optional
+        Segment to detach from (default is every attached segment). DataFrames returned
+        by attach_prices() for it must no longer be used.
+    """
+    names = list(_ATTACHED) if handle is None else [handle.name]
+    for name in names:
+        segment = _ATTACHED.pop(name, None)
+        if segment is not None:
+            segment.close()
@@ -1,17 +1,71 @@
 """
 __init__.py
 
-Imports all strategy classes for easy access from the strategies module.
+Registry of the available strategies, imported lazily.
+
+Strategies are looked up by name ('sma_crossover', 'rsi_threshold', ...) and a strategy's
+module is only imported the first time it is requested. The strategy classes remain
+importable from this package (ex. from app.strategies import SMACrossoverStrategy); the
+matching module is imported on that access.
 """
 
-from .sma_crossover import SMACrossoverStrategy
-from .rsi_threshold import RSIThresholdStrategy
-from .golden_cross import GoldenCrossStrategy
-from .momentum import MomentumStrategy
+import importlib
+
+# Strategy name -> (module within this package, class name, menu label), in menu order
+STRATEGY_REGISTRY = {
+    "sma_crossover": ("sma_crossover", "SMACrossoverStrategy", "SMA Crossover Strategy"),
+    "rsi_threshold": ("rsi_threshold", "RSIThresholdStrategy", "RSI Threshold Strategy"),
+    "golden_cross": ("golden_cross", "GoldenCrossStrategy", "Golden Cross Strategy"),
+    "momentum": ("momentum", "MomentumStrategy", "Momentum Strategy (Rate of Change)"),
+}
+
+# Class name -> strategy name, for attribute access to the classes
+_CLASS_NAMES = {class_name: name for name, (_, class_name, _) in STRATEGY_REGISTRY.items()}
 
 __all__ = [
     "SMACrossoverStrategy",
     "RSIThresholdStrategy",
     "GoldenCrossStrategy",
-    "MomentumStrategy"
-]
\ No newline at end of file
+    "MomentumStrategy",
+    "STRATEGY_REGISTRY",
+    "get_strategy_class",
+    "strategy_names",
+]
+
+
+def strategy_names() -> list:
+    """
+    Returns the registered strategy names in menu order.
+    """
+    return list(STRATEGY_REGISTRY)
+
+
+def get_strategy_class(strategy_name: str) -> type:
+    """
+    Returns the class registered under a strategy name, importing its module on first use.
+
+    Parameters
+    ----------
+    strategy_name : str
+        Registered strategy name (ex. 'sma_crossover').
+
+    Returns
+    -------
+    type
+        The strategy class.
+    """
+    if strategy_name not in STRATEGY_REGISTRY:
+        raise ValueError(f"Unknown strategy name: {strategy_name}")
+
+    module_name, class_name, _ = STRATEGY_REGISTRY[strategy_name]
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, class_name)
+
+
+def __getattr__(name: str):
+    """
+    Resolves the strategy classes on first attribute access.
+    """
+    if name in _CLASS_NAMES:
+        return get_strategy_class(_CLASS_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,7 @@ Strategy that generates long-term trading decisions based on 50-day and 200-day
 """
 
 import pandas as pd
+from app.indicators import IndicatorCache, crossover_events, indicator_cache as default_indicator_cache
 
 class GoldenCrossStrategy:
     """
@@ -14,53 +15,87 @@ class GoldenCrossStrategy:
     ----------
     data : pd.DataFrame
         Historical market data.
+    indicator_cache : IndicatorCache, optional
+        Cache to request SMA series from (default is the shared process-wide cache).
 
     Attributes
     ----------
     data : pd.DataFrame
-        Market data with computed 50-day and 200-day SMAs.
+        Market data with computed 50-day and 200-day SMAs and crossover events.
+    indicator_cache : IndicatorCache
+        Cache the SMA series are requested from.
+    lookback : int
+        Number of leading bars on which the strategy cannot signal.
     """
 
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, indicator_cache: IndicatorCache = None):
         """
         Initializes GoldenCrossStrategy and calculates moving averages.
         """
         self.data = data.copy()
+        self.indicator_cache = indicator_cache or default_indicator_cache
+        self.lookback = self.required_lookback()
 
-        # Calculate 50-day and 200-day SMAs
-        self.data['sma_50'] = self.data['Close'].rolling(window=50).mean()
-        self.data['sma_200'] = self.data['Close'].rolling(window=200).mean()
+        # Calculate 50-day and 200-day SMAs, shared with any SMA crossover using the same windows
+        fingerprint = self.indicator_cache.fingerprint(self.data['Close'])
+        self.data['sma_50'] = self.indicator_cache.sma(self.data['Close'], 50, fingerprint)
+        self.data['sma_200'] = self.indicator_cache.sma(self.data['Close'], 200, fingerprint)
 
-    def should_buy(self, row: pd.Series) -> bool:
+        # Precompute cross events once instead of looking up the previous row per bar
+        self._calculate_crossovers()
+
+    @classmethod
+    def required_lookback(cls) -> int:
         """
-        Determines whether to buy based on Golden Cross.
+        Returns the number of leading bars on which the strategy cannot signal.
         """
-        # Get the integer index of the current row
-        row_idx = self.data.index.get_loc(row.name)
+        # A crossover needs the 200-day SMA on the current and the previous bar
+        return 200
 
-        # Prevent index error on the first row
-        if row_idx == 0:
-            return False
-        
-        # Get previous row's SMA values
-        prev = self.data.iloc[row_idx - 1]
+    def _calculate_crossovers(self):
+        """
+        Precomputes Golden Cross (1) and Death Cross (-1) events in a 'crossover' column.
+        """
+        self.data['crossover'] = crossover_events(self.data['sma_50'], self.data['sma_200'])
 
+    def should_buy(self, row: pd.Series) -> bool:
+        """
+        Determines whether to buy based on Golden Cross.
+        """
         # Buy signal: 50-day SMA crosses above 200-day SMA
-        return (prev['sma_50'] <= prev['sma_200']) and (row['sma_50'] > row['sma_200'])
+        return row['crossover'] == 1
 
     def should_sell(self, row: pd.Series) -> bool:
         """
         Determines whether to sell based on Death Cross.
         """
-        # Get the integer index of the current row
-        row_idx = self.data.index.get_loc(row.name)
+        # Sell signal: 50-day SMA crosses below 200-day SMA
+        return row['crossover'] == -1
 
-        # Prevent index error on the first row
-        if row_idx == 0:
-            return False
-        
-        # Get previous row's SMA values
-        prev = self.data.iloc[row_idx - 1]
+    def generate_signals(self) -> tuple:
+        """
+        Computes Golden Cross buy and Death Cross sell signals for every row at once.
 
-        # Sell signal: 50-day SMA crosses below 200-day SMA
-        return (prev['sma_50'] >= prev['sma_200']) and (row['sma_50'] < row['sma_200'])
\ No newline at end of file
+        Returns
+        -------
+        tuple
+            Tuple of (buy, sell) boolean NumPy arrays aligned with self.data.
+        """
+        crossover = self.data['crossover'].to_numpy()
+        return crossover == 1, crossover == -1
+
+    @classmethod
+    def generate_panel_signals(cls, prices: pd.DataFrame) -> tuple:
+        """
+        Computes Golden Cross and Death Cross signals for every asset of a dates x tickers price panel at once.
+
+        Returns
+        -------
+        tuple
+            Tuple of (buy, sell) 2-D boolean NumPy arrays shaped like prices.
+        """
+        crossover = crossover_events(
+            prices.rolling(window=50).mean().to_numpy(),
+            prices.rolling(window=200).mean().to_numpy(),
+        )
+        return crossover == 1, crossover == -1
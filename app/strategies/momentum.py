@@ -5,6 +5,7 @@ Strategy that generates trading decisions based on rate of change (momentum).
 """
 
 import pandas as pd
+from app.indicators import IndicatorCache, indicator_cache as default_indicator_cache
 
 class MomentumStrategy:
     """
@@ -18,6 +19,8 @@ class MomentumStrategy:
         Lookback period for rate of change (default is 20).
     roc_threshold : float
         Minimum ROC value to trigger a buy (default is 0).
+    indicator_cache : IndicatorCache, optional
+        Cache to request the ROC series from (default is the shared process-wide cache).
 
     Attributes
     ----------
@@ -27,18 +30,32 @@ class MomentumStrategy:
         Rate of change calculation window.
     roc_threshold : float
         Threshold value for buy trigger.
+    indicator_cache : IndicatorCache
+        Cache the ROC series is requested from.
+    lookback : int
+        Number of leading bars on which the strategy cannot signal.
     """
 
-    def __init__(self, data: pd.DataFrame, roc_period: int = 20, roc_threshold: float = 0.0):
+    def __init__(self, data: pd.DataFrame, roc_period: int = 20, roc_threshold: float = 0.0, indicator_cache: IndicatorCache = None):
         """
         Initializes MomentumStrategy and calculates the rate of change (ROC).
         """
         self.data = data.copy()
         self.roc_period = roc_period
         self.roc_threshold = roc_threshold
+        self.indicator_cache = indicator_cache or default_indicator_cache
+        self.lookback = self.required_lookback(roc_period, roc_threshold)
 
         # Calculate the Rate of Change (ROC)
-        self.data['ROC'] = self.data['Close'].pct_change(periods=self.roc_period)
+        self.data['ROC'] = self.indicator_cache.roc(self.data['Close'], self.roc_period)
+
+    @classmethod
+    def required_lookback(cls, roc_period: int = 20, roc_threshold: float = 0.0) -> int:
+        """
+        Returns the number of leading bars on which the strategy cannot signal for the given parameters.
+        """
+        # The rate of change compares each close with the one roc_period bars earlier
+        return roc_period
 
     def should_buy(self, row: pd.Series) -> bool:
         """
@@ -51,3 +68,29 @@ class MomentumStrategy:
         Determines whether to sell based on rate of change.
         """
         return row['ROC'] < 0
+
+    def generate_signals(self) -> tuple:
+        """
+        Computes rate of change buy and sell signals for every row at once.
+
+        Returns
+        -------
+        tuple
+            Tuple of (buy, sell) boolean NumPy arrays aligned with self.data.
+        """
+        roc = self.data['ROC'].to_numpy(dtype=float)
+        return roc >= self.roc_threshold, roc < 0
+
+    @classmethod
+    def generate_panel_signals(cls, prices: pd.DataFrame, roc_period: int = 20, roc_threshold: float = 0.0) -> tuple:
+        """
+        Computes rate of change signals for every asset of a dates x tickers price panel at once.
+
+        Returns
+        -------
+        tuple
+            Tuple of (buy, sell) 2-D boolean NumPy arrays shaped like prices.
+        """
+        # Missing prices stay missing instead of being padded into a zero return
+        roc = prices.pct_change(periods=roc_period, fill_method=None).to_numpy()
+        return roc >= roc_threshold, roc < 0
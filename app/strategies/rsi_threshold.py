@@ -5,6 +5,7 @@ Strategy that generates trading decisions based on Relative Strength Index (RSI)
 """
 
 import pandas as pd
+from app.indicators import IndicatorCache, compute_rsi, indicator_cache as default_indicator_cache
 
 class RSIThresholdStrategy:
     """
@@ -18,6 +19,8 @@ class RSIThresholdStrategy:
         RSI value below which to buy (default is 30).
     sell_threshold : float
         RSI value above which to sell (default is 70).
+    indicator_cache : IndicatorCache, optional
+        Cache to request the RSI series from (default is the shared process-wide cache).
 
     Attributes
     ----------
@@ -27,36 +30,41 @@ class RSIThresholdStrategy:
         Buy threshold for RSI.
     sell_threshold : float
         Sell threshold for RSI.
+    indicator_cache : IndicatorCache
+        Cache the RSI series is requested from.
+    lookback : int
+        Number of leading bars on which the strategy cannot signal.
     """
 
-    def __init__(self, data: pd.DataFrame, buy_threshold: float = 30.0, sell_threshold: float = 70.0):
+    # RSI lookback period
+    RSI_PERIOD = 14
+
+    def __init__(self, data: pd.DataFrame, buy_threshold: float = 30.0, sell_threshold: float = 70.0, indicator_cache: IndicatorCache = None):
         """
         Initializes RSIThresholdStrategy and calculates RSI.
         """
         self.data = data.copy()
         self.buy_threshold = buy_threshold
         self.sell_threshold = sell_threshold
+        self.indicator_cache = indicator_cache or default_indicator_cache
+        self.lookback = self.required_lookback(buy_threshold, sell_threshold)
 
         # Calculate the RSI
         self._calculate_rsi()
 
-    def _calculate_rsi(self, period: int = 14):
+    @classmethod
+    def required_lookback(cls, buy_threshold: float = 30.0, sell_threshold: float = 70.0) -> int:
         """
-        Calculates the Relative Strength Index (RSI).
+        Returns the number of leading bars on which the strategy cannot signal for the given parameters.
         """
-        delta = self.data['Close'].diff()
-
-        # Separate gains and losses
-        gain = delta.clip(lower=0)
-        loss = -delta.clip(upper=0)
-
-        # Calculate average gains and losses
-        avg_gain = gain.rolling(window=period).mean()
-        avg_loss = loss.rolling(window=period).mean()
+        # The RSI averages RSI_PERIOD price changes, so the first RSI_PERIOD closes have no value
+        return cls.RSI_PERIOD
 
-        # Compute the RSI
-        rs = avg_gain / avg_loss
-        self.data['RSI'] = 100 - (100 / (1 + rs))
+    def _calculate_rsi(self, period: int = RSI_PERIOD):
+        """
+        Calculates the Relative Strength Index (RSI).
+        """
+        self.data['RSI'] = self.indicator_cache.rsi(self.data['Close'], period)
 
     def should_buy(self, row: pd.Series) -> bool:
         """
@@ -68,4 +76,29 @@ class RSIThresholdStrategy:
         """
         Determines whether to sell based on RSI threshold.
         """
-        return row['RSI'] >= self.sell_threshold
\ No newline at end of file
+        return row['RSI'] >= self.sell_threshold
+
+    def generate_signals(self) -> tuple:
+        """
+        Computes RSI threshold buy and sell signals for every row at once.
+
+        Returns
+        -------
+        tuple
+            Tuple of (buy, sell) boolean NumPy arrays aligned with self.data.
+        """
+        rsi = self.data['RSI'].to_numpy(dtype=float)
+        return rsi <= self.buy_threshold, rsi >= self.sell_threshold
+
+    @classmethod
+    def generate_panel_signals(cls, prices: pd.DataFrame, buy_threshold: float = 30.0, sell_threshold: float = 70.0) -> tuple:
+        """
+        Computes RSI threshold signals for every asset of a dates x tickers price panel at once.
+
+        Returns
+        -------
+        tuple
+            Tuple of (buy, sell) 2-D boolean NumPy arrays shaped like prices.
+        """
+        rsi = compute_rsi(prices).to_numpy()
+        return rsi <= buy_threshold, rsi >= sell_threshold
@@ -5,6 +5,7 @@ Strategy that generates trading decisions based on short and long simple moving
 """
 
 import pandas as pd
+from app.indicators import IndicatorCache, crossover_events, indicator_cache as default_indicator_cache
 
 class SMACrossoverStrategy:
     """
@@ -18,75 +19,96 @@ class SMACrossoverStrategy:
         Period for short-term SMA (default is 20).
     long_window : int
         Period for long-term SMA (default is 50).
+    indicator_cache : IndicatorCache, optional
+        Cache to request SMA series from (default is the shared process-wide cache).
 
     Attributes
     ----------
     data : pd.DataFrame
-        Market data with computed short and long SMAs.
+        Market data with computed short and long SMAs and crossover events.
     short_window : int
         Short-term moving average window.
     long_window : int
         Long-term moving average window.
+    indicator_cache : IndicatorCache
+        Cache the SMA series are requested from.
+    lookback : int
+        Number of leading bars on which the strategy cannot signal.
     """
 
-    def __init__(self, data: pd.DataFrame, short_window: int = 20, long_window: int = 50):
+    def __init__(self, data: pd.DataFrame, short_window: int = 20, long_window: int = 50, indicator_cache: IndicatorCache = None):
         """
         Initializes SMACrossoverStrategy and calculates moving averages.
         """
         self.data = data.copy()
         self.short_window = short_window
         self.long_window = long_window
+        self.indicator_cache = indicator_cache or default_indicator_cache
+        self.lookback = self.required_lookback(short_window, long_window)
 
-        # Calculates short and long term SMAs
-        self.data['short_sma'] = self.data['Close'].rolling(window=self.short_window).mean()
-        self.data['long_sma'] = self.data['Close'].rolling(window=self.long_window).mean()
+        # Calculates short and long term SMAs, reusing cached series where available
+        fingerprint = self.indicator_cache.fingerprint(self.data['Close'])
+        self.data['short_sma'] = self.indicator_cache.sma(self.data['Close'], self.short_window, fingerprint)
+        self.data['long_sma'] = self.indicator_cache.sma(self.data['Close'], self.long_window, fingerprint)
 
-    def should_buy(self, row: pd.Series) -> bool:
+        # Precompute crossover events once instead of looking up the previous row per bar
+        self._calculate_crossovers()
+
+    @classmethod
+    def required_lookback(cls, short_window: int = 20, long_window: int = 50) -> int:
         """
-        Determines whether to buy based on SMA crossover.
+        Returns the number of leading bars on which the strategy cannot signal for the given parameters.
         """
-        # Skip rows where moving averages are not available yet
-        if pd.isna(row['short_sma']) or pd.isna(row['long_sma']):
-            return False
-
-        # Get the integer location of the current row
-        row_idx = self.data.index.get_loc(row.name)
-
-        # Prevents error on the very first row
-        if row_idx == 0:
-            return False
+        # A crossover needs both SMAs on the current and the previous bar
+        return max(short_window, long_window)
 
-        # Get previous row's short and long SMA values
-        prev = self.data.iloc[row_idx - 1]
+    def _calculate_crossovers(self):
+        """
+        Precomputes crossover events so per-row decisions are a single column read.
 
-        # Skip if previous row also has NaNs
-        if pd.isna(prev['short_sma']) or pd.isna(prev['long_sma']):
-            return False
+        The 'crossover' column is 1 where the short SMA crosses above the long SMA,
+        -1 where it crosses below, and 0 otherwise (including the NaN warm-up rows).
+        """
+        self.data['crossover'] = crossover_events(self.data['short_sma'], self.data['long_sma'])
 
+    def should_buy(self, row: pd.Series) -> bool:
+        """
+        Determines whether to buy based on SMA crossover.
+        """
         # Buy if short SMA crosses above long SMA
-        return (prev['short_sma'] <= prev['long_sma']) and (row['short_sma'] > row['long_sma'])
+        return row['crossover'] == 1
 
     def should_sell(self, row: pd.Series) -> bool:
         """
         Determines whether to sell based on SMA crossover.
         """
-        # Skip rows where moving averages are not available yet
-        if pd.isna(row['short_sma']) or pd.isna(row['long_sma']):
-            return False
-
-        # Get the integer location of the current row
-        row_idx = self.data.index.get_loc(row.name)
+        # Sell if short SMA crosses below long SMA
+        return row['crossover'] == -1
 
-        # Prevents error on the very first row
-        if row_idx == 0:
-            return False
+    def generate_signals(self) -> tuple:
+        """
+        Computes buy and sell signals for every row at once.
 
-        # Get previous row's short and long SMA values
-        prev = self.data.iloc[row_idx - 1]
+        Returns
+        -------
+        tuple
+            Tuple of (buy, sell) boolean NumPy arrays aligned with self.data.
+        """
+        crossover = self.data['crossover'].to_numpy()
+        return crossover == 1, crossover == -1
 
-        # Skip if previous row also has NaNs
-        if pd.isna(prev['short_sma']) or pd.isna(prev['long_sma']):
-            return False
+    @classmethod
+    def generate_panel_signals(cls, prices: pd.DataFrame, short_window: int = 20, long_window: int = 50) -> tuple:
+        """
+        Computes buy and sell signals for every asset of a dates x tickers price panel at once.
 
-        # Sell if short SMA crosses below long SMA
-        return (prev['short_sma'] >= prev['long_sma']) and (row['short_sma'] < row['long_sma'])
\ No newline at end of file
+        Returns
+        -------
+        tuple
+            Tuple of (buy, sell) 2-D boolean NumPy arrays shaped like prices.
+        """
+        crossover = crossover_events(
+            prices.rolling(window=short_window).mean().to_numpy(),
+            prices.rolling(window=long_window).mean().to_numpy(),
+        )
+        return crossover == 1, crossover == -1
@@ -0,0 +1,445 @@
+"""
+streaming.py
+
+Module providing a bar-by-bar backtesting mode for live or replayed price feeds.
+
+Strategies here keep online indicator state and update it in constant time per bar
+(running-sum SMA, ring-buffer rate of change, running RSI gain/loss averages) instead of
+recomputing indicators over the whole history. The rolling mean follows the same
+compensated running-sum update as pandas' rolling().mean(), so on historical data the
+streaming path reproduces the batch strategies' signals and equity exactly.
+"""
+
+import math
+from collections import deque
+
+class RollingMean:
+    """
+    Online simple moving average with O(1) updates.
+
+    Mirrors pandas' rolling(window).mean() arithmetic: Kahan-compensated running sums for
+    added and removed values, NaN values skipped, and the same corrections for runs of
+    identical values and all-negative or all-positive windows.
+
+    Parameters
+    ----------
+    window : int
+        Number of observations in the moving window.
+
+    Attributes
+    ----------
+    window : int
+        Moving window length.
+    value : float
+        Current moving average (NaN until the window is full).
+    """
+
+    def __init__(self, window: int):
+        """
+        Initializes an empty rolling mean.
+        """
+        self.window = window
+        self.value = math.nan
+        self._buffer = deque()
+        self._nobs = 0
+        self._neg_ct = 0
+        self._sum = 0.0
+        self._compensation_add = 0.0
+        self._compensation_remove = 0.0
+        self._same_count = 0
+        self._prev_value = None
+
+    def update(self, value: float) -> float:
+        """
+        Adds one observation and returns the updated moving average.
+        """
+        if self._prev_value is None:
+            self._prev_value = value
+
+        # Drop the observation leaving the window before adding the new one
+        if len(self._buffer) == self.window:
+            self._remove(self._buffer.popleft())
+        self._buffer.append(value)
+        self._add(value)
+
+        self.value = self._mean()
+        return self.value
+
+    def _add(self, value: float):
+        """
+        Adds a value to the compensated running sum.
+        """
+        if value != value:
+            return
+
+        self._nobs += 1
+        y = value - self._compensation_add
+        t = self._sum + y
+        self._compensation_add = t - self._sum - y
+        self._sum = t
+        if math.copysign(1.0, value) < 0:
+            self._neg_ct += 1
+
+        # Track runs of identical values so a constant window returns that value exactly
+        if value == self._prev_value:
+            self._same_count += 1
+        else:
+            self._same_count = 1
+        self._prev_value = value
+
+    def _remove(self, value: float):
+        """
+        Removes a value from the compensated running sum.
+        """
+        if value != value:
+            return
+
+        self._nobs -= 1
+        y = -value - self._compensation_remove
+        t = self._sum + y
+        self._compensation_remove = t - self._sum - y
+        self._sum = t
+        if math.copysign(1.0, value) < 0:
+            self._neg_ct -= 1
+
+    def _mean(self) -> float:
+        """
+        Returns the current mean, or NaN while fewer than window observations are available.
+        """
+        if self._nobs < self.window or self._nobs == 0:
+            return math.nan
+
+        result = self._sum / self._nobs
+        if self._same_count >= self._nobs:
+            result = self._prev_value
+        elif self._neg_ct == 0 and result < 0:
+            result = 0.0
+        elif self._neg_ct == self._nobs and result > 0:
+            result = 0.0
+        return result
+
+
+class RateOfChange:
+    """
+    Online rate of change over a fixed number of bars, backed by a ring buffer.
+
+    Parameters
+    ----------
+    period : int
+        Number of bars to look back.
+
+    Attributes
+    ----------
+    period : int
+        Lookback period.
+    value : float
+        Current rate of change (NaN until period + 1 prices have been seen).
+    """
+
+    def __init__(self, period: int):
+        """
+        Initializes an empty rate of change tracker.
+        """
+        self.period = period
+        self.value = math.nan
+        self._buffer = deque(maxlen=period + 1)
+
+    def update(self, price: float) -> float:
+        """
+        Adds one price and returns the updated rate of change.
+        """
+        self._buffer.append(price)
+        self.value = price / self._buffer[0] - 1 if len(self._buffer) > self.period else math.nan
+        return self.value
+
+
+class RelativeStrengthIndex:
+    """
+    Online RSI from rolling means of gains and losses, with O(1) updates.
+
+    Parameters
+    ----------
+    period : int
+        RSI lookback period (default is 14).
+
+    Attributes
+    ----------
+    period : int
+        RSI lookback period.
+    value : float
+        Current RSI (NaN during warm-up).
+    """
+
+    def __init__(self, period: int = 14):
+        """
+        Initializes an empty RSI tracker.
+        """
+        self.period = period
+        self.value = math.nan
+        self._avg_gain = RollingMean(period)
+        self._avg_loss = RollingMean(period)
+        self._last_price = None
+
+    def update(self, price: float) -> float:
+        """
+        Adds one price and returns the updated RSI.
+        """
+        delta = math.nan if self._last_price is None else price - self._last_price
+        self._last_price = price
+
+        # Separate gains and losses the way Series.clip does (losses of zero become -0.0)
+        gain = delta if delta != delta else max(delta, 0.0)
+        loss = delta if delta != delta else -min(delta, 0.0)
+
+        avg_gain = self._avg_gain.update(gain)
+        avg_loss = self._avg_loss.update(loss)
+
+        self.value = 100 - (100 / (1 + _divide(avg_gain, avg_loss)))
+        return self.value
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """
+    Divides with NumPy floating-point semantics (x / 0 is +/-inf, 0 / 0 is NaN).
+    """
+    if denominator == 0:
+        if numerator != numerator or numerator == 0:
+            return math.nan
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+    return numerator / denominator
+
+
+class StreamingSMACrossoverStrategy:
+    """
+    Bar-by-bar SMA crossover strategy with online moving averages.
+
+    Parameters
+    ----------
+    short_window : int
+        Period for short-term SMA (default is 20).
+    long_window : int
+        Period for long-term SMA (default is 50).
+
+    Attributes
+    ----------
+    short_window : int
+        Short-term moving average window.
+    long_window : int
+        Long-term moving average window.
+    """
+
+    def __init__(self, short_window: int = 20, long_window: int = 50):
+        """
+        Initializes the strategy's online moving averages.
+        """
+        self.short_window = short_window
+        self.long_window = long_window
+        self._short = RollingMean(short_window)
+        self._long = RollingMean(long_window)
+        self._prev = (math.nan, math.nan)
+
+    def update(self, price: float) -> tuple:
+        """
+        Consumes one closing price and returns (buy, sell) for that bar.
+        """
+        short_sma = self._short.update(price)
+        long_sma = self._long.update(price)
+        prev_short, prev_long = self._prev
+        self._prev = (short_sma, long_sma)
+
+        # Comparisons against NaN are False, so warm-up bars never signal
+        buy = prev_short <= prev_long and short_sma > long_sma
+        sell = prev_short >= prev_long and short_sma < long_sma
+        return buy, sell
+
+
+class StreamingGoldenCrossStrategy(StreamingSMACrossoverStrategy):
+    """
+    Bar-by-bar Golden Cross strategy (50-day SMA crossing the 200-day SMA).
+    """
+
+    def __init__(self):
+        """
+        Initializes the strategy with 50-day and 200-day online moving averages.
+        """
+        super().__init__(short_window=50, long_window=200)
+
+
+class StreamingRSIThresholdStrategy:
+    """
+    Bar-by-bar RSI threshold strategy with an online RSI.
+
+    Parameters
+    ----------
+    buy_threshold : float
+        RSI value below which to buy (default is 30).
+    sell_threshold : float
+        RSI value above which to sell (default is 70).
+
+    Attributes
+    ----------
+    buy_threshold : float
+        Buy threshold for RSI.
+    sell_threshold : float
+        Sell threshold for RSI.
+    """
+
+    def __init__(self, buy_threshold: float = 30.0, sell_threshold: float = 70.0):
+        """
+        Initializes the strategy's online RSI.
+        """
+        self.buy_threshold = buy_threshold
+        self.sell_threshold = sell_threshold
+        self._rsi = RelativeStrengthIndex()
+
+    def update(self, price: float) -> tuple:
+        """
+        Consumes one closing price and returns (buy, sell) for that bar.
+        """
+        rsi = self._rsi.update(price)
+        return rsi <= self.buy_threshold, rsi >= self.sell_threshold
+
+
+class StreamingMomentumStrategy:
+    """
+    Bar-by-bar momentum strategy with an online rate of change.
+
+    Parameters
+    ----------
+    roc_period : int
+        Lookback period for rate of change (default is 20).
+    roc_threshold : float
+        Minimum ROC value to trigger a buy (default is 0).
+
+    Attributes
+    ----------
+    roc_period : int
+        Rate of change calculation window.
+    roc_threshold : float
+        Threshold value for buy trigger.
+    """
+
+    def __init__(self, roc_period: int = 20, roc_threshold: float = 0.0):
+        """
+        Initializes the strategy's online rate of change.
+        """
+        self.roc_period = roc_period
+        self.roc_threshold = roc_threshold
+        self._roc = RateOfChange(roc_period)
+
+    def update(self, price: float) -> tuple:
+        """
+        Consumes one closing price and returns (buy, sell) for that bar.
+        """
+        roc = self._roc.update(price)
+        return roc >= self.roc_threshold, roc < 0
+
+
+# Streaming counterparts of the batch strategy names used by Controller
+STREAMING_STRATEGIES = {
+    "sma_crossover": StreamingSMACrossoverStrategy,
+    "rsi_threshold": StreamingRSIThresholdStrategy,
+    "golden_cross": StreamingGoldenCrossStrategy,
+    "momentum": StreamingMomentumStrategy,
+}
+
+
+def create_streaming_strategy(strategy_name: str, params: dict = None):
+    """
+    Creates the streaming strategy matching a batch strategy name.
+
+    Parameters
+    ----------
+    strategy_name : str
+        Name of the strategy ('sma_crossover', 'rsi_threshold', etc.).
+    params : dict
+        Strategy-specific parameters.
+
+    Returns
+    -------
+    object
+        A streaming strategy instance with an update(price) method.
+    """
+    if strategy_name not in STREAMING_STRATEGIES:
+        raise ValueError(f"Unknown strategy name: {strategy_name}")
+    return STREAMING_STRATEGIES[strategy_name](**(params or {}))
+
+
+def iter_bars(data):
+    """
+    Yields (date, close) pairs from a DataFrame with a 'Close' column.
+    """
+    yield from zip(data.index, data['Close'].to_numpy(dtype=float))
+
+
+class StreamingBacktester:
+    """
+    A class to simulate a strategy one bar at a time, emitting equity as it goes.
+
+    Uses the same trading rules as Backtester: one share per signal, buys only when cash
+    covers the price, sells only when a position is held, and buys take priority.
+
+    Parameters
+    ----------
+    strategy : object
+        Streaming strategy implementing update(price) -> (buy, sell).
+    initial_cash : float
+        Starting cash amount for the portfolio (default is 100,000).
+
+    Attributes
+    ----------
+    strategy : object
+        The streaming strategy applied to each bar.
+    initial_cash : float
+        The starting portfolio cash amount.
+    cash : float
+        Current available cash.
+    position : int
+        Number of shares currently held.
+    trades_executed : int
+        Number of buy and sell orders filled so far.
+    """
+
+    def __init__(self, strategy: object, initial_cash: float = 100000.0):
+        """
+        Initializes the StreamingBacktester with a streaming strategy and starting capital.
+        """
+        self.strategy = strategy
+        self.initial_cash = initial_cash
+        self.cash = initial_cash
+        self.position = 0
+        self.trades_executed = 0
+
+    def on_bar(self, price: float) -> float:
+        """
+        Processes one closing price and returns total equity after any trade.
+        """
+        buy, sell = self.strategy.update(price)
+
+        if buy and self.cash >= price:
+            self.position += 1
+            self.cash -= price
+            self.trades_executed += 1
+        elif sell and self.position > 0:
+            self.position -= 1
+            self.cash += price
+            self.trades_executed += 1
+
+        return self.cash + self.position * price
+
+    def run(self, bars):
+        """
+        Consumes an iterator of (date, close) bars and yields (date, equity) per bar.
+
+        Parameters
+        ----------
+        bars : iterable
+            Iterable of (date, close price) pairs, such as iter_bars(data) or a live feed.
+
+        Yields
+        ------
+        tuple
+            (date, total equity) after each bar.
+        """
+        for date, price in bars:
+            yield date, self.on_bar(price)
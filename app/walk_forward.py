@@ -0,0 +1,88 @@
+"""
+walk_forward.py
+
+Module providing the window splitting and equity stitching used by walk-forward
+optimization (see Controller.run_walk_forward).
+
+The history is cut into consecutive folds, each made of a training window used to pick
+parameters and the test window that follows it. Windows are described by positional
+slices and applied with .iloc, which takes views of the loaded data instead of copying it.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def split_windows(n_rows: int, train_size: int, test_size: int, anchored: bool = False, step: int = None) -> list:
+    """
+    Splits a history of n_rows bars into consecutive train/test windows.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of bars in the history.
+    train_size : int
+        Number of bars in each training window (the first one when anchored).
+    test_size : int
+        Number of bars in each test window. The last test window is shortened to fit.
+    anchored : bool
+        If True, every training window starts at the first bar and grows; otherwise it
+        rolls forward with a fixed length (default is False).
+    step : int, optional
+        Number of bars between the starts of consecutive test windows (default is test_size).
+        It cannot be smaller than test_size, since overlapping test windows would stitch
+        into a curve with repeated dates.
+
+    Returns
+    -------
+    list
+        List of (train, test) pairs of positional slice objects.
+    """
+    if train_size < 1 or test_size < 1:
+        raise ValueError("train_size and test_size must be positive.")
+
+    step = step or test_size
+    if step < test_size:
+        raise ValueError(f"step ({step}) must be at least test_size ({test_size}) so test windows do not overlap.")
+
+    windows = []
+
+    test_start = train_size
+    while test_start < n_rows:
+        train_start = 0 if anchored else test_start - train_size
+        windows.append((slice(train_start, test_start), slice(test_start, min(test_start + test_size, n_rows))))
+        test_start += step
+
+    return windows
+
+
+def stitch_equity(curves: list, initial_cash: float = 100000.0) -> pd.DataFrame:
+    """
+    Chains out-of-sample equity curves into one continuous curve.
+
+    Each fold's test run starts from initial_cash, so its curve is rescaled to start from
+    the previous fold's ending value, compounding the folds' returns back to back.
+
+    Parameters
+    ----------
+    curves : list
+        Per-fold equity curve DataFrames with a 'Portfolio Value' column, in date order.
+    initial_cash : float
+        Starting cash of every fold's test run (default is 100,000).
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame containing 'Date' and 'Portfolio Value', indexed by date.
+    """
+    values = []
+    capital = initial_cash
+
+    for curve in curves:
+        scaled = curve['Portfolio Value'].to_numpy(dtype=np.float64) * (capital / initial_cash)
+        values.append(scaled)
+        if len(scaled):
+            capital = scaled[-1]
+
+    index = pd.Index(np.concatenate([curve.index.to_numpy() for curve in curves]) if curves else [], name='Date')
+    return pd.DataFrame({'Portfolio Value': np.concatenate(values) if values else np.empty(0)}, index=index)
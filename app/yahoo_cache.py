@@ -0,0 +1,227 @@
+"""
+yahoo_cache.py
+
+Module providing a persistent, per-ticker on-disk cache for Yahoo Finance downloads.
+
+The first request for a ticker downloads its full history. Later requests are served from
+disk and, once the cached copy is older than the staleness limit, only the bars after the
+last cached date are downloaded and appended. A request whose start date and warm-up reach
+before the cached history backfills the missing earlier bars. An offline mode serves the
+cache only, and refuses windows the cache does not cover.
+The downloader is pluggable so the cache can be exercised without network access.
+"""
+
+import math
+import os
+
+import pandas as pd
+from app import price_store
+
+
+def yahoo_downloader(ticker: str, start: pd.Timestamp = None) -> pd.DataFrame:
+    """
+    Downloads daily bars from Yahoo Finance.
+
+    Parameters
+    ----------
+    ticker : str
+        Stock ticker symbol.
+    start : pd.Timestamp, optional
+        First date to download; when omitted the last 3 years are downloaded.
+
+    Returns
+    -------
+    pd.DataFrame
+        Raw yfinance download.
+    """
+    # Imported on first download so cached and non-Yahoo runs never load yfinance
+    import yfinance as yf
+
+    if start is None:
+        return yf.download(ticker, period="3y", interval="1d")
+    return yf.download(ticker, start=start.strftime("%Y-%m-%d"), interval="1d")
+
+
+def warmup_start(start_date, warmup: int) -> pd.Timestamp:
+    """
+    Estimates the calendar date from which warmup trading days before start_date are available.
+
+    Parameters
+    ----------
+    start_date : str or pd.Timestamp
+        First date of interest.
+    warmup : int
+        Number of trading days needed before start_date.
+
+    Returns
+    -------
+    pd.Timestamp
+        Date to start fetching from, with a margin for weekends and holidays.
+    """
+    # About 252 trading days per 365 calendar days, plus a margin for holidays
+    return pd.Timestamp(start_date) - pd.Timedelta(days=math.ceil(warmup * 365 / 252) + 10)
+
+
+def normalize_close(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reduces a download to a single 'Close' column indexed by 'Date' without missing values.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Downloaded price data, possibly with per-ticker column levels.
+
+    Returns
+    -------
+    pd.DataFrame
+        Price data with one 'Close' column.
+    """
+    if df is None or len(df) == 0:
+        return pd.DataFrame({"Close": pd.Series(dtype=float)}, index=pd.DatetimeIndex([], name="Date"))
+
+    close = df["Close"]
+    if isinstance(close, pd.DataFrame):
+        close = close.iloc[:, 0]
+
+    result = close.astype(float).to_frame("Close").dropna()
+    result.index = pd.DatetimeIndex(result.index, name="Date")
+    return result
+
+
+class YahooCache:
+    """
+    A per-ticker on-disk cache of Yahoo Finance daily bars with incremental top-up.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory holding one price store per ticker.
+    max_staleness : pd.Timedelta
+        How long a cached copy is served before new bars are fetched (default is 12 hours).
+    offline : bool
+        If True, never download and serve only cached data (default is False).
+    downloader : callable, optional
+        Function downloader(ticker, start=None) returning a DataFrame with a 'Close' column
+        (default is yahoo_downloader).
+
+    Attributes
+    ----------
+    cache_dir : str
+        Directory holding the cached price stores.
+    max_staleness : pd.Timedelta
+        Staleness limit for cached data.
+    offline : bool
+        Whether downloads are disabled.
+    downloader : callable
+        Function used to download bars.
+    """
+
+    def __init__(self, cache_dir: str, max_staleness: pd.Timedelta = pd.Timedelta(hours=12), offline: bool = False, downloader=None):
+        """
+        Initializes the YahooCache with a cache directory and refresh policy.
+        """
+        self.cache_dir = cache_dir
+        self.max_staleness = pd.Timedelta(max_staleness)
+        self.offline = offline
+        self.downloader = downloader or yahoo_downloader
+
+    def _store_path(self, ticker: str) -> str:
+        """
+        Returns the price store directory for a ticker.
+        """
+        return os.path.join(self.cache_dir, ticker.upper() + price_store.STORE_SUFFIX)
+
+    def get(self, ticker: str, start_date=None, end_date=None, warmup: int = 0) -> pd.DataFrame:
+        """
+        Returns daily bars for a ticker, downloading only what the cache is missing.
+
+        Parameters
+        ----------
+        ticker : str
+            Stock ticker symbol.
+        start_date : str or pd.Timestamp, optional
+            First date of interest (default is the first cached bar).
+        end_date : str or pd.Timestamp, optional
+            Last date of interest, inclusive (default is the last cached bar).
+        warmup : int
+            Number of bars to include before start_date (default is 0).
+
+        Returns
+        -------
+        pd.DataFrame
+            Historical daily price data with a 'Close' column, limited to the requested
+            window by slicing the memory-mapped store.
+        """
+        window = (start_date, end_date, warmup)
+        store_path = self._store_path(ticker)
+        meta = price_store.read_meta(store_path)
+
+        # Offline mode only ever reads the cache
+        if self.offline:
+            if meta is None:
+                raise ValueError(f"No data cached for {ticker} and offline mode is enabled.")
+            cached = price_store.load_store(store_path)
+            if self._missing_history(cached, meta, start_date, warmup):
+                raise ValueError(
+                    f"Cached data for {ticker} starts on {cached.index[0].date()}, which does not cover {warmup} bars "
+                    f"before {pd.Timestamp(start_date).date()}, and offline mode is enabled."
+                )
+            return price_store.load_store(store_path, *window)
+
+        now = pd.Timestamp.now()
+
+        if meta is None:
+            # Cache miss: download the full history
+            data = normalize_close(self.downloader(ticker))
+            if data.empty:
+                raise ValueError(f"No data returned for {ticker}.")
+            self._write(store_path, data, now)
+            meta = price_store.read_meta(store_path)
+        elif now - pd.Timestamp(meta["fetched_at"]) > self.max_staleness:
+            # Stale: fetch only the bars after the last cached date and append them
+            cached = price_store.load_store(store_path)
+            last_date = cached.index[-1]
+            new_bars = normalize_close(self.downloader(ticker, start=last_date + pd.Timedelta(days=1)))
+            new_bars = new_bars[new_bars.index > last_date]
+
+            combined = pd.concat([cached, new_bars]) if not new_bars.empty else cached.copy()
+            self._write(store_path, combined, now, meta.get("history_start"))
+            meta = price_store.read_meta(store_path)
+
+        # Backfill: the window's warm-up reaches before the cached history
+        cached = price_store.load_store(store_path)
+        if self._missing_history(cached, meta, start_date, warmup):
+            history_start = warmup_start(start_date, warmup)
+            earlier = normalize_close(self.downloader(ticker, start=history_start))
+            earlier = earlier[earlier.index < cached.index[0]]
+
+            # Remember how far back was requested, so a ticker with no earlier bars is not fetched again
+            self._write(store_path, pd.concat([earlier, cached]), pd.Timestamp(meta["fetched_at"]), history_start.isoformat())
+
+        return price_store.load_store(store_path, *window)
+
+    @staticmethod
+    def _missing_history(cached: pd.DataFrame, meta: dict, start_date, warmup: int) -> bool:
+        """
+        Returns whether a window's start date and warm-up bars reach before the cached history.
+        """
+        if start_date is None:
+            return False
+
+        # Earlier bars were already requested back to this date; none exist before the cache
+        if "history_start" in meta and pd.Timestamp(meta["history_start"]) <= warmup_start(start_date, warmup):
+            return False
+
+        # Short of warm-up bars, or no cached bar on or before start_date
+        first, _ = price_store.window_bounds(cached.index, start_date, None, 0)
+        _, stop = price_store.window_bounds(cached.index, None, start_date, 0)
+        return first < warmup or stop == 0
+
+    def _write(self, store_path: str, data: pd.DataFrame, fetched_at: pd.Timestamp, history_start: str = None):
+        """
+        Writes a ticker's bars, the time they were last refreshed and how far back they were requested.
+        """
+        extra_meta = {"fetched_at": fetched_at.isoformat()}
+        if history_start is not None:
+            extra_meta["history_start"] = history_start
+        price_store.write_store(data, store_path, extra_meta=extra_meta)
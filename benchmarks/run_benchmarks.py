@@ -0,0 +1,262 @@
+"""
+run_benchmarks.py
+
+Performance benchmark suite for the backtesting engine.
+
+Runs entirely offline on seeded synthetic data (see synthetic.py) and times each stage
+separately: DataHandler loading (CSV and binary store), strategy construction,
+Backtester.run_backtest and Results.calculate_performance_metrics. Every stage reports
+its best wall time over a few repeats, its throughput in bars per second, and its peak
+traced memory (measured in a separate pass so tracing does not skew the timings).
+
+Timings are compared against a stored baseline, and the run exits with status 1 when
+any stage is slower than its baseline by more than the allowed margin.
+
+Example
+-------
+python -m benchmarks.run_benchmarks --sizes 1000 100000 1000000 --margin 1.0
+python -m benchmarks.run_benchmarks --update-baseline
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from app.backtester import Backtester
+from app.data_handler import DataHandler
+from app.indicators import indicator_cache
+from app.price_store import ensure_store
+from app.results import Results
+from app.strategies import (
+    SMACrossoverStrategy,
+    RSIThresholdStrategy,
+    GoldenCrossStrategy,
+    MomentumStrategy
+)
+from benchmarks.synthetic import write_prices_csv
+
+# Strategies benchmarked by default, with the parameters used for each
+STRATEGIES = {
+    "sma_crossover": (SMACrossoverStrategy, {"short_window": 20, "long_window": 50}),
+    "rsi_threshold": (RSIThresholdStrategy, {}),
+    "golden_cross": (GoldenCrossStrategy, {}),
+    "momentum": (MomentumStrategy, {"roc_period": 20}),
+}
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DATA_DIR = os.path.join(tempfile.gettempdir(), "backtest_benchmarks")
+
+# Slowdowns smaller than this many seconds are timer noise and never count as regressions
+NOISE_FLOOR = 0.02
+
+
+def measure(func, repeat: int = 3) -> tuple:
+    """
+    Times a zero-argument callable and records its peak traced memory.
+
+    Parameters
+    ----------
+    func : callable
+        Stage to measure; called repeat + 1 times.
+    repeat : int
+        Number of timed calls; the fastest one is reported (default is 3).
+
+    Returns
+    -------
+    tuple
+        Tuple of (result of the last call, best wall time in seconds, peak memory in bytes).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+
+    # Separate traced call: tracemalloc slows allocation-heavy code down considerably
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, best, peak
+
+
+def run_suite(sizes: list = None, strategies: list = None, engine: str = "vectorized", repeat: int = 3, data_dir: str = DATA_DIR, seed: int = 42) -> list:
+    """
+    Benchmarks every stage for each data size and strategy.
+
+    Parameters
+    ----------
+    sizes : list
+        Numbers of bars to benchmark (default is DEFAULT_SIZES).
+    strategies : list
+        Strategy names to benchmark (default is all of STRATEGIES).
+    engine : str
+        Backtester engine to time ('loop' or 'vectorized', default is 'vectorized').
+    repeat : int
+        Timed calls per stage (default is 3).
+    data_dir : str
+        Directory holding the generated CSV files and binary stores (reused between runs).
+    seed : int
+        Random seed of the synthetic prices (default is 42).
+
+    Returns
+    -------
+    list
+        One dictionary per stage with 'case', 'bars', 'seconds', 'bars_per_sec' and 'peak_mb'.
+    """
+    rows = []
+
+    def record(case, n_bars, func):
+        result, seconds, peak = measure(func, repeat)
+        rows.append({
+            "case": case,
+            "bars": n_bars,
+            "seconds": seconds,
+            "bars_per_sec": n_bars / seconds if seconds > 0 else float("inf"),
+            "peak_mb": peak / 2 ** 20,
+        })
+        return result
+
+    for n_bars in sizes or DEFAULT_SIZES:
+        csv_path = write_prices_csv(os.path.join(data_dir, f"synthetic_{n_bars}_{seed}.csv"), n_bars, seed)
+        ensure_store(csv_path)
+
+        data = record(f"{n_bars}/load:csv", n_bars, lambda: _load(DataHandler(source="csv"), csv_path))
+        record(f"{n_bars}/load:binary", n_bars, lambda: _load(DataHandler(source="binary"), csv_path))
+
+        for name in strategies or list(STRATEGIES):
+            strategy_cls, params = STRATEGIES[name]
+
+            # Clear the indicator cache so every construction computes its indicators
+            strategy = record(f"{n_bars}/construct:{name}", n_bars, lambda: _construct(strategy_cls, data, params))
+            equity_curve = record(
+                f"{n_bars}/backtest:{name}:{engine}", n_bars,
+                lambda: Backtester(strategy.data, strategy, engine=engine).run_backtest(),
+            )
+            record(f"{n_bars}/metrics:{name}", n_bars, lambda: Results(equity_curve).calculate_performance_metrics())
+
+    return rows
+
+
+def _load(handler: DataHandler, path: str):
+    """
+    Loads a file through a DataHandler and returns the data.
+    """
+    handler.load_data(path)
+    return handler.fetch_data()
+
+
+def _construct(strategy_cls: type, data, params: dict):
+    """
+    Builds a strategy from a cold indicator cache.
+    """
+    indicator_cache.clear()
+    return strategy_cls(data, **params)
+
+
+def find_regressions(rows: list, baseline: dict, margin: float) -> list:
+    """
+    Compares measured timings against a baseline.
+
+    Parameters
+    ----------
+    rows : list
+        Results from run_suite().
+    baseline : dict
+        Mapping of case name to baseline seconds; cases missing from it are not checked.
+    margin : float
+        Allowed slowdown as a fraction of the baseline (ex. 0.5 allows 50% slower).
+
+    Returns
+    -------
+    list
+        One message per stage that exceeded its baseline.
+    """
+    regressions = []
+    for row in rows:
+        reference = baseline.get(row["case"])
+        if reference is None:
+            continue
+
+        limit = reference * (1 + margin)
+        if row["seconds"] > limit and row["seconds"] - reference > NOISE_FLOOR:
+            regressions.append(
+                f"{row['case']}: {row['seconds']:.4f}s exceeds baseline {reference:.4f}s by more than {margin:.0%}"
+            )
+    return regressions
+
+
+def load_baseline(path: str = BASELINE_PATH) -> dict:
+    """
+    Reads stored baseline timings, or returns an empty baseline if the file does not exist.
+    """
+    if not os.path.exists(path):
+        return {}
+
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def save_baseline(rows: list, path: str = BASELINE_PATH):
+    """
+    Stores measured timings as the new baseline, keeping cases that were not re-measured.
+    """
+    baseline = load_baseline(path)
+    baseline.update({row["case"]: round(row["seconds"], 6) for row in rows})
+
+    with open(path, "w") as handle:
+        json.dump(dict(sorted(baseline.items())), handle, indent=2)
+        handle.write("\n")
+
+
+def format_report(rows: list) -> str:
+    """
+    Formats benchmark results as a fixed-width table.
+    """
+    lines = [f"{'case':<42} {'seconds':>10} {'bars/sec':>14} {'peak MB':>10}"]
+    for row in rows:
+        lines.append(f"{row['case']:<42} {row['seconds']:>10.4f} {row['bars_per_sec']:>14,.0f} {row['peak_mb']:>10.1f}")
+    return "\n".join(lines)
+
+
+def main(argv: list = None) -> int:
+    """
+    Command-line entry point; returns 1 if any stage regressed past the margin.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the backtesting engine on synthetic data.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Numbers of bars to benchmark (up to 1e7).")
+    parser.add_argument("--strategies", nargs="+", choices=list(STRATEGIES), default=list(STRATEGIES), help="Strategies to benchmark.")
+    parser.add_argument("--engine", default="vectorized", choices=list(Backtester.ENGINES), help="Backtester engine (default: vectorized).")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage; the fastest is kept (default: 3).")
+    parser.add_argument("--margin", type=float, default=1.0, help="Allowed slowdown over the baseline as a fraction (default: 1.0, i.e. twice as slow).")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON file.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run's timings as the baseline.")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Directory for generated data files.")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed of the synthetic prices.")
+    args = parser.parse_args(argv)
+
+    rows = run_suite(args.sizes, args.strategies, args.engine, args.repeat, args.data_dir, args.seed)
+    print(format_report(rows))
+
+    if args.update_baseline:
+        save_baseline(rows, args.baseline)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    regressions = find_regressions(rows, load_baseline(args.baseline), args.margin)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
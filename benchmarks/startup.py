@@ -0,0 +1,104 @@
+"""
+startup.py
+
+Startup-time benchmark for short-lived processes such as batch workers and CLI runs.
+
+Each case imports modules in a fresh interpreter and is timed end to end, so it includes
+interpreter start-up. The 'controller' case is what a CSV run pays; the 'controller+yfinance'
+case adds the yfinance import that every run paid before it was deferred to Yahoo runs,
+so the difference between the two is the saving. The run exits with status 1 if importing
+the controller loads yfinance or any strategy module.
+
+Example
+-------
+python -m benchmarks.startup --repeat 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Case name -> statement run in a fresh interpreter
+CASES = {
+    "python": "pass",
+    "controller": "import app.controller",
+    "controller+yfinance": "import yfinance, app.controller",
+}
+
+# Modules that must not be loaded by a bare 'import app.controller'
+LAZY_MODULES = ("yfinance", "app.strategies.")
+
+
+def time_import(statement: str, repeat: int = 5) -> float:
+    """
+    Runs a statement in fresh interpreters and returns the median wall time in seconds.
+
+    Parameters
+    ----------
+    statement : str
+        Python code to run, typically imports.
+    repeat : int
+        Number of interpreters started (default is 5).
+
+    Returns
+    -------
+    float
+        Median wall time of one interpreter run.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], cwd=ROOT, check=True)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def eagerly_loaded(module: str = "app.controller") -> list:
+    """
+    Returns the lazily loaded modules that importing a module pulls in anyway.
+
+    Parameters
+    ----------
+    module : str
+        Module to import in a fresh interpreter (default is 'app.controller').
+
+    Returns
+    -------
+    list
+        Names of loaded modules matching LAZY_MODULES; empty when imports are deferred.
+    """
+    script = f"import json, sys, {module}; print(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return [name for name in json.loads(output) if name.startswith(LAZY_MODULES)]
+
+
+def main(argv: list = None) -> int:
+    """
+    Times every startup case, prints the report and returns the exit status.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark interpreter start-up with the engine's imports.")
+    parser.add_argument("--repeat", type=int, default=5, help="Interpreters started per case; the median is kept (default: 5).")
+    args = parser.parse_args(argv)
+
+    timings = {name: time_import(statement, args.repeat) for name, statement in CASES.items()}
+    for name, seconds in timings.items():
+        print(f"{name:<22} {seconds * 1000:8.1f} ms")
+
+    saved = timings["controller+yfinance"] - timings["controller"]
+    print(f"\nDeferred yfinance import saves {saved * 1000:.1f} ms per CSV/binary process")
+
+    loaded = eagerly_loaded()
+    if loaded:
+        print(f"\nimport app.controller loaded modules that should be lazy: {', '.join(loaded)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,13 +4,20 @@ main.py
 Command-line interface for running the backtesting engine.
 Allows the user to select a data source, trading strategy, input stock ticker or CSV,
 and execute a backtest using the modular backtesting system.
+
+Passing a job file runs many backtests headlessly instead of prompting:
+
+    python main.py --jobs jobs.toml --workers 4
 """
 
+import argparse
 import os
-import numpy as np
-import pandas as pd
 from datetime import datetime
 from app.controller import Controller
+from app.jobs import load_jobs, run_jobs
+from app.results_store import ResultsStore
+from app.strategies import STRATEGY_REGISTRY
+from app.yahoo_cache import YahooCache
 
 def main():
     """
@@ -52,26 +59,21 @@ def main():
     else:
         source_name = os.path.splitext(os.path.basename(csv_path))[0]
 
-    controller = Controller(source=source)
+    # Yahoo downloads are cached on disk and only topped up with new bars
+    controller = Controller(source=source, yahoo_cache=YahooCache(os.path.join("data", "yahoo_cache")))
 
     # Prompt the user to select a trading strategy
-    print("\nSelect a trading strategy:")
-    print("1. SMA Crossover Strategy")
-    print("2. RSI Threshold Strategy")
-    print("3. Golden Cross Strategy")
-    print("4. Momentum Strategy (Rate of Change)")
+    # Menu numbers follow the strategy registry's order
+    strategy_mapping = {str(number): name for number, name in enumerate(STRATEGY_REGISTRY, start=1)}
 
-    strategy_choice = input("\nEnter the number corresponding to your chosen strategy (1-4): ").strip()
+    print("\nSelect a trading strategy:")
+    for number, name in strategy_mapping.items():
+        print(f"{number}. {STRATEGY_REGISTRY[name][2]}")
 
-    strategy_mapping = {
-        "1": "sma_crossover",
-        "2": "rsi_threshold",
-        "3": "golden_cross",
-        "4": "momentum"
-    }
+    strategy_choice = input(f"\nEnter the number corresponding to your chosen strategy (1-{len(strategy_mapping)}): ").strip()
 
     if strategy_choice not in strategy_mapping:
-        print("Invalid selection. Please run the program again and select a valid option (1-4).")
+        print(f"Invalid selection. Please run the program again and select a valid option (1-{len(strategy_mapping)}).")
         return
 
     strategy_name = strategy_mapping[strategy_choice]
@@ -156,23 +158,84 @@ def main():
     os.makedirs('performance', exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    # Create filename including strategy parameters if any
+    filename = result_filename('performance', source_name, strategy_name, strategy_params, timestamp)
+
+    # Record the run in the results database, then export it as one CSV of metrics and equity curve
+    with ResultsStore(os.path.join('performance', 'results.db')) as store:
+        run_id = store.add_run(strategy_name, strategy_params, performance_metrics, total_trades, equity_curve, source=source, source_name=source_name)
+        store.export_csv(run_id, filename)
+
+    print(f"\nResults saved to {filename}")
+
+def result_filename(output_dir: str, source_name: str, strategy_name: str, strategy_params: dict, timestamp: str, suffix: str = "") -> str:
+    """
+    Builds the CSV path for one run, including strategy parameters if any.
+    """
     param_str = ''
     if strategy_params:
         param_str = '_' + '_'.join(f"{key}{value}" for key, value in strategy_params.items())
 
-    filename = f"performance/{source_name}_{strategy_name}{param_str}_{timestamp}.csv"
-
-    # Combine metrics and equity curve into one CSV
-    metrics_df = pd.DataFrame([performance_metrics])
-    metrics_df.index = ['Performance Summary']
-
-    empty_row = pd.DataFrame([{}])  # Blank line between metrics and equity curve
+    return f"{output_dir}/{source_name}_{strategy_name}{param_str}_{timestamp}{suffix}.csv"
 
-    combined = pd.concat([metrics_df, empty_row, equity_curve])
-    combined.to_csv(filename)
+def run_job_file(job_file: str, workers: int = None, output_dir: str = 'performance') -> int:
+    """
+    Runs every job in a JSON/TOML job file without prompting, printing progress as jobs finish.
+    Successful runs are recorded in the results database and saved as per-run CSV files.
 
-    print(f"\nResults saved to {filename}")
+    Returns
+    -------
+    int
+        Number of failed jobs.
+    """
+    jobs = load_jobs(job_file)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    print(f"Running {len(jobs)} jobs from {job_file}...")
+
+    completed = []
+    failures = 0
+    yahoo_cache_dir = os.path.join("data", "yahoo_cache")
+    for done, result in enumerate(run_jobs(jobs, workers=workers, yahoo_cache_dir=yahoo_cache_dir), start=1):
+        job = result["job"]
+        label = f"[{done}/{len(jobs)}] job {result['index']} {job['strategy']} on {result['source_name']}"
+
+        if result["error"] is not None:
+            failures += 1
+            print(f"{label}: FAILED ({result['error']})")
+            continue
+
+        completed.append(result)
+        note = " (fallback CSV)" if result["used_fallback"] else ""
+        print(f"{label}{note}: {result['trades']} trades, Sharpe Ratio {result['metrics']['Sharpe Ratio']:.4f}")
+
+    # Record all successful runs in one transaction, then export each in the per-run CSV layout
+    os.makedirs(output_dir, exist_ok=True)
+    with ResultsStore(os.path.join(output_dir, 'results.db')) as store:
+        run_ids = store.add_runs([
+            {
+                "strategy": result["job"]["strategy"],
+                "params": result["job"]["params"],
+                "metrics": result["metrics"],
+                "trades": result["trades"],
+                "equity_curve": result["equity_curve"],
+                "source": "csv" if result["used_fallback"] else result["job"]["source"],
+                "source_name": result["source_name"],
+            }
+            for result in completed
+        ])
+        for run_id, result in zip(run_ids, completed):
+            filename = result_filename(output_dir, result["source_name"], result["job"]["strategy"], result["job"]["params"], timestamp, f"_job{result['index']}")
+            store.export_csv(run_id, filename)
+
+    print(f"\nCompleted {len(completed)} of {len(jobs)} jobs ({failures} failed). Results saved to {output_dir}/")
+    return failures
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the backtesting engine interactively, or headlessly from a job file.")
+    parser.add_argument("--jobs", help="JSON or TOML job file to run without prompts.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for job files (default: CPU count).")
+    parser.add_argument("--output", default="performance", help="Output folder for job results (default: performance).")
+    args = parser.parse_args()
+
+    if args.jobs:
+        raise SystemExit(1 if run_job_file(args.jobs, args.workers, args.output) else 0)
     main()
\ No newline at end of file
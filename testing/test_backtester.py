@@ -2,8 +2,11 @@
 Unit tests for the Backtester class in backtester.py
 """
 
+import numpy as np
 import pandas as pd
+import pytest
 from app.backtester import Backtester
+from app.strategies import SMACrossoverStrategy
 
 class DummyStrategy:
     def should_buy(self, row):
@@ -25,4 +28,163 @@ def test_backtester_equity_curve_generation():
     # Assertions
     assert isinstance(equity_curve, pd.DataFrame)
     assert 'Portfolio Value' in equity_curve.columns
-    assert not equity_curve.empty
\ No newline at end of file
+    assert not equity_curve.empty
+
+def test_vectorized_engine_matches_loop_engine():
+    """Test that the vectorized engine reproduces the loop engine's equity and trade count."""
+    dates = pd.date_range(start="2022-01-01", periods=8)
+    price_data = pd.DataFrame({"Close": [100, 101, 99, 105, 107, 101, 98, 106]}, index=dates)
+
+    loop = Backtester(data=price_data, strategy=DummyStrategy(), initial_cash=250.0)
+    vectorized = Backtester(data=price_data, strategy=DummyStrategy(), initial_cash=250.0, engine="vectorized")
+
+    loop_curve = loop.run_backtest()
+    vectorized_curve = vectorized.run_backtest()
+
+    pd.testing.assert_frame_equal(loop_curve, vectorized_curve, check_freq=False)
+    assert loop.trades_executed == vectorized.trades_executed
+    assert loop.cash == vectorized.cash
+    assert loop.position == vectorized.position
+
+
+def test_backtester_prefers_generate_signals():
+    """Test that the vectorized engine uses generate_signals() instead of the row hooks."""
+
+    class ArrayOnlyStrategy(DummyStrategy):
+        def should_buy(self, row):
+            raise AssertionError("row hook should not be called")
+
+        def generate_signals(self):
+            return [True, False, False, False, False], [False, False, False, True, False]
+
+    dates = pd.date_range(start="2022-01-01", periods=5)
+    price_data = pd.DataFrame({"Close": [100.0, 102.0, 101.0, 105.0, 107.0]}, index=dates)
+
+    backtester = Backtester(data=price_data, strategy=ArrayOnlyStrategy(), engine="vectorized")
+    equity_curve = backtester.run_backtest()
+
+    assert backtester.trades_executed == 2
+    assert equity_curve['Portfolio Value'].iloc[-1] == 100005.0
+
+
+def test_backtester_equity_is_preallocated_and_not_copied():
+    """Test that the output DataFrame wraps the preallocated equity array without copying."""
+    dates = pd.date_range(start="2022-01-01", periods=5)
+    price_data = pd.DataFrame({"Close": [100.0, 102.0, 101.0, 105.0, 107.0]}, index=dates)
+
+    for engine in Backtester.ENGINES:
+        backtester = Backtester(data=price_data, strategy=DummyStrategy(), engine=engine)
+        equity_curve = backtester.run_backtest()
+
+        assert np.shares_memory(equity_curve['Portfolio Value'].to_numpy(), backtester.equity_curve)
+        assert backtester.position_curve.tolist() == [1, 1, 2, 1, 0]
+
+def test_backtester_float32_mode():
+    """Test that float32 mode halves the equity storage and stays close to float64 results."""
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+
+    exact = Backtester(data, DummyStrategy(), engine="vectorized").run_backtest()
+    compact = Backtester(data, DummyStrategy(), engine="vectorized", dtype="float32").run_backtest()
+
+    assert compact['Portfolio Value'].dtype == np.float32
+    assert np.allclose(compact['Portfolio Value'], exact['Portfolio Value'], rtol=1e-6)
+
+def _kernel_inputs(dtype):
+    """Builds random prices and signals with preallocated output arrays."""
+    rng = np.random.default_rng(11)
+    n_rows = 5000
+    prices = (100 + rng.standard_normal(n_rows).cumsum()).astype(dtype)
+    buy = rng.random(n_rows) < 0.3
+    sell = rng.random(n_rows) < 0.3
+    return prices, buy, sell, np.empty(n_rows, dtype=dtype), np.empty(n_rows, dtype=np.int64)
+
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+def test_numba_kernel_is_bit_identical_to_python_kernel(dtype):
+    """Test that the compiled and pure-Python kernels produce exactly the same cash, positions and trades."""
+    pytest.importorskip("numba")
+    from app.kernels import simulate_numba, simulate_python
+
+    prices, buy, sell, python_cash, python_position = _kernel_inputs(dtype)
+    _, _, _, numba_cash, numba_position = _kernel_inputs(dtype)
+
+    python_final = simulate_python(prices, buy, sell, 2500.0, 0, python_cash, python_position)
+    numba_final = simulate_numba(prices, buy, sell, 2500.0, 0, numba_cash, numba_position)
+
+    assert python_final == numba_final
+    assert np.array_equal(python_cash, numba_cash)
+    assert np.array_equal(python_position, numba_position)
+
+def test_auto_kernel_falls_back_to_python(monkeypatch):
+    """Test that 'auto' uses the pure-Python kernel when Numba is absent, and 'numba' then fails clearly."""
+    from app import kernels
+    monkeypatch.setattr(kernels, "KERNELS", {"python": kernels.simulate_python})
+
+    data = pd.DataFrame({"Close": [10.0, 11.0, 12.0, 11.0, 10.0]})
+    strategy = SMACrossoverStrategy(data, short_window=1, long_window=2)
+
+    backtester = Backtester(strategy.data, strategy, initial_cash=100.0, engine="vectorized")
+    assert backtester.kernel is kernels.simulate_python
+    backtester.run_backtest()
+
+    with pytest.raises(ValueError, match="Numba"):
+        Backtester(strategy.data, strategy, engine="vectorized", kernel="numba")
+
+
+def test_warmup_rows_are_not_evaluated():
+    """Test that rows inside the strategy's lookback are skipped without changing the results."""
+
+    class WarmupStrategy(DummyStrategy):
+        lookback = 3
+
+        def should_buy(self, row):
+            assert row.name >= pd.Timestamp("2022-01-04"), "warm-up row evaluated"
+            return super().should_buy(row)
+
+    class NoWarmupStrategy(DummyStrategy):
+        lookback = 0
+
+    dates = pd.date_range(start="2022-01-01", periods=8)
+    price_data = pd.DataFrame({"Close": [110, 111, 112, 101, 107, 101, 98, 106]}, index=dates)
+
+    for engine in Backtester.ENGINES:
+        skipped = Backtester(data=price_data, strategy=WarmupStrategy(), engine=engine)
+        reference = Backtester(data=price_data, strategy=NoWarmupStrategy(), engine=engine)
+
+        pd.testing.assert_frame_equal(skipped.run_backtest(), reference.run_backtest(), check_freq=False)
+        assert skipped.trades_executed == reference.trades_executed
+        assert skipped.position_curve.tolist() == reference.position_curve.tolist()
+
+def test_declared_lookback_drives_validation():
+    """Test that data shorter than the strategy's lookback is rejected."""
+    price_data = pd.DataFrame({"Close": np.linspace(100, 110, 30)}, index=pd.date_range("2022-01-01", periods=30))
+    strategy = SMACrossoverStrategy(price_data, short_window=5, long_window=40)
+
+    with pytest.raises(ValueError, match="Requires at least 40"):
+        Backtester(data=price_data, strategy=strategy)
+
+def test_float32_mode_trades_on_double_precision_prices():
+    """Test that float32 storage does not change trading decisions: prices are compared to cash unrounded."""
+
+    class AlwaysBuy:
+        lookback = 0
+
+        def should_buy(self, row):
+            return True
+
+        def should_sell(self, row):
+            return False
+
+        def generate_signals(self):
+            return np.ones(3, dtype=bool), np.zeros(3, dtype=bool)
+
+    # 100.000001 rounds to 100.0 in float32, which would wrongly fit in 100.0 of cash
+    price_data = pd.DataFrame({"Close": [100.000001, 100.000001, 50.0]}, index=pd.date_range("2022-01-01", periods=3))
+
+    for engine in Backtester.ENGINES:
+        backtester = Backtester(price_data, AlwaysBuy(), initial_cash=100.0, engine=engine, dtype="float32")
+        curve = backtester.run_backtest()
+
+        assert backtester.trades_executed == 1
+        assert backtester.cash == 50.0
+        assert backtester.position_curve.tolist() == [0, 0, 1]
+        assert curve['Portfolio Value'].dtype == np.float32
@@ -0,0 +1,31 @@
+"""
+Unit tests for the batch universe runner in batch.py
+"""
+
+import io
+import shutil
+from app.batch import run_batch
+
+def test_run_batch_streams_results_and_skips_bad_files(tmp_path):
+    """Test that each symbol is reported and a broken file does not abort the batch."""
+    shutil.copy("data/sample_prices.csv", tmp_path / "AAA.csv")
+    shutil.copy("data/volatile_prices.csv", tmp_path / "BBB.csv")
+    (tmp_path / "BAD.csv").write_text("Date,Open\nnot-a-date,1\n")
+
+    output = io.StringIO()
+    results = list(run_batch(
+        "sma_crossover",
+        str(tmp_path / "*.csv"),
+        strategy_params={"short_window": 5, "long_window": 20},
+        workers=2,
+        output=output,
+    ))
+
+    by_symbol = {result["Symbol"]: result for result in results}
+    assert set(by_symbol) == {"AAA", "BAD", "BBB"}
+    assert by_symbol["BAD"]["Error"] is not None
+    assert by_symbol["AAA"]["Error"] is None and by_symbol["AAA"]["Trades"] == 12
+
+    lines = output.getvalue().strip().splitlines()
+    assert lines[0].startswith("Symbol,Total Return")
+    assert len(lines) == 4
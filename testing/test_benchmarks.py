@@ -0,0 +1,64 @@
+"""
+Unit tests for the benchmark suite in benchmarks/
+"""
+
+import json
+
+import pandas as pd
+from benchmarks.run_benchmarks import STRATEGIES, find_regressions, main, run_suite
+from benchmarks.synthetic import generate_prices
+
+def test_synthetic_prices_are_reproducible():
+    """Test that the same seed always generates the same bars."""
+    first = generate_prices(1000, seed=3)
+    second = generate_prices(1000, seed=3)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert len(first) == 1000
+    assert (first['Close'] > 0).all()
+    assert not first.equals(generate_prices(1000, seed=4))
+
+def test_run_suite_times_every_stage(tmp_path):
+    """Test that loading, construction, backtest and metrics are timed separately for each strategy."""
+    rows = run_suite(sizes=[1000], repeat=1, data_dir=str(tmp_path))
+    cases = {row["case"] for row in rows}
+
+    assert {"1000/load:csv", "1000/load:binary"} <= cases
+    for name in STRATEGIES:
+        assert {f"1000/construct:{name}", f"1000/backtest:{name}:vectorized", f"1000/metrics:{name}"} <= cases
+    assert all(row["bars_per_sec"] > 0 and row["peak_mb"] >= 0 for row in rows)
+
+def test_find_regressions_applies_margin_and_noise_floor():
+    """Test that only slowdowns beyond both the margin and the noise floor are reported."""
+    rows = [
+        {"case": "slow", "seconds": 1.0},
+        {"case": "within_margin", "seconds": 1.4},
+        {"case": "noise", "seconds": 0.003},
+        {"case": "unknown", "seconds": 9.0},
+    ]
+    baseline = {"slow": 0.1, "within_margin": 1.0, "noise": 0.001}
+
+    regressions = find_regressions(rows, baseline, margin=0.5)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("slow:")
+
+def test_main_fails_when_baseline_is_exceeded(tmp_path, monkeypatch):
+    """Test that the command-line run exits with status 1 when a stage is slower than its baseline."""
+    import benchmarks.run_benchmarks as run_benchmarks
+    monkeypatch.setattr(run_benchmarks, "NOISE_FLOOR", 0.0)
+
+    baseline_path = tmp_path / "baseline.json"
+    argv = ["--sizes", "1000", "--strategies", "momentum", "--repeat", "1", "--data-dir", str(tmp_path), "--baseline", str(baseline_path)]
+
+    assert main(["--update-baseline"] + argv) == 0
+    assert "1000/metrics:momentum" in json.loads(baseline_path.read_text())
+
+    baseline_path.write_text(json.dumps({"1000/load:csv": 1e-9}))
+    assert main(argv) == 1
+
+def test_controller_import_defers_yfinance_and_strategies():
+    """Test that importing the controller loads neither yfinance nor any strategy module."""
+    from benchmarks.startup import eagerly_loaded
+
+    assert eagerly_loaded("app.controller") == []
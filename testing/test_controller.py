@@ -39,4 +39,39 @@ def test_controller_run_backtest_and_metrics(monkeypatch):
     assert isinstance(metrics, dict)
     assert "Total Return" in metrics
     assert "Sharpe Ratio" in metrics
-    assert "Max Drawdown" in metrics
\ No newline at end of file
+    assert "Max Drawdown" in metrics
+
+def test_controller_run_sweep_is_deterministic_across_worker_counts():
+    """Test that a parameter sweep returns the same table in-process and on a process pool."""
+    controller = Controller(source="csv")
+    param_grid = {"short_window": [3, 5, 10], "long_window": [20, 30]}
+
+    serial = controller.run_sweep("sma_crossover", param_grid, source_path="data/sample_prices.csv", workers=1)
+    parallel = controller.run_sweep("sma_crossover", param_grid, source_path="data/sample_prices.csv", workers=2)
+
+    assert len(serial) == 6
+    assert list(serial[["short_window", "long_window"]].itertuples(index=False, name=None)) == [
+        (3, 20), (3, 30), (5, 20), (5, 30), (10, 20), (10, 30)
+    ]
+    assert {"Total Return", "Sharpe Ratio", "Max Drawdown", "Trades"} <= set(serial.columns)
+    pd.testing.assert_frame_equal(serial, parallel)
+
+    # Each row matches a standalone run with the same parameters
+    _, metrics, trades = controller.run_backtest(
+        source_path="data/sample_prices.csv",
+        strategy_name="sma_crossover",
+        strategy_params={"short_window": 5, "long_window": 30},
+    )
+    assert serial.loc[3, "Trades"] == trades
+    assert serial.loc[3, "Sharpe Ratio"] == metrics["Sharpe Ratio"]
+
+def test_strategy_registry_resolves_names_lazily():
+    """Test that registered names resolve to their classes and unknown names are rejected."""
+    import app.strategies as strategies
+    from app.strategies.momentum import MomentumStrategy
+
+    assert strategies.strategy_names() == ["sma_crossover", "rsi_threshold", "golden_cross", "momentum"]
+    assert strategies.get_strategy_class("momentum") is MomentumStrategy
+    assert strategies.MomentumStrategy is MomentumStrategy
+    with pytest.raises(ValueError, match="Unknown strategy name"):
+        Controller(source="csv")._get_strategy_class("breakout")
@@ -2,9 +2,12 @@
 Unit tests for the DataHandler class in data_handler.py
 """
 
+import numpy as np
 import pandas as pd
 import pytest
+from app.controller import Controller
 from app.data_handler import DataHandler
+from app.streaming import StreamingBacktester, create_streaming_strategy
 
 def test_datahandler_fetch_data(monkeypatch):
     """Test that DataHandler fetches dummy data correctly."""
@@ -24,4 +27,103 @@ def test_datahandler_fetch_data(monkeypatch):
     df = handler.fetch_data()
 
     assert isinstance(df, pd.DataFrame)
-    assert "Close" in df.columns
\ No newline at end of file
+    assert "Close" in df.columns
+
+def _write_minute_csv(path, rows=3000):
+    """Writes a synthetic minute-bar CSV with gaps and returns its Close series."""
+    rng = np.random.default_rng(7)
+    index = pd.date_range("2024-01-02 09:30", periods=rows, freq="min")
+    index = index[rng.random(rows) > 0.2]
+    close = pd.Series(100 + rng.standard_normal(len(index)).cumsum(), index=pd.DatetimeIndex(index, name="Date"), name="Close")
+    close.to_frame().assign(Volume=1).to_csv(path)
+    return close
+
+def test_chunked_csv_read_matches_full_read(tmp_path):
+    """Test that reading a CSV in small chunks returns the same data as a full read."""
+    path = str(tmp_path / "minutes.csv")
+    _write_minute_csv(path)
+
+    full = DataHandler(source="csv")
+    full.load_data(path)
+    chunked = DataHandler(source="csv", chunksize=97)
+    chunked.load_data(path)
+
+    pd.testing.assert_frame_equal(chunked.fetch_data(), full.fetch_data()[["Close"]], check_freq=False)
+
+@pytest.mark.parametrize("rule", ["5min", "1h", "1D"])
+def test_resampled_chunks_match_full_resample(tmp_path, rule):
+    """Test that buckets split across chunk boundaries are resampled as if read whole."""
+    path = str(tmp_path / "minutes.csv")
+    _write_minute_csv(path)
+    close = pd.read_csv(path, parse_dates=["Date"], index_col="Date")["Close"]
+    expected = close.groupby(close.index.floor(rule)).last()
+
+    chunks = list(DataHandler(source="csv").iter_csv_chunks(path, chunksize=61, resample=rule))
+    resampled = pd.concat(chunks)["Close"]
+
+    assert all(len(chunk) <= 61 for chunk in chunks)
+    assert resampled.index.equals(expected.index)
+    assert np.array_equal(resampled.to_numpy(), expected.to_numpy())
+
+def test_csv_bars_feed_streaming_backtester(tmp_path):
+    """Test that streamed resampled bars produce the same equity as a batch backtest."""
+    path = str(tmp_path / "minutes.csv")
+    _write_minute_csv(path)
+
+    controller = Controller(source="csv", chunksize=250, resample="5min")
+    batch_curve, _, _ = controller.run_backtest(source_path=path, strategy_name="momentum", strategy_params={"roc_period": 3})
+
+    backtester = StreamingBacktester(create_streaming_strategy("momentum", {"roc_period": 3}))
+    streamed = [equity for _, equity in backtester.run(DataHandler(source="csv").iter_csv_bars(path, chunksize=250, resample="5min"))]
+
+    assert np.allclose(streamed, batch_curve['Portfolio Value'].to_numpy())
+
+@pytest.mark.parametrize("chunksize", [None, 7, 100])
+def test_date_window_keeps_warmup_bars(chunksize):
+    """Test that a date-limited load keeps the requested range plus the warm-up bars before it."""
+    full = pd.read_csv("data/sample_prices.csv", parse_dates=["Date"], index_col="Date")[["Close"]]
+    start_date, end_date = full.index[100], full.index[180]
+
+    handler = DataHandler(source="csv", chunksize=chunksize)
+    handler.load_data("data/sample_prices.csv", start_date=start_date, end_date=end_date, warmup=30)
+
+    pd.testing.assert_frame_equal(handler.fetch_data(), full.iloc[70:181], check_freq=False)
+
+@pytest.mark.parametrize("chunksize", [None, 50])
+def test_window_before_the_data_loads_an_empty_frame(chunksize):
+    """Test that a window ending before the first bar loads an empty frame instead of failing to concatenate."""
+    handler = DataHandler(source="csv", chunksize=chunksize)
+    handler.load_data("data/sample_prices.csv", end_date="1990-01-01")
+
+    data = handler.fetch_data()
+    assert data.empty and list(data.columns) == ["Close"]
+    with pytest.raises(ValueError, match="Not enough data"):
+        Controller(source="csv").backtest_data(data, "sma_crossover", {"short_window": 5, "long_window": 20})
+
+def test_binary_window_matches_csv_window():
+    """Test that a date-limited binary load slices the mapped store to the same rows as a CSV load."""
+    start_date, end_date = "2024-05-01", "2024-08-01"
+    csv = DataHandler(source="csv")
+    csv.load_data("data/sample_prices.csv", start_date=start_date, end_date=end_date, warmup=10)
+    binary = DataHandler(source="binary")
+    binary.load_data("data/sample_prices.csv", start_date=start_date, end_date=end_date, warmup=10)
+
+    pd.testing.assert_frame_equal(binary.fetch_data(), csv.fetch_data(), check_freq=False)
+
+def test_run_backtest_from_start_date_loads_only_lookback_history():
+    """Test that a dated run starts its equity curve on start_date with indicators already warmed up."""
+    controller = Controller(source="csv")
+    params = {"short_window": 5, "long_window": 20}
+    full = DataHandler(source="csv")
+    full.load_data("data/sample_prices.csv")
+    data = full.fetch_data()
+
+    curve, metrics, trades = controller.run_backtest(
+        source_path="data/sample_prices.csv", strategy_name="sma_crossover", strategy_params=params,
+        start_date=data.index[120], end_date=data.index[200],
+    )
+    expected, expected_metrics, expected_trades = controller.backtest_data(data.iloc[:201], "sma_crossover", params, start=120)
+
+    assert len(controller.data_handler.fetch_data()) == 20 + 81
+    pd.testing.assert_frame_equal(curve, expected, check_freq=False)
+    assert metrics == expected_metrics and trades == expected_trades
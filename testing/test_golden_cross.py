@@ -16,7 +16,6 @@ def test_golden_cross_buy_and_sell_signals():
     strategy.data['sma_200'] = [None] * 199 + [90, 90] + [90] * 99
 
     # Golden cross at index 200 (prev: 90 < 92, now 91 > 91)
-    buy_row = strategy.data.iloc[200]
 
     # Death cross at index 250 (simulate similarly)
     strategy.data.loc[249, 'sma_50'] = 91
@@ -24,7 +23,31 @@ def test_golden_cross_buy_and_sell_signals():
     strategy.data.loc[250, 'sma_50'] = 89
     strategy.data.loc[250, 'sma_200'] = 90
 
+    # Crossover events are precomputed, so refresh them after overriding the SMAs
+    strategy._calculate_crossovers()
+
+    buy_row = strategy.data.iloc[200]
     sell_row = strategy.data.iloc[250]
 
     assert strategy.should_buy(buy_row)
-    assert strategy.should_sell(sell_row)
\ No newline at end of file
+    assert strategy.should_sell(sell_row)
+
+def test_golden_cross_generate_signals_match_row_hooks():
+    """Test that array-level signals agree with should_buy/should_sell on every row."""
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+
+    strategy = GoldenCrossStrategy(data)
+    buy, sell = strategy.generate_signals()
+
+    rows = [row for _, row in strategy.data.iterrows()]
+    assert list(buy) == [bool(strategy.should_buy(row)) for row in rows]
+    assert list(sell) == [bool(strategy.should_sell(row)) for row in rows]
+
+def test_golden_cross_lookback_covers_warmup():
+    """Test that the declared lookback ends on the first bar with the 200-day SMA on it and the bar before."""
+    data = pd.read_csv("data/sample_prices.csv", parse_dates=["Date"], index_col="Date")
+    strategy = GoldenCrossStrategy(data)
+
+    assert strategy.lookback == GoldenCrossStrategy.required_lookback() == 200
+    assert strategy.data['sma_200'].iloc[:199].isna().all()
+    assert strategy.data['sma_200'].iloc[199:].notna().all()
@@ -0,0 +1,69 @@
+"""
+Unit tests for the IndicatorCache class in indicators.py
+"""
+
+import pandas as pd
+import pytest
+from app.controller import Controller
+from app.indicators import IndicatorCache, indicator_cache
+from app.strategies import get_strategy_class, strategy_names
+from app.strategies.golden_cross import GoldenCrossStrategy
+from app.strategies.sma_crossover import SMACrossoverStrategy
+
+def test_indicator_cache_reuses_series_across_strategies():
+    """Test that overlapping SMA requests are served from the cache and match pandas."""
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+    cache = IndicatorCache()
+
+    SMACrossoverStrategy(data, short_window=50, long_window=200, indicator_cache=cache)
+    golden = GoldenCrossStrategy(data, indicator_cache=cache)
+
+    assert cache.misses == 2
+    assert cache.hits == 2
+    pd.testing.assert_series_equal(
+        golden.data['sma_200'], data['Close'].rolling(window=200).mean(), check_names=False
+    )
+
+@pytest.mark.parametrize("strategy_name", strategy_names())
+def test_every_strategy_keeps_its_indicator_cache(strategy_name):
+    """Test that each strategy stores the cache it was given, or the shared cache by default."""
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+    cache = IndicatorCache()
+    strategy_class = get_strategy_class(strategy_name)
+
+    assert strategy_class(data, indicator_cache=cache).indicator_cache is cache
+    assert cache.misses > 0
+    assert strategy_class(data).indicator_cache is indicator_cache
+
+def test_indicator_cache_evicts_least_recently_used():
+    """Test that the memory cap evicts the least recently used entry first."""
+    close = pd.Series([float(value) for value in range(100)])
+    cache = IndicatorCache(max_bytes=2 * close.nbytes)
+
+    cache.sma(close, 5)
+    cache.sma(close, 10)
+    cache.sma(close, 5)   # refresh window 5 so window 10 becomes least recently used
+    cache.sma(close, 20)  # exceeds the cap and evicts window 10
+
+    assert cache.evictions == 1
+    assert cache.current_bytes <= cache.max_bytes
+
+    cache.sma(close, 5)
+    cache.sma(close, 10)
+    assert cache.stats() == {"entries": 2, "bytes": 2 * close.nbytes, "hits": 2, "misses": 4, "evictions": 2}
+
+@pytest.mark.parametrize("strategy_name", strategy_names())
+def test_strategies_backtest_tz_aware_dates(tmp_path, strategy_name):
+    """Test that a CSV with UTC-offset dates backtests like the same prices with naive dates."""
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+    aware = data.tz_localize("UTC")
+    aware.to_csv(tmp_path / "aware.csv")
+
+    controller = Controller(source="csv")
+    curve, metrics, trades = controller.run_backtest(source_path=str(tmp_path / "aware.csv"), strategy_name=strategy_name)
+    expected, expected_metrics, expected_trades = controller.run_backtest(source_path="data/volatile_prices.csv", strategy_name=strategy_name)
+
+    assert str(curve.index.tz) == "UTC"
+    assert IndicatorCache.fingerprint(aware['Close']) != IndicatorCache.fingerprint(aware['Close'].tz_convert("America/New_York"))
+    assert curve['Portfolio Value'].tolist() == expected['Portfolio Value'].tolist()
+    assert metrics == expected_metrics and trades == expected_trades
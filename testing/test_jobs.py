@@ -0,0 +1,109 @@
+"""
+Unit tests for headless job files in jobs.py and main.run_job_file
+"""
+
+import json
+
+import pytest
+from app.controller import Controller
+from app.jobs import load_jobs, plan_tasks, run_jobs
+from app.results_store import ResultsStore
+
+JOB_TOML = """
+[defaults]
+initial_cash = 50000.0
+
+[[jobs]]
+source = "csv"
+path = "data/sample_prices.csv"
+strategy = "sma_crossover"
+params = { short_window = 5, long_window = 20 }
+
+[[jobs]]
+source = "csv"
+path = "data/sample_prices.csv"
+strategy = "momentum"
+params = { roc_period = 5 }
+
+[[jobs]]
+source = "csv"
+path = "data/volatile_prices.csv"
+strategy = "rsi_threshold"
+initial_cash = 10000.0
+
+[[jobs]]
+source = "csv"
+path = "data/missing.csv"
+strategy = "momentum"
+fallback_csv = "data/sample_prices.csv"
+
+[[jobs]]
+source = "csv"
+path = "data/missing.csv"
+strategy = "momentum"
+"""
+
+@pytest.fixture
+def job_file(tmp_path):
+    path = tmp_path / "jobs.toml"
+    path.write_text(JOB_TOML)
+    return str(path)
+
+def test_load_jobs_applies_defaults_and_validates(job_file, tmp_path):
+    """Test that TOML and JSON job files load with defaults, and invalid jobs are rejected."""
+    jobs = load_jobs(job_file)
+
+    assert len(jobs) == 5
+    assert jobs[0]["initial_cash"] == 50000.0 and jobs[2]["initial_cash"] == 10000.0
+    assert jobs[2]["params"] == {} and jobs[0]["engine"] == "vectorized"
+
+    json_path = tmp_path / "jobs.json"
+    json_path.write_text(json.dumps([{"path": "data/sample_prices.csv", "strategy": "momentum"}]))
+    assert load_jobs(str(json_path))[0]["source"] == "csv"
+
+    json_path.write_text(json.dumps({"jobs": [{"source": "yahoo", "strategy": "momentum"}]}))
+    with pytest.raises(ValueError, match="ticker"):
+        load_jobs(str(json_path))
+
+def test_jobs_sharing_a_source_are_grouped(job_file):
+    """Test that jobs reading the same data are planned into one task per worker share."""
+    jobs = load_jobs(job_file)
+
+    tasks = plan_tasks(jobs, workers=1)
+    assert [(path, [index for index, _ in members]) for _, path, members in tasks] == [
+        ("data/sample_prices.csv", [0, 1]),
+        ("data/volatile_prices.csv", [2]),
+        ("data/missing.csv", [3, 4]),
+    ]
+    assert len(plan_tasks(jobs, workers=6)) == 5
+
+def test_run_jobs_matches_controller_and_uses_explicit_fallback(job_file):
+    """Test job results against direct Controller runs, with fallback only where a job asks for it."""
+    jobs = load_jobs(job_file)
+    results = {result["index"]: result for result in run_jobs(jobs, workers=2)}
+
+    _, expected_metrics, expected_trades = Controller(source="csv").run_backtest(
+        source_path="data/sample_prices.csv", strategy_name="sma_crossover",
+        strategy_params={"short_window": 5, "long_window": 20}, initial_cash=50000.0,
+    )
+    assert results[0]["metrics"] == expected_metrics and results[0]["trades"] == expected_trades
+
+    assert results[3]["error"] is None and results[3]["used_fallback"]
+    assert results[3]["source_name"] == "sample_prices"
+    assert results[4]["error"].startswith("FileNotFoundError")
+
+def test_run_job_file_writes_results_without_prompts(job_file, tmp_path, monkeypatch):
+    """Test that a job file run records results and per-run CSVs and reports failures."""
+    import builtins
+    from main import run_job_file
+    monkeypatch.setattr(builtins, "input", lambda *args: pytest.fail("headless mode must not prompt"))
+
+    output_dir = str(tmp_path / "out")
+    failures = run_job_file(job_file, workers=1, output_dir=output_dir)
+
+    with ResultsStore(f"{output_dir}/results.db") as store:
+        stored = store.connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    assert failures == 1
+    assert stored == 4
+    assert len(list((tmp_path / "out").glob("*_job*.csv"))) == 4
@@ -18,4 +18,24 @@ def test_momentum_buy_and_sell_signals():
     sell_row = strategy.data.iloc[5]
 
     assert strategy.should_buy(buy_row)
-    assert strategy.should_sell(sell_row)
\ No newline at end of file
+    assert strategy.should_sell(sell_row)
+
+def test_momentum_generate_signals_match_row_hooks():
+    """Test that array-level signals agree with should_buy/should_sell on every row."""
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+
+    strategy = MomentumStrategy(data, roc_period=5, roc_threshold=0.01)
+    buy, sell = strategy.generate_signals()
+
+    rows = [row for _, row in strategy.data.iterrows()]
+    assert list(buy) == [bool(strategy.should_buy(row)) for row in rows]
+    assert list(sell) == [bool(strategy.should_sell(row)) for row in rows]
+
+def test_momentum_lookback_covers_warmup():
+    """Test that the declared lookback equals the number of leading bars without a rate of change."""
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+    strategy = MomentumStrategy(data, roc_period=5)
+
+    assert strategy.lookback == MomentumStrategy.required_lookback(roc_period=5) == 5
+    assert strategy.data['ROC'].iloc[:5].isna().all()
+    assert strategy.data['ROC'].iloc[5:].notna().all()
@@ -0,0 +1,89 @@
+"""
+Unit tests for successive-halving parameter search in optimizer.py and Controller
+"""
+
+import math
+
+import pandas as pd
+import pytest
+from app.controller import Controller
+from app.optimizer import halving_schedule, rank_scores, sample_candidates
+
+SMA_GRID = {"short_window": [3, 5, 8, 10, 15], "long_window": [20, 30, 40, 60]}
+
+def _final_value(curve):
+    """Scores a run by its ending portfolio value."""
+    return curve["Portfolio Value"].iloc[-1]
+
+def test_halving_schedule_shrinks_candidates_and_grows_bars():
+    """Test that each rung keeps 1/eta of the candidates on eta times more bars, ending on the full history."""
+    assert halving_schedule(27, 810, eta=3) == [(30, 27), (90, 9), (270, 3), (810, 1)]
+    assert halving_schedule(30, 1000, eta=3, min_bars=100) == [(100, 30), (111, 10), (333, 4), (1000, 2)]
+    assert halving_schedule(2, 500, eta=3) == [(500, 2)]
+    with pytest.raises(ValueError):
+        halving_schedule(10, 100, eta=1)
+
+def test_rank_scores_orders_best_first_with_unscored_last():
+    """Test ranking for maximized and minimized scores, with NaN last and ties kept in order."""
+    scores = [0.5, math.nan, 1.5, 0.5, -1.0]
+
+    assert rank_scores(scores).tolist() == [2, 0, 3, 4, 1]
+    assert rank_scores(scores, minimize=True).tolist() == [4, 0, 3, 2, 1]
+
+def test_sample_candidates_is_seeded():
+    """Test that sampling is reproducible per seed and keeps grid order."""
+    combinations = [{"x": x} for x in range(50)]
+
+    first = sample_candidates(combinations, 10, seed=7)
+    assert first == sample_candidates(combinations, 10, seed=7)
+    assert first != sample_candidates(combinations, 10, seed=8)
+    assert [c["x"] for c in first] == sorted(c["x"] for c in first)
+    assert sample_candidates(combinations, None) == combinations
+
+def test_successive_halving_is_reproducible_and_cheaper_than_the_grid():
+    """Test that a seeded search repeats exactly, ends on the full history and scores fewer bars than the grid."""
+    controller = Controller(source="csv")
+    kwargs = dict(strategy_name="sma_crossover", param_grid=SMA_GRID, source_path="data/sample_prices.csv", n_candidates=18, seed=3, workers=1)
+
+    best, metrics, history = controller.run_successive_halving(**kwargs)
+    again = controller.run_successive_halving(**kwargs)
+
+    assert best == again[0] and metrics == again[1]
+    pd.testing.assert_frame_equal(history, again[2])
+
+    last = history[history["Rung"] == history["Rung"].max()]
+    assert (last["Bars"] == 250).all()
+    assert history["Bars"].sum() < 18 * 250
+
+    # Reported metrics are those of an ordinary full-history backtest of the winner
+    _, expected, _ = controller.backtest_data(controller.data_handler.fetch_data(), "sma_crossover", best)
+    assert metrics == expected
+
+def test_single_rung_matches_full_grid_sweep():
+    """Test that with eta above the candidate count the search reduces to a full grid sweep."""
+    controller = Controller(source="csv")
+    sweep = controller.run_sweep("momentum", {"roc_period": [3, 5, 10, 20]}, source_path="data/volatile_prices.csv", workers=1)
+
+    best, metrics, history = controller.run_successive_halving(
+        "momentum", {"roc_period": [3, 5, 10, 20]}, source_path="data/volatile_prices.csv",
+        metric="Max Drawdown", minimize=True, eta=5, workers=1,
+    )
+
+    assert best["roc_period"] == sweep.loc[sweep["Max Drawdown"].idxmin(), "roc_period"]
+    assert history["Rung"].nunique() == 1
+
+def test_callable_objective_on_worker_pool():
+    """Test a custom objective evaluated on a process pool."""
+    controller = Controller(source="csv")
+
+    best, metrics, history = controller.run_successive_halving(
+        "sma_crossover", SMA_GRID, source_path="data/sample_prices.csv", metric=_final_value, seed=1, workers=2,
+    )
+    pooled = controller.run_successive_halving(
+        "sma_crossover", SMA_GRID, source_path="data/sample_prices.csv", metric=_final_value, seed=1, workers=1,
+    )
+
+    assert best == pooled[0]
+    pd.testing.assert_frame_equal(history, pooled[2])
+    with pytest.raises(ValueError, match="Unknown metric"):
+        controller.run_successive_halving("sma_crossover", SMA_GRID, source_path="data/sample_prices.csv", metric="Sortino")
@@ -0,0 +1,106 @@
+"""
+Unit tests for the PortfolioBacktester class in portfolio.py
+"""
+
+import numpy as np
+import pandas as pd
+from app.backtester import Backtester
+from app.controller import Controller
+from app.portfolio import PortfolioBacktester
+from app.strategies import SMACrossoverStrategy, RSIThresholdStrategy, MomentumStrategy
+
+def _load_panel():
+    """Builds a two-ticker panel from the sample CSV files."""
+    return Controller(source="csv").data_handler.load_panel(["data/sample_prices.csv", "data/volatile_prices.csv"])
+
+def test_panel_signals_match_single_asset_signals():
+    """Test that panel signals equal each ticker's single-asset generate_signals()."""
+    panel = _load_panel()
+
+    for strategy, params in [
+        (SMACrossoverStrategy, {"short_window": 5, "long_window": 20}),
+        (RSIThresholdStrategy, {"buy_threshold": 35, "sell_threshold": 65}),
+        (MomentumStrategy, {"roc_period": 5, "roc_threshold": 0.01}),
+    ]:
+        buy, sell = strategy.generate_panel_signals(panel, **params)
+
+        for column_idx, ticker in enumerate(panel.columns):
+            close = panel[[ticker]].dropna().rename(columns={ticker: "Close"})
+            rows = panel.index.get_indexer(close.index)
+
+            single_buy, single_sell = strategy(close, **params).generate_signals()
+            assert np.array_equal(buy[rows, column_idx], single_buy)
+            assert np.array_equal(sell[rows, column_idx], single_sell)
+
+def test_single_column_portfolio_matches_backtester():
+    """Test that a one-ticker panel reproduces the single-asset vectorized backtest."""
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+    params = {"short_window": 5, "long_window": 20}
+
+    single = Backtester(data, SMACrossoverStrategy(data, **params), initial_cash=1000.0, engine="vectorized")
+    single_curve = single.run_backtest()
+
+    portfolio = PortfolioBacktester(data[["Close"]], SMACrossoverStrategy, params, initial_cash=1000.0)
+    equity_curve, asset_values = portfolio.run_backtest()
+
+    assert np.array_equal(equity_curve['Portfolio Value'].to_numpy(), single_curve['Portfolio Value'].to_numpy())
+    assert portfolio.trades_executed == single.trades_executed
+    assert list(asset_values.columns) == ["Close"]
+
+def test_portfolio_shares_one_cash_account():
+    """Test that buys across tickers draw on the same cash and are filled in column order."""
+    dates = pd.date_range(start="2022-01-01", periods=4)
+    prices = pd.DataFrame({"AAA": [60.0, 61.0, 62.0, 63.0], "BBB": [50.0, 50.0, np.nan, 55.0]}, index=dates)
+
+    class AlwaysBuyFirstDay:
+        @classmethod
+        def generate_panel_signals(cls, prices):
+            buy = np.zeros(prices.shape, dtype=bool)
+            buy[0] = True
+            sell = np.zeros(prices.shape, dtype=bool)
+            sell[3] = True
+            return buy, sell
+
+    portfolio = PortfolioBacktester(prices, AlwaysBuyFirstDay, initial_cash=100.0)
+    equity_curve, asset_values = portfolio.run_backtest()
+
+    # Only AAA fits in the cash on day one; BBB's missing bar keeps its last value
+    assert portfolio.positions[0].tolist() == [1, 0]
+    assert asset_values.loc[dates[2], "AAA"] == 62.0
+    assert portfolio.trades_executed == 2
+    assert portfolio.cash == 103.0
+    assert equity_curve['Portfolio Value'].tolist() == [100.0, 101.0, 102.0, 103.0]
+
+def test_unaffordable_column_does_not_block_later_buys():
+    """Test that a ticker the cash cannot cover is skipped while later affordable tickers are still bought."""
+    dates = pd.date_range(start="2022-01-01", periods=2)
+    prices = pd.DataFrame({"EXP": [500.0, 500.0], "CHEAP": [10.0, 10.0], "MID": [95.0, 95.0]}, index=dates)
+
+    class AlwaysBuyFirstDay:
+        @classmethod
+        def generate_panel_signals(cls, prices):
+            buy = np.zeros(prices.shape, dtype=bool)
+            buy[0] = True
+            return buy, np.zeros(prices.shape, dtype=bool)
+
+    portfolio = PortfolioBacktester(prices, AlwaysBuyFirstDay, initial_cash=100.0)
+    portfolio.run_backtest()
+
+    # EXP never fits, CHEAP is bought, and MID no longer fits in the remaining 90
+    assert portfolio.positions[0].tolist() == [0, 1, 0]
+    assert portfolio.cash == 90.0
+    assert portfolio.trades_executed == 1
+
+def test_controller_run_portfolio_backtest():
+    """Test that Controller loads a CSV panel and returns aggregate and per-asset curves."""
+    controller = Controller(source="csv")
+    equity_curve, asset_values, metrics, trades = controller.run_portfolio_backtest(
+        source_paths=["data/sample_prices.csv", "data/volatile_prices.csv"],
+        strategy_name="momentum",
+        strategy_params={"roc_period": 10, "roc_threshold": 0.02},
+    )
+
+    assert list(asset_values.columns) == ["sample_prices", "volatile_prices"]
+    assert len(equity_curve) == len(asset_values)
+    assert "Sharpe Ratio" in metrics
+    assert trades > 0
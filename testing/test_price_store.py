@@ -0,0 +1,90 @@
+"""
+Unit tests for the binary price store in price_store.py
+"""
+
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from app import price_store
+from app.data_handler import DataHandler, select_window
+
+def test_binary_source_matches_csv_and_is_memory_mapped(tmp_path):
+    """Test that the binary source returns the CSV's data from a memory-mapped store."""
+    csv_path = str(tmp_path / "prices.csv")
+    shutil.copy("data/sample_prices.csv", csv_path)
+
+    csv_data = DataHandler(source="csv").fetch_csv_data(csv_path)
+
+    handler = DataHandler(source="binary")
+    handler.load_data(csv_path)
+    binary_data = handler.fetch_data()
+
+    assert os.path.isdir(price_store.store_path_for(csv_path))
+    pd.testing.assert_frame_equal(binary_data, csv_data, check_freq=False)
+    assert isinstance(binary_data['Close'].to_numpy().base, np.memmap)
+
+def test_store_is_rebuilt_when_csv_changes(tmp_path):
+    """Test that a store is rebuilt after the source CSV's modification time changes."""
+    csv_path = str(tmp_path / "prices.csv")
+    pd.DataFrame({"Date": ["2024-01-01", "2024-01-02"], "Close": [1.0, 2.0]}).to_csv(csv_path, index=False)
+
+    store_path = price_store.ensure_store(csv_path)
+    assert not price_store.is_stale(store_path, csv_path)
+
+    pd.DataFrame({"Date": ["2024-01-01", "2024-01-02", "2024-01-03"], "Close": [1.0, 2.0, 3.0]}).to_csv(csv_path, index=False)
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert price_store.is_stale(store_path, csv_path)
+    data = DataHandler(source="binary").fetch_binary_data(csv_path)
+    assert data['Close'].tolist() == [1.0, 2.0, 3.0]
+
+def test_tz_aware_dates_round_trip_through_a_mapped_store(tmp_path):
+    """Test that tz-aware dates are stored as mappable UTC values and restored in their time zone."""
+    csv_path = str(tmp_path / "prices.csv")
+    csv_data = pd.read_csv("data/sample_prices.csv", parse_dates=["Date"], index_col="Date").tz_localize("UTC")
+    csv_data.to_csv(csv_path)
+
+    binary_data = price_store.load_store(price_store.ensure_store(csv_path))
+    pd.testing.assert_frame_equal(binary_data, DataHandler(source="csv").fetch_csv_data(csv_path), check_freq=False)
+    assert isinstance(binary_data['Close'].to_numpy().base, np.memmap)
+
+    # Windows given as naive dates are read in the store's time zone
+    local = csv_data.tz_convert("America/New_York")
+    price_store.write_store(local, str(tmp_path / "local.npystore"))
+    window = price_store.load_store(str(tmp_path / "local.npystore"), start_date="2024-03-05", end_date="2024-03-20", warmup=2)
+    pd.testing.assert_frame_equal(window, select_window(local, "2024-03-05", "2024-03-20", warmup=2), check_freq=False)
+    assert str(window.index.tz) == "America/New_York"
+
+def _ensure_and_sum(csv_path):
+    """Builds (or reuses) the store in a worker process and sums its closing prices."""
+    return float(price_store.load_store(price_store.ensure_store(csv_path))["Close"].sum())
+
+def test_concurrent_builds_of_one_store_do_not_collide(tmp_path):
+    """Test that processes converting the same CSV at once all get a complete store and leave no temp files."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    csv_path = str(tmp_path / "prices.csv")
+    shutil.copy("data/sample_prices.csv", csv_path)
+    expected = float(pd.read_csv(csv_path)["Close"].sum())
+
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        sums = list(executor.map(_ensure_and_sum, [csv_path] * 8))
+
+    assert sums == [expected] * 8
+    assert sorted(os.listdir(tmp_path)) == ["prices.csv", "prices.npystore"]
+    assert sorted(os.listdir(tmp_path / "prices.npystore")) == ["Close.npy", "Date.npy", "meta.json"]
+
+def test_stale_build_lock_is_broken(tmp_path):
+    """Test that a lock left by a crashed build does not block later builds forever."""
+    csv_path = str(tmp_path / "prices.csv")
+    shutil.copy("data/sample_prices.csv", csv_path)
+    lock_path = price_store.store_path_for(csv_path) + ".lock"
+    open(lock_path, "w").close()
+    os.utime(lock_path, (0, 0))
+
+    store_path = price_store.ensure_store(csv_path)
+
+    assert not price_store.is_stale(store_path, csv_path)
+    assert not os.path.exists(lock_path)
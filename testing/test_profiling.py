@@ -0,0 +1,56 @@
+"""
+Unit tests for the run instrumentation in profiling.py
+"""
+
+import json
+import tracemalloc
+
+import pandas as pd
+from app.controller import Controller
+from app.profiling import Profiler
+
+def test_run_backtest_profile_records_phases_and_hook_calls():
+    """Test that a profiled run reports every phase and counts each should_buy/should_sell call."""
+    controller = Controller(source="csv")
+
+    equity_curve, metrics, trades, profile = controller.run_backtest(
+        source_path="data/sample_prices.csv", strategy_name="sma_crossover",
+        strategy_params={"short_window": 5, "long_window": 20}, profile=True,
+    )
+    report = json.loads(profile.to_json())
+
+    assert set(report["phases"]) == {"load_data", "strategy_init", "backtest", "metrics", "total"}
+    for phase in report["phases"].values():
+        assert phase["wall_seconds"] >= 0 and phase["cpu_seconds"] >= 0 and phase["peak_alloc_bytes"] >= 0
+    assert report["phases"]["strategy_init"]["peak_alloc_bytes"] > 0
+
+    # Every row after the 20-bar warm-up asks should_buy; should_sell only when no buy signal fired
+    assert report["calls"]["should_buy"]["count"] == len(equity_curve) - 20
+    assert 0 < report["calls"]["should_sell"]["count"] <= len(equity_curve)
+    assert not tracemalloc.is_tracing()
+
+def test_profiled_run_matches_unprofiled_run():
+    """Test that instrumentation does not change results, and disabled runs return the usual tuple."""
+    controller = Controller(source="csv")
+    kwargs = dict(source_path="data/volatile_prices.csv", strategy_name="momentum", strategy_params={"roc_period": 5}, engine="vectorized")
+
+    plain = controller.run_backtest(**kwargs)
+    profiled = controller.run_backtest(profile=True, **kwargs)
+
+    assert len(plain) == 3
+    pd.testing.assert_frame_equal(plain[0], profiled[0])
+    assert plain[1] == profiled[1] and plain[2] == profiled[2]
+    assert profiled[3].calls["generate_signals"]["count"] == 1
+
+def test_profiler_to_json_writes_file(tmp_path):
+    """Test that a profile can be exported to a JSON file."""
+    with Profiler(trace_memory=False) as profiler:
+        with profiler.phase("work"):
+            sum(range(1000))
+
+    path = tmp_path / "profile.json"
+    profiler.to_json(str(path))
+
+    report = json.loads(path.read_text())
+    assert report["phases"]["work"]["peak_alloc_bytes"] == 0
+    assert report["phases"]["total"]["wall_seconds"] >= report["phases"]["work"]["wall_seconds"]
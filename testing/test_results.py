@@ -2,8 +2,10 @@
 Unit tests for the Results class in results.py
 """
 
+import numpy as np
 import pandas as pd
-from app.results import Results
+import pytest
+from app.results import Results, ResultsAccumulator
 
 def test_results_calculate_performance_metrics():
     """Test that Results calculates key performance metrics correctly."""
@@ -22,4 +24,85 @@ def test_results_calculate_performance_metrics():
     assert "Max Drawdown" in metrics
     assert isinstance(metrics["Total Return"], float)
     assert isinstance(metrics["Sharpe Ratio"], float)
-    assert isinstance(metrics["Max Drawdown"], float)
\ No newline at end of file
+    assert isinstance(metrics["Max Drawdown"], float)
+
+def _random_equity(seed: int, periods: int = 300):
+    """Builds a reproducible random-walk equity curve."""
+    returns = np.random.default_rng(seed).normal(0.0003, 0.015, periods)
+    return (10000 * np.exp(returns.cumsum())).tolist()
+
+def test_results_accumulator_matches_batch_metrics():
+    """Test that streaming metrics match the batch calculation to floating-point tolerance."""
+    values = _random_equity(seed=7)
+    expected = Results(portfolio=pd.DataFrame({"Portfolio Value": values})).calculate_performance_metrics()
+
+    accumulator = ResultsAccumulator()
+    for value in values:
+        accumulator.update(value)
+
+    for metric, value in accumulator.calculate_performance_metrics().items():
+        assert abs(value - expected[metric]) < 1e-12
+
+def test_results_accumulator_merges_chunks():
+    """Test that merged chunk accumulators equal one accumulator over the whole curve."""
+    values = _random_equity(seed=11)
+    expected = Results(portfolio=pd.DataFrame({"Portfolio Value": values})).calculate_performance_metrics()
+
+    chunks = [values[:40], values[40:41], values[41:180], values[180:]]
+    accumulators = []
+    for chunk in chunks:
+        accumulator = ResultsAccumulator()
+        accumulator.update_many(chunk)
+        accumulators.append(accumulator)
+
+    # Merge out of left-to-right order to mimic results arriving from parallel workers
+    merged = accumulators[0].merge(accumulators[1].merge(accumulators[2])).merge(accumulators[3])
+
+    for metric, value in merged.calculate_performance_metrics().items():
+        assert abs(value - expected[metric]) < 1e-12
+
+def test_numpy_metrics_match_pandas_formulas():
+    """Test that the NumPy metrics kernel reproduces the original pandas calculations."""
+    portfolio = pd.DataFrame({"Portfolio Value": _random_equity(seed=3, periods=1000)})
+    values = portfolio["Portfolio Value"]
+    returns = values.pct_change().dropna()
+
+    metrics = Results(portfolio).calculate_performance_metrics()
+
+    assert abs(metrics["Total Return"] - (values.iloc[-1] / values.iloc[0] - 1)) < 1e-12
+    assert abs(metrics["Volatility"] - returns.std() * (252 ** 0.5)) < 1e-12
+    assert abs(metrics["Sharpe Ratio"] - returns.mean() / returns.std() * (252 ** 0.5)) < 1e-12
+    assert abs(metrics["Max Drawdown"] - ((values.cummax() - values) / values.cummax()).max()) < 1e-12
+
+def test_rolling_metrics_match_pandas_rolling():
+    """Test that cumulative-sum rolling metrics equal pandas rolling windows."""
+    portfolio = pd.DataFrame({"Portfolio Value": _random_equity(seed=5, periods=600)}, index=pd.date_range("2020-01-01", periods=600))
+    returns = portfolio["Portfolio Value"].pct_change()
+
+    rolling = Results(portfolio).rolling_metrics(window=21)
+
+    assert rolling.index.equals(portfolio.index)
+    assert rolling.iloc[:21].isna().all().all()
+    np.testing.assert_allclose(rolling["Rolling Return"], portfolio["Portfolio Value"].pct_change(21), rtol=1e-10)
+    np.testing.assert_allclose(rolling["Rolling Volatility"], returns.rolling(21).std() * (252 ** 0.5), rtol=1e-9)
+    np.testing.assert_allclose(rolling["Rolling Sharpe"], returns.rolling(21).mean() / returns.rolling(21).std() * (252 ** 0.5), rtol=1e-8, atol=1e-10)
+
+def test_drawdown_duration_and_recovery():
+    """Test drawdown depth, duration and time to recovery on a curve with a recovered and an open drawdown."""
+    portfolio = pd.DataFrame({"Portfolio Value": [100.0, 110.0, 99.0, 105.0, 110.0, 120.0, 90.0, 95.0]})
+    results = Results(portfolio)
+
+    series = results.drawdown_series()
+    periods = results.drawdown_periods()
+
+    assert series["Drawdown Duration"].tolist() == [0, 0, 1, 2, 0, 0, 1, 2]
+    assert np.allclose(series["Drawdown"], [0, 0, 0.1, 1 - 105 / 110, 0, 0, 0.25, 1 - 95 / 120])
+
+    assert periods["Depth"].tolist() == pytest.approx([0.25, 0.1])
+    assert periods["Peak"].tolist() == [5, 1]
+    assert periods["Trough"].tolist() == [6, 2]
+    assert periods["Recovered"].tolist() == [False, True]
+    assert periods["Duration"].tolist() == [2, 3]
+    assert periods.loc[1, "Recovery"] == 4 and periods.loc[1, "Time to Recovery"] == 2
+    assert np.isnan(periods.loc[0, "Time to Recovery"])
+    assert Results(pd.DataFrame({"Portfolio Value": [1.0, 2.0, 3.0]})).drawdown_periods().empty
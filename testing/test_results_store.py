@@ -0,0 +1,93 @@
+"""
+Unit tests for the ResultsStore class in results_store.py
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pytest
+from app.controller import Controller
+from app.results_store import ResultsStore, performance_report
+
+def _write_runs(args):
+    """Adds a batch of runs to the store from a separate process."""
+    path, worker = args
+    with ResultsStore(path) as store:
+        store.add_runs([
+            {"strategy": "momentum", "params": {"roc_period": worker, "roc_threshold": i / 100}, "metrics": {"Sharpe Ratio": worker + i / 100}, "trades": i}
+            for i in range(50)
+        ])
+
+def test_export_csv_matches_per_run_layout(tmp_path):
+    """Test that exported runs reproduce the metrics-plus-equity-curve CSV written by main.py."""
+    controller = Controller(source="csv")
+    equity_curve, metrics, trades = controller.run_backtest(source_path="data/sample_prices.csv", strategy_name="momentum", strategy_params={"roc_period": 5})
+
+    expected_path = tmp_path / "expected.csv"
+    performance_report(metrics, equity_curve).to_csv(expected_path)
+
+    with ResultsStore(str(tmp_path / "results.db")) as store:
+        run_id = store.add_run("momentum", {"roc_period": 5}, metrics, trades, equity_curve, source="csv", source_name="sample_prices")
+        exported_path = store.export_csv(run_id, str(tmp_path / "exported.csv"))
+        run = store.get_run(run_id)
+
+    assert open(exported_path).read() == expected_path.read_text()
+    assert run["params"] == {"roc_period": 5}
+    assert run["trades"] == trades and run["source_name"] == "sample_prices"
+
+def test_tz_aware_equity_curve_round_trips(tmp_path):
+    """Test that an equity curve with a tz-aware index is stored and restored with its time zone."""
+    dates = pd.date_range("2024-03-08 16:00", periods=5, freq="D", tz="America/New_York", name="Date")
+    equity_curve = pd.DataFrame({'Portfolio Value': [100.0, 101.5, 99.0, 102.25, 103.0]}, index=dates)
+
+    with ResultsStore(str(tmp_path / "results.db")) as store:
+        run_id = store.add_run("momentum", {"roc_period": 5}, {"Sharpe Ratio": 1.0}, equity_curve=equity_curve)
+        restored = store.equity_curve(run_id)
+
+    pd.testing.assert_frame_equal(restored, equity_curve, check_freq=False)
+
+def test_top_ranks_and_filters_by_parameters(tmp_path):
+    """Test that top() ranks by the chosen metric and honours parameter filters."""
+    with ResultsStore(str(tmp_path / "results.db")) as store:
+        store.add_runs([
+            {"strategy": "sma_crossover", "params": {"short_window": s, "long_window": 50}, "metrics": {"Sharpe Ratio": s / 10, "Max Drawdown": 1 / s}}
+            for s in range(1, 31)
+        ] + [{"strategy": "momentum", "params": {"roc_period": 5}, "metrics": {"Sharpe Ratio": 99.0}}])
+
+        top = store.top("sma_crossover", n=3)
+        filtered = store.top("sma_crossover", params={"short_window": 7, "long_window": 50})
+        lowest_drawdown = store.top("sma_crossover", metric="Max Drawdown", n=1, ascending=True)
+
+        plan = " ".join(str(row) for row in store.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM runs WHERE strategy = ? AND sharpe_ratio IS NOT NULL ORDER BY sharpe_ratio DESC LIMIT 20", ("sma_crossover",)))
+
+    assert top["short_window"].tolist() == [30, 29, 28]
+    assert filtered["short_window"].tolist() == [7]
+    assert lowest_drawdown["short_window"].tolist() == [30]
+    assert "idx_runs_strategy_sharpe_ratio" in plan
+    with pytest.raises(ValueError):
+        ResultsStore(":memory:").top("sma_crossover", metric="Profit")
+
+def test_parallel_writers_store_every_run(tmp_path):
+    """Test that batched inserts from several processes all land in the database."""
+    path = str(tmp_path / "results.db")
+    ResultsStore(path).close()
+
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_write_runs, [(path, worker) for worker in range(4)]))
+
+    with ResultsStore(path) as store:
+        assert store.connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 200
+        assert store.connection.execute("SELECT COUNT(*) FROM run_params").fetchone()[0] == 400
+        assert store.top("momentum", n=1)["Sharpe Ratio"].iloc[0] == pytest.approx(3.49)
+
+def test_run_sweep_records_every_combination(tmp_path):
+    """Test that a sweep can write all of its results to the store in one batch."""
+    controller = Controller(source="csv")
+    with ResultsStore(str(tmp_path / "results.db")) as store:
+        sweep = controller.run_sweep("momentum", {"roc_period": [3, 5, 10]}, source_path="data/sample_prices.csv", workers=1, store=store)
+        best = store.top("momentum", n=1)
+
+    assert len(sweep) == 3
+    assert best["Sharpe Ratio"].iloc[0] == sweep["Sharpe Ratio"].max()
+    assert best["source_name"].iloc[0] == "sample_prices"
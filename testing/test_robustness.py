@@ -0,0 +1,60 @@
+"""
+Unit tests for the Monte Carlo robustness analysis in robustness.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from app.results import Results
+from app.robustness import block_bootstrap_indices, path_metrics, simulate_metrics
+
+@pytest.fixture
+def equity_curve():
+    rng = np.random.default_rng(5)
+    values = 100000 * np.cumprod(1 + rng.normal(0.0005, 0.01, 500))
+    return pd.DataFrame({'Portfolio Value': values}, index=pd.date_range("2020-01-01", periods=500, name="Date"))
+
+def test_path_metrics_match_results(equity_curve):
+    """Test that the 2-D metric kernel agrees with Results on a single path."""
+    values = equity_curve['Portfolio Value'].to_numpy()
+    metrics = path_metrics((values[1:] / values[:-1] - 1)[None, :])
+    expected = Results(equity_curve).calculate_performance_metrics()
+
+    for name in ("Total Return", "Sharpe Ratio", "Max Drawdown"):
+        assert metrics[name][0] == pytest.approx(expected[name], rel=1e-9)
+
+def test_block_bootstrap_indices_wrap_around():
+    """Test that blocks are runs of consecutive returns wrapping past the end."""
+    indices = block_bootstrap_indices(np.array([[8, 2, 5]]), n_returns=10, block_size=4)
+
+    assert indices.tolist() == [[8, 9, 0, 1, 2, 3, 4, 5, 5, 6]]
+
+def test_permutation_preserves_return_and_sharpe(equity_curve):
+    """Test that reordering returns leaves total return and Sharpe unchanged and only moves drawdown."""
+    values = equity_curve['Portfolio Value'].to_numpy()
+    samples = simulate_metrics(values[1:] / values[:-1] - 1, n_paths=200, method="permutation", seed=1)
+    expected = Results(equity_curve).calculate_performance_metrics()
+
+    assert np.allclose(samples["Total Return"], expected["Total Return"])
+    assert np.allclose(samples["Sharpe Ratio"], expected["Sharpe Ratio"])
+    assert samples["Max Drawdown"].std() > 0
+
+def test_bootstrap_is_reproducible_and_independent_of_chunking(equity_curve):
+    """Test that a seeded bootstrap gives the same paths whether run in one chunk or many."""
+    values = equity_curve['Portfolio Value'].to_numpy()
+    returns = values[1:] / values[:-1] - 1
+
+    whole = simulate_metrics(returns, n_paths=300, seed=7)
+    chunked = simulate_metrics(returns, n_paths=300, seed=7, max_bytes=len(returns) * 8 * 4 * 16)
+
+    pd.testing.assert_frame_equal(whole, chunked)
+
+def test_calculate_robustness_reports_intervals(equity_curve):
+    """Test that the report brackets the median with the confidence bounds for every metric."""
+    report = Results(equity_curve).calculate_robustness(n_paths=2000, seed=3)
+
+    assert list(report.index) == ["Total Return", "Sharpe Ratio", "Max Drawdown"]
+    assert (report["Lower"] <= report["Median"]).all() and (report["Median"] <= report["Upper"]).all()
+    assert report.loc["Total Return", "Lower"] < report.loc["Total Return", "Observed"] < report.loc["Total Return", "Upper"]
+    with pytest.raises(ValueError):
+        Results(equity_curve).calculate_robustness(method="jackknife")
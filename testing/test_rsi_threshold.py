@@ -19,4 +19,24 @@ def test_rsi_threshold_buy_and_sell_signals():
 
     # Assertions
     assert strategy.should_buy(buy_row)
-    assert strategy.should_sell(sell_row)
\ No newline at end of file
+    assert strategy.should_sell(sell_row)
+
+def test_rsi_threshold_generate_signals_match_row_hooks():
+    """Test that array-level signals agree with should_buy/should_sell on every row."""
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+
+    strategy = RSIThresholdStrategy(data, buy_threshold=30, sell_threshold=70)
+    buy, sell = strategy.generate_signals()
+
+    rows = [row for _, row in strategy.data.iterrows()]
+    assert list(buy) == [bool(strategy.should_buy(row)) for row in rows]
+    assert list(sell) == [bool(strategy.should_sell(row)) for row in rows]
+
+def test_rsi_lookback_covers_warmup():
+    """Test that the declared lookback equals the number of leading bars without an RSI."""
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+    strategy = RSIThresholdStrategy(data)
+
+    assert strategy.lookback == RSIThresholdStrategy.required_lookback() == 14
+    assert strategy.data['RSI'].iloc[:14].isna().all()
+    assert strategy.data['RSI'].iloc[14:].notna().all()
@@ -0,0 +1,64 @@
+"""
+Unit tests for the shared-memory price sharing in shared_data.py
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+import pytest
+from app.controller import Controller
+from app.shared_data import SharedPrices, attach_prices, detach_prices
+
+def _prices(tz=None):
+    """Builds a small price frame with a named date index."""
+    index = pd.date_range("2024-01-01", periods=50, freq="h", tz=tz, name="Date")
+    return pd.DataFrame({"Close": np.linspace(100.0, 120.0, 50)}, index=index)
+
+def _worker_sum(handle):
+    """Attaches in a worker process and sums the closing prices."""
+    return float(attach_prices(handle)["Close"].sum())
+
+def _worker_crash(handle):
+    """Attaches in a worker process and dies without cleaning up."""
+    attach_prices(handle)
+    os._exit(1)
+
+@pytest.mark.parametrize("tz", [None, "America/New_York"])
+def test_attached_prices_match_and_are_read_only(tz):
+    """Test that attached data equals the original and cannot be modified."""
+    data = _prices(tz)
+
+    with SharedPrices(data) as shared:
+        attached = attach_prices(shared.handle)
+
+        pd.testing.assert_frame_equal(attached, data, check_freq=False)
+        with pytest.raises(ValueError):
+            attached["Close"].to_numpy()[0] = 0.0
+
+        del attached
+        detach_prices(shared.handle)
+
+def test_segment_is_unlinked_after_run_and_worker_crash():
+    """Test that segments are removed when the run ends, even after a worker crashed."""
+    data = _prices()
+
+    with SharedPrices(data) as shared, ProcessPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(_worker_sum, shared.handle).result() == pytest.approx(data["Close"].sum())
+    with pytest.raises(FileNotFoundError):
+        attach_prices(shared.handle)
+
+    with pytest.raises(BrokenProcessPool):
+        with SharedPrices(data) as shared, ProcessPoolExecutor(max_workers=1) as executor:
+            executor.submit(_worker_crash, shared.handle).result()
+    with pytest.raises(FileNotFoundError):
+        attach_prices(shared.handle)
+
+def test_pooled_sweep_on_shared_prices_matches_in_process_sweep():
+    """Test that workers attached to shared prices produce the same results as an in-process sweep."""
+    controller = Controller(source="csv")
+    kwargs = dict(strategy_name="momentum", param_grid={"roc_period": [3, 5, 10]}, source_path="data/volatile_prices.csv")
+
+    pd.testing.assert_frame_equal(controller.run_sweep(workers=2, **kwargs), controller.run_sweep(workers=1, **kwargs))
@@ -27,7 +27,43 @@ def test_sma_crossover_buy_and_sell_signals():
     strategy.data.loc[strategy.data.index[3], 'short_sma'] = 12.0  # crosses above
     strategy.data.loc[strategy.data.index[3], 'long_sma'] = 11.5
 
+    # Crossover events are precomputed, so refresh them after overriding the SMAs
+    strategy._calculate_crossovers()
+
     row = strategy.data.iloc[3]
 
     assert strategy.should_buy(row)
-    assert not strategy.should_sell(row)
\ No newline at end of file
+    assert not strategy.should_sell(row)
+
+def test_sma_crossover_generate_signals_match_row_hooks():
+    """Test that array-level signals agree with should_buy/should_sell on every row."""
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+
+    strategy = SMACrossoverStrategy(data, short_window=5, long_window=20)
+    buy, sell = strategy.generate_signals()
+
+    rows = [row for _, row in strategy.data.iterrows()]
+    assert list(buy) == [bool(strategy.should_buy(row)) for row in rows]
+    assert list(sell) == [bool(strategy.should_sell(row)) for row in rows]
+    assert buy.any() and sell.any()
+
+
+def test_sma_crossover_handles_duplicate_timestamps():
+    """Test that crossover detection is positional and works with repeated index labels."""
+    dates = pd.to_datetime(["2022-01-03", "2022-01-03", "2022-01-04", "2022-01-04", "2022-01-05", "2022-01-05"])
+    data = pd.DataFrame({'Close': [10.0, 9.0, 8.0, 12.0, 14.0, 7.0]}, index=dates)
+
+    strategy = SMACrossoverStrategy(data, short_window=1, long_window=2)
+    buy, sell = strategy.generate_signals()
+
+    assert list(buy) == [False, False, False, True, False, False]
+    assert list(sell) == [False, False, False, False, False, True]
+
+def test_sma_crossover_lookback_covers_warmup():
+    """Test that the declared lookback ends on the first bar with both SMAs on it and the bar before."""
+    data = pd.read_csv("data/sample_prices.csv", parse_dates=["Date"], index_col="Date")
+    strategy = SMACrossoverStrategy(data, short_window=5, long_window=20)
+
+    assert strategy.lookback == SMACrossoverStrategy.required_lookback(short_window=5, long_window=20) == 20
+    assert strategy.data['long_sma'].iloc[:19].isna().all()
+    assert strategy.data['long_sma'].iloc[19:].notna().all()
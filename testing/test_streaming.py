@@ -0,0 +1,47 @@
+"""
+Unit tests for the streaming engine in streaming.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from app.controller import Controller
+from app.indicators import compute_rsi
+from app.streaming import (
+    RollingMean,
+    RelativeStrengthIndex,
+    StreamingBacktester,
+    create_streaming_strategy,
+    iter_bars,
+)
+
+def test_online_indicators_match_batch_indicators():
+    """Test that online SMA and RSI reproduce pandas rolling results exactly."""
+    close = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")['Close']
+
+    sma = RollingMean(20)
+    rsi = RelativeStrengthIndex()
+    streamed_sma = np.array([sma.update(price) for price in close])
+    streamed_rsi = np.array([rsi.update(price) for price in close])
+
+    assert np.array_equal(streamed_sma, close.rolling(window=20).mean().to_numpy(), equal_nan=True)
+    assert np.array_equal(streamed_rsi, compute_rsi(close).to_numpy(), equal_nan=True)
+
+@pytest.mark.parametrize("strategy_name, params", [
+    ("sma_crossover", {"short_window": 5, "long_window": 20}),
+    ("rsi_threshold", {"buy_threshold": 35, "sell_threshold": 65}),
+    ("golden_cross", {}),
+    ("momentum", {"roc_period": 5, "roc_threshold": 0.01}),
+])
+def test_streaming_backtest_matches_batch(strategy_name, params):
+    """Test that streaming equity and trade counts equal the batch backtest on historical data."""
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+
+    batch_curve, _, batch_trades = Controller(source="csv").backtest_data(data, strategy_name, params)
+
+    backtester = StreamingBacktester(create_streaming_strategy(strategy_name, params))
+    streamed = list(backtester.run(iter_bars(data)))
+
+    assert [date for date, _ in streamed] == list(batch_curve.index)
+    assert [equity for _, equity in streamed] == batch_curve['Portfolio Value'].tolist()
+    assert backtester.trades_executed == batch_trades
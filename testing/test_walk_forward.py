@@ -0,0 +1,98 @@
+"""
+Unit tests for walk-forward optimization in walk_forward.py and Controller.run_walk_forward
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from app.controller import Controller
+from app.walk_forward import split_windows, stitch_equity
+
+def test_split_windows_rolling_and_anchored():
+    """Test that rolling windows keep a fixed length, anchored ones grow, and the last test window is shortened."""
+    rolling = split_windows(10, train_size=4, test_size=3)
+    anchored = split_windows(10, train_size=4, test_size=3, anchored=True)
+
+    assert rolling == [(slice(0, 4), slice(4, 7)), (slice(3, 7), slice(7, 10))]
+    assert anchored == [(slice(0, 4), slice(4, 7)), (slice(0, 7), slice(7, 10))]
+    assert split_windows(3, train_size=4, test_size=3) == []
+
+def test_overlapping_test_windows_are_rejected():
+    """Test that a step shorter than the test window is refused instead of stitching repeated dates."""
+    with pytest.raises(ValueError, match="step"):
+        split_windows(200, train_size=60, test_size=40, step=20)
+    with pytest.raises(ValueError, match="step"):
+        Controller(source="csv").run_walk_forward("momentum", {"roc_period": [5]}, source_path="data/sample_prices.csv", train_size=60, test_size=40, step=20, workers=1)
+
+    # A longer step leaves gaps between test windows but keeps the stitched dates in order
+    curve, _, _ = Controller(source="csv").run_walk_forward("momentum", {"roc_period": [5]}, source_path="data/sample_prices.csv", train_size=60, test_size=40, step=50, workers=1)
+    assert curve.index.is_unique and curve.index.is_monotonic_increasing
+
+def test_window_slices_do_not_copy_data():
+    """Test that applying a window slice gives a view of the loaded prices."""
+    data = pd.read_csv("data/sample_prices.csv", parse_dates=["Date"], index_col="Date")
+    train, _ = split_windows(len(data), train_size=100, test_size=50)[1]
+
+    assert np.shares_memory(data.iloc[train]['Close'].to_numpy(), data['Close'].to_numpy())
+
+def test_stitch_equity_compounds_folds():
+    """Test that each fold's curve continues from the previous fold's ending value."""
+    first = pd.DataFrame({'Portfolio Value': [100.0, 110.0]}, index=pd.to_datetime(["2024-01-01", "2024-01-02"]))
+    second = pd.DataFrame({'Portfolio Value': [100.0, 90.0]}, index=pd.to_datetime(["2024-01-03", "2024-01-04"]))
+
+    stitched = stitch_equity([first, second], initial_cash=100.0)
+
+    assert np.allclose(stitched['Portfolio Value'], [100.0, 110.0, 110.0, 99.0])
+
+@pytest.mark.parametrize("anchored", [False, True])
+def test_walk_forward_parallel_matches_serial(anchored):
+    """Test that folds run on a process pool give the same result as running them in-process."""
+    controller = Controller(source="csv")
+    grid = {"roc_period": [3, 5, 10], "roc_threshold": [0.0, 0.02]}
+    kwargs = dict(source_path="data/volatile_prices.csv", train_size=120, test_size=40, anchored=anchored)
+
+    serial_curve, serial_folds, serial_metrics = controller.run_walk_forward("momentum", grid, workers=1, **kwargs)
+    parallel_curve, parallel_folds, parallel_metrics = controller.run_walk_forward("momentum", grid, workers=2, **kwargs)
+
+    pd.testing.assert_frame_equal(serial_curve, parallel_curve)
+    pd.testing.assert_frame_equal(serial_folds, parallel_folds)
+    assert serial_metrics == parallel_metrics
+    assert len(serial_curve) == 260 - 120
+    assert len(serial_folds) == 4
+
+def test_walk_forward_fold_uses_training_choice_out_of_sample():
+    """Test that a fold's test run trades the training window's best parameters with warmed-up indicators."""
+    controller = Controller(source="csv")
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+    grid = {"short_window": [5, 10], "long_window": [20, 30]}
+
+    curve, folds, _ = controller.run_walk_forward("sma_crossover", grid, source_path="data/volatile_prices.csv", train_size=150, test_size=110, workers=1)
+
+    sweep = pd.DataFrame([
+        {**params, "Sharpe Ratio": controller.backtest_data(data.iloc[:150], "sma_crossover", params)[1]["Sharpe Ratio"]}
+        for params in ({"short_window": s, "long_window": l} for s in grid["short_window"] for l in grid["long_window"])
+    ])
+    best = sweep.loc[sweep["Sharpe Ratio"].idxmax()]
+    params = {"short_window": int(best["short_window"]), "long_window": int(best["long_window"])}
+
+    expected, _, _ = controller.backtest_data(data, "sma_crossover", params, start=150)
+
+    assert folds.loc[0, "short_window"] == params["short_window"]
+    assert folds.loc[0, "long_window"] == params["long_window"]
+    assert np.allclose(curve['Portfolio Value'].to_numpy(), expected['Portfolio Value'].to_numpy())
+
+def test_walk_forward_minimize_picks_lowest_training_score():
+    """Test that a minimized metric chooses the combination with the lowest training score on each fold."""
+    controller = Controller(source="csv")
+    data = pd.read_csv("data/volatile_prices.csv", parse_dates=["Date"], index_col="Date")
+    grid = {"roc_period": [3, 5, 10, 20]}
+
+    _, folds, _ = controller.run_walk_forward(
+        "momentum", grid, source_path="data/volatile_prices.csv", train_size=120, test_size=70,
+        metric="Max Drawdown", minimize=True, workers=1,
+    )
+
+    for fold, (start, stop) in zip(folds.itertuples(), [(0, 120), (70, 190)]):
+        drawdowns = {period: controller.backtest_data(data.iloc[start:stop], "momentum", {"roc_period": period})[1]["Max Drawdown"] for period in grid["roc_period"]}
+        assert fold.roc_period == min(drawdowns, key=drawdowns.get)
+        assert folds.loc[fold.Index, "Train Max Drawdown"] == min(drawdowns.values())
@@ -0,0 +1,101 @@
+"""
+Unit tests for the YahooCache class in yahoo_cache.py
+"""
+
+import pandas as pd
+import pytest
+from app.data_handler import DataHandler
+from app.yahoo_cache import YahooCache, warmup_start
+
+class FakeDownloader:
+    """Serves bars from an in-memory history and records every request."""
+
+    def __init__(self, history: pd.DataFrame):
+        self.history = history
+        self.calls = []
+
+    def __call__(self, ticker, start=None):
+        self.calls.append((ticker, start))
+        if start is None:
+            return self.history
+        return self.history[self.history.index >= start]
+
+def _history(periods: int) -> pd.DataFrame:
+    dates = pd.date_range(start="2024-01-01", periods=periods, name="Date")
+    return pd.DataFrame({"Close": [100.0 + day for day in range(periods)]}, index=dates)
+
+def test_yahoo_cache_downloads_once_then_tops_up(tmp_path):
+    """Test that the cache downloads full history once and later fetches only new bars."""
+    downloader = FakeDownloader(_history(5))
+    cache = YahooCache(str(tmp_path), max_staleness=pd.Timedelta(days=1), downloader=downloader)
+
+    first = cache.get("aapl")
+    assert len(first) == 5
+    assert downloader.calls == [("aapl", None)]
+
+    # Within the staleness limit the cache is served without downloading
+    cache.get("aapl")
+    assert len(downloader.calls) == 1
+
+    # Once stale, only bars after the last cached date are requested and appended
+    downloader.history = _history(8)
+    cache.max_staleness = pd.Timedelta(0)
+    topped_up = cache.get("aapl")
+
+    assert downloader.calls[-1] == ("aapl", pd.Timestamp("2024-01-06"))
+    assert topped_up['Close'].tolist() == [100.0 + day for day in range(8)]
+
+def test_yahoo_cache_offline_mode(tmp_path):
+    """Test that offline mode serves cached data and never calls the downloader."""
+    downloader = FakeDownloader(_history(3))
+    YahooCache(str(tmp_path), downloader=downloader).get("MSFT")
+
+    offline = YahooCache(str(tmp_path), offline=True, downloader=downloader)
+    handler = DataHandler(source="yahoo", yahoo_cache=offline)
+    handler.load_data("MSFT")
+
+    assert len(handler.fetch_data()) == 3
+    assert len(downloader.calls) == 1
+    with pytest.raises(ValueError):
+        offline.get("TSLA")
+
+def test_yahoo_cache_serves_only_the_requested_window(tmp_path):
+    """Test that a date-limited load through the cache returns the window plus its warm-up bars."""
+    downloader = FakeDownloader(_history(30))
+    handler = DataHandler(source="yahoo", yahoo_cache=YahooCache(str(tmp_path), downloader=downloader))
+    handler.load_data("AAPL", start_date="2024-01-11", end_date="2024-01-20", warmup=5)
+
+    data = handler.fetch_data()
+    assert data.index[0] == pd.Timestamp("2024-01-06") and data.index[-1] == pd.Timestamp("2024-01-20")
+    assert data['Close'].tolist() == [100.0 + day for day in range(5, 20)]
+    assert downloader.calls == [("AAPL", None)]
+
+def test_yahoo_cache_backfills_history_before_the_cache(tmp_path):
+    """Test that a window reaching before the cached bars downloads the earlier history once and merges it."""
+    full = _history(60)
+    downloader = FakeDownloader(full.iloc[40:])
+    cache = YahooCache(str(tmp_path), downloader=downloader)
+    cache.get("AAPL")
+
+    # Only the last 20 bars are cached; the window needs 5 bars before 2024-01-21
+    downloader.history = full
+    data = cache.get("AAPL", start_date="2024-01-21", end_date="2024-01-25", warmup=5)
+
+    assert downloader.calls[-1] == ("AAPL", warmup_start("2024-01-21", 5))
+    assert data.index[0] == pd.Timestamp("2024-01-16") and data.index[-1] == pd.Timestamp("2024-01-25")
+    pd.testing.assert_frame_equal(cache.get("AAPL"), full.loc[warmup_start("2024-01-21", 5):], check_freq=False)
+
+    # The backfilled range is remembered, even though no bars exist before the first one
+    cache.get("AAPL", start_date="2024-01-01", warmup=0)
+    calls = len(downloader.calls)
+    cache.get("AAPL", start_date="2024-01-01", warmup=0)
+    assert len(downloader.calls) == calls
+
+def test_yahoo_cache_offline_refuses_uncovered_window(tmp_path):
+    """Test that offline mode raises instead of silently truncating a window before the cached history."""
+    YahooCache(str(tmp_path), downloader=FakeDownloader(_history(10))).get("MSFT")
+    offline = YahooCache(str(tmp_path), offline=True)
+
+    assert len(offline.get("MSFT", start_date="2024-01-05", warmup=4)) == 10
+    with pytest.raises(ValueError, match="offline"):
+        offline.get("MSFT", start_date="2024-01-03", warmup=5)